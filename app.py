@@ -5,9 +5,12 @@ Start with:  python app.py   or   python start.py
 """
 from __future__ import annotations
 
+import functools
+import json
 import logging
 import os
 import sys
+import threading
 import time
 import traceback
 import uuid
@@ -38,9 +41,14 @@ MODELS_DIR.mkdir(exist_ok=True)
 
 ALLOWED_EXTENSIONS = {".csv", ".xlsx", ".xls"}
 MAX_UPLOAD_MB = int(os.getenv("MAX_UPLOAD_MB", "50"))
+SSE_KEEPALIVE_S = float(os.getenv("SSE_KEEPALIVE_S", "15"))
+# Each open event stream holds a waitress thread for the whole fit, so only a
+# quarter of WEB_THREADS may be streams; further clients poll GET /api/jobs/<id>.
+WEB_THREADS = int(os.getenv("WEB_THREADS", "8"))
+SSE_MAX_STREAMS = max(1, int(os.getenv("SSE_MAX_STREAMS", str(WEB_THREADS // 4))))
 
 # ── Flask ──────────────────────────────────────────────────────────────────────
-from flask import Flask, jsonify, request, send_file, send_from_directory
+from flask import Flask, Response, jsonify, request, send_file, send_from_directory
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
 
@@ -51,9 +59,55 @@ CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*")
 CORS(app, origins=CORS_ORIGINS)
 
 # ── Backend imports ────────────────────────────────────────────────────────────
-from backend.quantum_runner import list_execution_backends, rebuild_classifier, run_pipeline
+from backend.quantum_runner import (
+    list_execution_backends,
+    load_split,
+    rebuild_classifier,
+    split_key,
+)
+from backend.admission import (
+    ADMISSION_MAX_S,
+    ADMISSION_SYNC_MAX_S,
+    AdmissionRejected,
+    admit,
+    estimate_cost,
+)
 from backend.dataset_catalog import DATASET_CONFIGS
+from backend.fingerprint import spec_fingerprint
+from backend.job_queue import JOB_QUEUE
 from backend.pipeline_registry import ANSATZ_REGISTRY, ENCODER_REGISTRY, OPTIMIZER_REGISTRY
+from backend.result_cache import RESULT_CACHE, cache_bypassed
+from backend.scheduler import SCHEDULER, SchedulerBusy
+from backend.thread_budget import THREAD_BUDGET
+from backend.warmup import WARMUP
+
+SSE_STREAMS = threading.BoundedSemaphore(SSE_MAX_STREAMS)
+SCHEDULER_RETRY_AFTER_S = int(os.getenv("SCHEDULER_RETRY_AFTER_S", "5"))
+
+
+def _priority(cls: str):
+    """Run the decorated view inside a scheduler slot of priority class ``cls``."""
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            with SCHEDULER.slot(cls):
+                return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@app.errorhandler(AdmissionRejected)
+def admission_rejected(e):
+    logger.warning(f"admission rejected spec: {e}")
+    return jsonify({"status": "error", "error": str(e), "admission": e.estimate}), 422
+
+
+@app.errorhandler(SchedulerBusy)
+def scheduler_busy(e):
+    logger.warning(f"scheduler rejected request: {e}")
+    response = jsonify({"status": "error", "error": str(e), "scheduler": SCHEDULER.stats()})
+    response.headers["Retry-After"] = str(SCHEDULER_RETRY_AFTER_S)
+    return response, 503
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -79,7 +133,14 @@ def static_proxy(path):
 
 @app.route("/api/health", methods=["GET"])
 def health():
-    return jsonify({"status": "ok", "version": "2.0.0"})
+    """Liveness — always 200 while the process serves requests; includes warm-up state."""
+    return jsonify({"status": "ok", "version": "2.0.0", "ready": WARMUP.ready, "warmup": WARMUP.status()})
+
+
+@app.route("/api/ready", methods=["GET"])
+def ready():
+    """Readiness — 503 until the quantum stack has been warmed up."""
+    return jsonify(WARMUP.status()), 200 if WARMUP.ready else 503
 
 
 @app.route("/api/registry", methods=["GET"])
@@ -108,6 +169,24 @@ def get_backends():
     return jsonify(list_execution_backends())
 
 
+@app.route("/api/cache", methods=["GET"])
+def get_cache_stats():
+    """Result-cache size, hit/miss counters and evictions."""
+    return jsonify(RESULT_CACHE.stats())
+
+
+@app.route("/api/scheduler", methods=["GET"])
+def get_scheduler_stats():
+    """Per-priority-class slots, queue depth and wait percentiles, plus job-pool backlog."""
+    return jsonify({**SCHEDULER.stats(), "job_pool": JOB_QUEUE.stats()})
+
+
+@app.route("/api/threads", methods=["GET"])
+def get_thread_budget():
+    """Thread allocation per active run or prediction, with measured CPU utilisation."""
+    return jsonify(THREAD_BUDGET.stats())
+
+
 # ═════════════════════════════════════════════════════════════════════════════
 # API — Datasets
 # ═════════════════════════════════════════════════════════════════════════════
@@ -182,6 +261,7 @@ def upload():
 
 
 @app.route("/api/analyze", methods=["POST"])
+@_priority("interactive")
 def analyze():
     """Return missing-value counts and class-balance info for a mapped dataset."""
     import pandas as pd
@@ -243,13 +323,54 @@ def run():
         spec = request.get_json(force=True)
         if not spec:
             return jsonify({"status": "error", "error": "Empty request body"}), 400
-        result = run_pipeline(spec)
+        # A finished identical run is served from the result cache; identical
+        # concurrent specs on identical data share one training run.
+        run_key = _run_key(spec)
+        result = _cache_lookup(spec, run_key)
+        cache_hit = result is not None
+        if not cache_hit:
+            # Too expensive to wait for: return it as a background job instead
+            # (or reject it outright if it is over the job budget as well).
+            try:
+                _admission(spec, ADMISSION_SYNC_MAX_S)
+            except AdmissionRejected as slow:
+                est = slow.estimate
+                admission = _admission(spec, ADMISSION_MAX_S, shape=(est["n_rows"], est["n_features"]))
+                job = JOB_QUEUE.submit(spec, label=_spec_label(spec), key=run_key, priority="train")
+                logger.info(f"[{req_id}] estimated {est['estimated_seconds']}s — queued as job {job['job_id']}")
+                return jsonify({
+                    **job,
+                    "request_id": req_id,
+                    "status_url": f"/api/jobs/{job['job_id']}",
+                    "admission": admission,
+                    "message": (
+                        f"Estimated training cost {est['estimated_seconds']:.0f} s is over the "
+                        f"{ADMISSION_SYNC_MAX_S:.0f} s limit for synchronous runs; queued as a background job."
+                    ),
+                }), 202
+        if cache_hit:
+            callers, shared = 1, False
+        else:
+            # Within the synchronous budget: run it as a job all the same — on a
+            # job worker, coalesced with identical jobs — and wait for it here.
+            result, job = JOB_QUEUE.run(spec, label=_spec_label(spec), key=run_key, priority="train")
+            result = {**result, "job_id": job["job_id"]}
+            callers, shared = job["coalesced_callers"], job["coalesced"]
         elapsed = round(time.time() - t0, 2)
         result.setdefault("status", "ok")
+        result["cache"] = _cache_info(run_key, result, cache_hit)
         result["request_id"] = req_id
         result["execution_time_s"] = elapsed
-        logger.info(f"[{req_id}] done in {elapsed}s | acc={result.get('accuracy','?')}")
+        result["coalesced"] = shared
+        result["coalesced_callers"] = callers
+        logger.info(
+            f"[{req_id}] done in {elapsed}s | acc={result.get('accuracy','?')}"
+            + (" | cache hit" if cache_hit else "")
+            + (f" | shared run with {callers - 1} other caller(s)" if callers > 1 else "")
+        )
         return jsonify(result)
+    except (AdmissionRejected, SchedulerBusy):
+        raise
     except ValueError as e:
         logger.warning(f"[{req_id}] validation error: {e}")
         return jsonify({"status": "error", "request_id": req_id, "error": str(e)}), 400
@@ -264,10 +385,37 @@ def run():
         }), 500
 
 
+@app.route("/api/estimate", methods=["POST"])
+def estimate():
+    """Cost estimate for a spec without running it, with the budgets it is checked against."""
+    try:
+        spec = request.get_json(force=True)
+        if not isinstance(spec, dict) or not spec:
+            return jsonify({"status": "error", "error": "Expected a JSON pipeline spec object"}), 400
+        est = estimate_cost(spec)
+        shape = (est["n_rows"], est["n_features"])
+        budgets = {"sync_budget_s": ADMISSION_SYNC_MAX_S, "job_budget_s": ADMISSION_MAX_S}
+        for admitted, budget_s in (("sync", ADMISSION_SYNC_MAX_S), ("queued", ADMISSION_MAX_S)):
+            try:
+                return jsonify({**admit(spec, budget_s, shape=shape), **budgets, "admitted": admitted})
+            except AdmissionRejected as e:
+                rejection = e
+        return jsonify({**rejection.estimate, **budgets, "admitted": "rejected",
+                        "message": str(rejection)})
+    except (ValueError, FileNotFoundError) as e:
+        return jsonify({"status": "error", "error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"status": "error", "error": str(e), "trace": traceback.format_exc()}), 500
+
+
 @app.route("/api/run/batch", methods=["POST"])
 def run_batch():
-    """Run 2–4 pipeline configurations and return side-by-side results."""
+    """
+    Run 2–4 pipeline configurations in parallel and return side-by-side results.
+    Specs that share a dataset and split load it once and reuse the arrays.
+    """
     req_id = str(uuid.uuid4())[:8]
+    t0 = time.time()
     logger.info(f"[{req_id}] /api/run/batch start")
     try:
         specs = request.get_json(force=True)
@@ -275,23 +423,194 @@ def run_batch():
             return jsonify({"error": "Expected a JSON array of pipeline specs"}), 400
         if not (2 <= len(specs) <= 4):
             return jsonify({"error": "Provide 2–4 pipeline specs for comparison"}), 400
-        results = []
+
+        # Load each distinct dataset + split once in this process.
+        splits, load_errors, loaded = [], {}, {}
         for i, spec in enumerate(specs):
-            t0 = time.time()
             try:
-                r = run_pipeline(spec)
-                r["execution_time_s"] = round(time.time() - t0, 2)
-                results.append({"index": i, "status": "ok",
-                                 "label": _spec_label(spec), "result": r})
+                ds_spec = (spec or {}).get("dataset") or {}
+                if not ds_spec:
+                    raise ValueError("dataset configuration is required.")
+                key = split_key(ds_spec)
+                if key not in loaded:
+                    loaded[key] = load_split(ds_spec)
+                splits.append(loaded[key])
             except Exception as e:
+                splits.append(None)
+                load_errors[i] = str(e)
+
+        # Reject specs that are over the cost budget; the others still run.
+        for i, spec in enumerate(specs):
+            if i in load_errors:
+                continue
+            try:
+                X_train, X_test = splits[i][0], splits[i][1]
+                _admission(spec, ADMISSION_MAX_S, shape=(len(X_train) + len(X_test), X_train.shape[1]))
+            except AdmissionRejected as e:
+                load_errors[i] = str(e)
+
+        # Serve finished identical specs from the result cache; run the rest.
+        keys = [_run_key(spec) if i not in load_errors else None for i, spec in enumerate(specs)]
+        outcomes = {}
+        for i, key in enumerate(keys):
+            t_lookup = time.time()
+            cached = _cache_lookup(specs[i], key) if i not in load_errors else None
+            if cached is not None:
+                cached["cache"] = _cache_info(key, cached, True)
+                cached["execution_time_s"] = round(time.time() - t_lookup, 3)
+                outcomes[i] = {"status": "ok", "result": cached}
+        runnable = [i for i in range(len(specs)) if i not in load_errors and i not in outcomes]
+        if runnable:
+            with SCHEDULER.slot("batch"):
+                outcomes.update(zip(runnable, JOB_QUEUE.run_parallel(
+                    [specs[i] for i in runnable], [splits[i] for i in runnable],
+                    priority="batch",
+                )))
+        for i in runnable:
+            if outcomes[i]["status"] == "ok" and keys[i] is not None:
+                RESULT_CACHE.put(keys[i], outcomes[i]["result"])
+                outcomes[i]["result"]["cache"] = _cache_info(keys[i], outcomes[i]["result"], False)
+
+        results = []
+        for i, spec in enumerate(specs):
+            outcome = outcomes.get(i) or {"status": "error", "error": load_errors.get(i)}
+            if outcome["status"] == "ok":
+                r = outcome["result"]
+                results.append({"index": i, "status": "ok", "label": _spec_label(spec),
+                                "wall_time_s": r["execution_time_s"], "result": r})
+            else:
                 results.append({"index": i, "status": "error",
-                                 "label": _spec_label(spec), "error": str(e)})
-        return jsonify({"batch_results": results, "request_id": req_id})
+                                "label": _spec_label(spec), "error": outcome["error"]})
+
+        wall = round(time.time() - t0, 2)
+        sequential = round(sum(r.get("wall_time_s", 0.0) for r in results), 2)
+        # With no spec run there is nothing to compare the batch against.
+        ran = any(r["status"] == "ok" for r in results)
+        logger.info(f"[{req_id}] batch of {len(specs)} done in {wall}s (sequential {sequential}s)")
+        return jsonify({
+            "batch_results": results,
+            "request_id": req_id,
+            "wall_time_s": wall,
+            "sequential_time_s": sequential,
+            "speedup": round(sequential / wall, 2) if ran and wall > 0 else None,
+            "datasets_loaded": len(loaded),
+        })
+    except SchedulerBusy:
+        raise
     except Exception as e:
         return jsonify({"error": str(e), "trace": traceback.format_exc()}), 500
 
 
+# ═════════════════════════════════════════════════════════════════════════════
+# API — Asynchronous jobs
+# ═════════════════════════════════════════════════════════════════════════════
+
+@app.route("/api/jobs", methods=["POST"])
+def submit_job():
+    """Enqueue a pipeline spec for a worker process and return its job ID at once."""
+    try:
+        spec = request.get_json(force=True)
+        if not spec:
+            return jsonify({"status": "error", "error": "Empty request body"}), 400
+        if not isinstance(spec, dict):
+            return jsonify({"status": "error", "error": "Expected a JSON pipeline spec object"}), 400
+        run_key = _run_key(spec)
+        cached = _cache_lookup(spec, run_key)
+        if cached is not None:
+            cached["cache"] = _cache_info(run_key, cached, True)
+            job = JOB_QUEUE.add_finished(cached, label=_spec_label(spec))
+        else:
+            admission = _admission(spec, ADMISSION_MAX_S)
+            job = {**JOB_QUEUE.submit(spec, label=_spec_label(spec), key=run_key, priority="train"),
+                   "admission": admission}
+        return jsonify({**job, "status_url": f"/api/jobs/{job['job_id']}"}), 202
+    except AdmissionRejected:
+        raise
+    except Exception as e:
+        logger.error(f"/api/jobs error: {e}\n{traceback.format_exc()}")
+        return jsonify({"status": "error", "error": str(e)}), 500
+
+
+@app.route("/api/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    job = JOB_QUEUE.get(job_id)
+    if job is None:
+        return jsonify({"error": f"Job '{job_id}' not found or expired."}), 404
+    return jsonify(job)
+
+
+@app.route("/api/jobs/<job_id>", methods=["DELETE"])
+def cancel_job(job_id):
+    """
+    Cancel a job. A queued job is dropped; a running one stops at its next
+    objective evaluation and finishes with the best weights found so far.
+    A job shared by coalesced callers only stops when the last of them
+    cancels; earlier cancels detach their caller and get 409.
+    """
+    job = JOB_QUEUE.cancel(job_id)
+    if job is None:
+        return jsonify({"error": f"Job '{job_id}' not found or expired."}), 404
+    if job["finished_at"] is not None and not job["cancel_requested"]:
+        return jsonify({**job, "error": f"Job '{job_id}' has already finished."}), 409
+    if not job["cancel_requested"]:
+        return jsonify({**job, "error": f"Job '{job_id}' is shared with {job['coalesced_callers']} other "
+                                        "caller(s); it keeps running until the last one cancels."}), 409
+    return jsonify(job), 202
+
+
+@app.route("/api/jobs/<job_id>/events", methods=["GET"])
+def job_events(job_id):
+    """
+    Server-Sent Events stream of a job: one "progress" event per objective
+    evaluation (loss, iteration, elapsed time, ETA), then a final "result" or
+    "error" event. Reconnecting clients resume after their Last-Event-ID.
+    At most SSE_MAX_STREAMS streams are open at once; beyond that the request
+    gets 503 and the client should poll GET /api/jobs/<id>, which carries the
+    latest progress event.
+    """
+    if JOB_QUEUE.get(job_id) is None:
+        return jsonify({"error": f"Job '{job_id}' not found or expired."}), 404
+    if not SSE_STREAMS.acquire(blocking=False):
+        resp = jsonify({"error": "Too many open progress streams; poll the job instead.",
+                        "status_url": f"/api/jobs/{job_id}"})
+        resp.headers["Retry-After"] = "1"
+        return resp, 503
+    last_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    try:
+        cursor = int(last_id) + 1 if last_id is not None else 0
+    except ValueError:
+        cursor = 0
+
+    def stream(cursor=cursor):
+        yield "retry: 2000\n\n"
+        last_write = time.time()
+        while True:
+            batch = JOB_QUEUE.wait_events(job_id, cursor, timeout=SSE_KEEPALIVE_S)
+            if batch is None:
+                yield _sse({"type": "error", "error": "Job expired."}, "error")
+                return
+            events, finished = batch
+            for ev in events:
+                yield _sse(ev, ev["type"], ev["id"])
+                cursor = ev["id"] + 1
+                last_write = time.time()
+            if finished:
+                return
+            if time.time() - last_write >= SSE_KEEPALIVE_S:
+                yield ": keep-alive\n\n"
+                last_write = time.time()
+
+    response = Response(stream(), mimetype="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+    })
+    # The server closes the response when the stream ends or the client goes away.
+    response.call_on_close(SSE_STREAMS.release)
+    return response
+
+
 @app.route("/api/predict", methods=["POST"])
+@_priority("interactive")
 def predict():
     """Run predictions on new data using a previously trained model."""
     import joblib
@@ -313,9 +632,6 @@ def predict():
             return jsonify({"error": f"Model '{model_id}' not found. Run training first."}), 404
 
         saved = joblib.load(model_file)
-        # Rebuild VQC from saved weights + spec (the VQC object itself is not
-        # picklable because it contains a local closure — see quantum_runner.py)
-        classifier = rebuild_classifier(saved["weights"], saved["spec"])
         scaler = saved["scaler"]
         cols = feature_columns or saved.get("feature_columns", [])
         if not cols:
@@ -337,7 +653,11 @@ def predict():
         X = df[cols].astype(float).to_numpy()
         X_scaled = scaler.transform(X)
 
-        raw_preds = np.asarray(classifier.predict(X_scaled))
+        with THREAD_BUDGET.lease("predict") as lease:
+            # Rebuild VQC from saved weights + spec (the VQC object itself is not
+            # picklable because it contains a local closure — see quantum_runner.py)
+            classifier = rebuild_classifier(saved["weights"], saved["spec"], threads=lease.threads)
+            raw_preds = np.asarray(classifier.predict(X_scaled))
         # VQC may return one-hot arrays ([1,0] or [0,1]) for binary classification.
         # Collapse to a flat integer vector in either case.
         if raw_preds.ndim == 2:
@@ -406,6 +726,51 @@ def _col_stats(df, columns: list) -> dict:
     return stats
 
 
+def _run_key(spec: dict) -> str | None:
+    """Fingerprint used to coalesce identical runs; None if it cannot be computed."""
+    try:
+        return spec_fingerprint(spec)
+    except Exception:
+        # Unresolvable specs are not coalesced; run_pipeline reports the error.
+        return None
+
+
+def _admission(spec: dict, budget_s: float, shape: tuple | None = None) -> dict | None:
+    """
+    Cost estimate for ``spec``; raises AdmissionRejected when it is over ``budget_s``.
+    Returns None if the spec cannot be estimated — the run itself then reports why.
+    """
+    try:
+        return admit(spec, budget_s, shape=shape)
+    except AdmissionRejected:
+        raise
+    except Exception as e:
+        logger.debug(f"admission estimate skipped: {e}")
+        return None
+
+
+def _cache_lookup(spec: dict, run_key: str | None) -> dict | None:
+    if run_key is None:
+        return None
+    if cache_bypassed(spec):
+        RESULT_CACHE.note_bypass()
+        return None
+    return RESULT_CACHE.get(run_key)
+
+
+def _cache_info(run_key: str | None, result: dict, hit: bool) -> dict:
+    """
+    Cache block for responses. Call before execution_time_s is overwritten, so
+    training_time_s is the original run's duration (what a hit saved).
+    """
+    return {"hit": hit, "key": run_key, "training_time_s": result.get("execution_time_s")}
+
+
+def _sse(payload: dict, event: str, event_id: int | None = None) -> str:
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+
 def _spec_label(spec: dict) -> str:
     ds = spec.get("dataset", {}).get("name", "dataset")
     enc = spec.get("encoder", {}).get("type", "enc")
@@ -418,7 +783,19 @@ def _spec_label(spec: dict) -> str:
 # Entry point
 # ═════════════════════════════════════════════════════════════════════════════
 
+def create_app():
+    """
+    The app with its boot-time warm-up started (see backend.warmup). Servers
+    use it as the entry point — ``waitress-serve --call app:create_app`` — so
+    importing ``app`` (tests, the CI smoke import) starts no threads or
+    processes.
+    """
+    WARMUP.start()
+    return app
+
+
 if __name__ == "__main__":
+    create_app()
     port = int(os.getenv("PORT", 5000))
     debug = os.getenv("FLASK_DEBUG", "false").lower() == "true"
     logger.info(f"QML DataFlow Studio starting on http://localhost:{port}")
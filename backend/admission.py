@@ -0,0 +1,275 @@
+"""
+Cost-based admission control for pipeline specs.
+
+Before a spec is trained, estimate_cost() predicts its simulator cost from
+the qubit count, the feature-map and ansatz circuits (built with the same
+_build_feature_map / _build_ansatz used for training), the number of
+training rows (or optimizer.batch_size rows per evaluation, see
+minibatch.py), shots (none in exact mode) and maxiter. admit() compares
+the estimate with a budget and, if it is over, raises AdmissionRejected
+with the knobs that would bring it back under — e.g. "optimizer.maxiter 500 → ≤ 120".
+
+The timing model is per circuit execution, calibrated on one core of the
+reference host with Aer's statevector method:
+
+    seconds ≈ overhead + per_gate·gates + per_amp·gates·2^qubits + per_shot·shots
+
+With execution.engine = "cached_states" training runs no circuits: each
+training row's encoded state is simulated once and every evaluation applies
+the ansatz to the whole batch of cached states,
+
+    seconds ≈ per_gate·fm_gates·rows + evaluations·(per_gate + per_amp·rows·2^qubits)·ansatz_gates
+
+while the final train/test evaluation still uses the circuit model above.
+
+ADMISSION_SPEED_FACTOR scales it for faster (>1) or slower (<1) hosts.
+"""
+from __future__ import annotations
+
+import functools
+import math
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .aer_config import resolve_method, simulator_options
+from .cma_es import default_population
+from .quantum_runner import _build_ansatz, _build_feature_map, _resolve_dataset, parse_shots
+from .sandbox import RUN_MEMORY_LIMIT_MB, RUN_TIMEOUT_S
+from .training_monitor import expected_evaluations
+
+# Budgets in estimated seconds. Synchronous /api/run calls above the sync
+# budget are queued as background jobs; anything above the job budget is rejected.
+ADMISSION_SYNC_MAX_S = float(os.getenv("ADMISSION_SYNC_MAX_S", "120"))
+ADMISSION_MAX_S = float(os.getenv("ADMISSION_MAX_S", str(RUN_TIMEOUT_S or 900)))
+ADMISSION_SPEED_FACTOR = float(os.getenv("ADMISSION_SPEED_FACTOR", "1.0"))
+
+_OVERHEAD_S = 2.0e-3      # per circuit: parameter binding, job submission, result parsing
+_PER_GATE_S = 5.5e-5
+_PER_AMP_GATE_S = 4.0e-9  # one gate applied to one statevector amplitude
+_PER_SHOT_S = 4.5e-6
+# cached_states engine (see backend/cached_states.py)
+_CACHED_ENCODE_GATE_S = 2.6e-5   # one feature-map gate, one training row
+_CACHED_GATE_S = 5.0e-5          # one ansatz gate on the batch, fixed part
+_CACHED_AMP_GATE_S = 4.5e-9      # one ansatz gate on one cached amplitude
+
+_GRADIENT_OPTIMIZERS = {"adam", "slsqp", "lbfgsb", "l_bfgs_b"}
+# A circuit bound and run inside one batched Aer submission (parameter-shift
+# gradients, BatchedSPSA's perturbations, a CMA-ES generation) against a
+# separately submitted one.
+_BATCH_FACTOR = 0.3
+
+
+class AdmissionRejected(Exception):
+    """A spec's estimated cost is over budget. ``estimate`` holds the breakdown."""
+
+    def __init__(self, message: str, estimate: Dict[str, Any]):
+        super().__init__(message)
+        self.estimate = estimate
+
+
+@functools.lru_cache(maxsize=256)
+def _circuit_stats(n_qubits: int, enc_type: str, enc_reps: int, cir_type: str, cir_reps: int):
+    """
+    (feature-map depth, ansatz depth, feature-map gates, ansatz gates,
+    trainable parameters) after decomposition.
+    """
+    feature_map = _build_feature_map(n_qubits, {"type": enc_type, "reps": enc_reps})
+    ansatz = _build_ansatz(n_qubits, {"type": cir_type, "reps": cir_reps})
+    fm, an = feature_map.decompose(), ansatz.decompose()
+    return fm.depth(), an.depth(), fm.size(), an.size(), ansatz.num_parameters
+
+
+def _knobs(spec: Dict[str, Any], shape: Optional[Tuple[int, int]]) -> Dict[str, Any]:
+    ds = spec.get("dataset") or {}
+    if not ds:
+        raise ValueError("dataset configuration is required.")
+    enc = spec.get("encoder") or {}
+    cir = spec.get("circuit") or {}
+    opt = spec.get("optimizer") or {}
+    exe = spec.get("execution") or {}
+    n_rows, n_features = shape if shape is not None else _resolve_dataset(ds)[0].shape
+    n_test = math.ceil(float(ds.get("test_size", 0.25)) * n_rows)
+    n_qubits = int(cir.get("num_qubits", n_features))
+    return {
+        "n_rows": int(n_rows),
+        "n_features": int(n_features),
+        "n_qubits": n_qubits,
+        "n_train": n_rows - n_test,
+        "n_test": n_test,
+        "encoder_type": str(enc.get("type") or "angle").lower(),
+        "encoder_reps": max(1, int(enc.get("reps", 1))),
+        "circuit_type": str(cir.get("type") or "realamplitudes").lower(),
+        "circuit_reps": max(1, int(cir.get("reps", 2))),
+        "optimizer_type": str(opt.get("type") or "cobyla").lower(),
+        "maxiter": max(1, int(opt.get("maxiter", 20))),
+        "resamplings": max(1, int(opt.get("resamplings", 1))),
+        "population": int(opt["population"]) if opt.get("population") is not None else None,
+        "batch_size": int(opt["batch_size"]) if opt.get("batch_size") is not None else None,
+        "full_eval_every": max(0, int(opt.get("full_eval_every") or 0)),
+        "shots": parse_shots(exe),
+        "engine": str(exe.get("engine") or "sampler").lower(),
+        "simulation_method": resolve_method(exe, n_qubits),
+        "simulation_precision": simulator_options(exe, n_qubits)["precision"],
+    }
+
+
+def _estimate(k: Dict[str, Any]) -> Dict[str, Any]:
+    fm_depth, an_depth, fm_gates, an_gates, n_params = _circuit_stats(
+        k["n_qubits"], k["encoder_type"], k["encoder_reps"], k["circuit_type"], k["circuit_reps"]
+    )
+    gates = fm_gates + an_gates
+    evaluations = expected_evaluations(
+        k["optimizer_type"], k["maxiter"], k["resamplings"],
+        k["population"] or default_population(n_params),
+    )
+    # Rows each evaluation simulates, and full-data evaluations for the loss
+    # curve (one per full_eval_every batches; about one batch per evaluation,
+    # counted high for batched optimizers).
+    rows = min(k["batch_size"] or k["n_train"], k["n_train"])
+    full_rows = 0
+    if rows < k["n_train"] and k["full_eval_every"]:
+        full_rows = evaluations // k["full_eval_every"] * k["n_train"]
+    batched_evaluations = 0
+    if k["optimizer_type"] in _GRADIENT_OPTIMIZERS:
+        # Parameter-shift gradient: two extra circuits per parameter per evaluation.
+        batched_evaluations = evaluations * 2 * n_params
+        evaluations += batched_evaluations
+    elif k["optimizer_type"] == "spsa":
+        batched_evaluations = evaluations - 1  # all but the final point
+    elif k["optimizer_type"] == "cmaes":
+        batched_evaluations = evaluations      # one submission per generation
+    per_circuit = (
+        _OVERHEAD_S
+        + _PER_GATE_S * gates
+        + _PER_AMP_GATE_S * gates * 2 ** k["n_qubits"]
+        + _PER_SHOT_S * (k["shots"] or 0)  # exact mode (None) samples nothing
+    )
+    scoring = 2 * (k["n_train"] + k["n_test"])
+    batched = 0  # circuits submitted together, one batch per gradient / SPSA iteration
+    if k["engine"] == "cached_states":
+        executions = scoring
+        training_s = (
+            # Rows are encoded the first time a batch draws them.
+            _CACHED_ENCODE_GATE_S * fm_gates * (k["n_train"] if full_rows else min(k["n_train"], evaluations * rows))
+            + evaluations * an_gates * (_CACHED_GATE_S + _CACHED_AMP_GATE_S * rows * 2 ** k["n_qubits"])
+            + full_rows * an_gates * _CACHED_AMP_GATE_S * 2 ** k["n_qubits"]
+        )
+    else:
+        executions = evaluations * rows + full_rows + scoring
+        batched = batched_evaluations * rows
+        training_s = 0.0
+    return {
+        **k,
+        "feature_map_depth": fm_depth,
+        "ansatz_depth": an_depth,
+        "gates_per_circuit": gates,
+        "num_parameters": n_params,
+        "objective_evaluations": evaluations,
+        "circuit_executions": executions,
+        "statevector_mb": round(
+            (8 if k["simulation_precision"] == "single" else 16) * 2 ** k["n_qubits"] / 2 ** 20, 3
+        ),
+        "estimated_seconds": round(
+            (training_s + (executions - batched * (1 - _BATCH_FACTOR)) * per_circuit)
+            / ADMISSION_SPEED_FACTOR, 2
+        ),
+    }
+
+
+def estimate_cost(
+    spec: Dict[str, Any], shape: Optional[Tuple[int, int]] = None
+) -> Dict[str, Any]:
+    """
+    Estimated cost of training ``spec``. ``shape`` — the dataset's (rows,
+    features) — skips reading the dataset when the caller already has it.
+    """
+    return _estimate(_knobs(spec, shape))
+
+
+# ─── Budget check ─────────────────────────────────────────────────────────────
+
+# (knob, spec path shown to the user, smallest allowed value)
+_SUGGESTIBLE = [
+    ("maxiter", "optimizer.maxiter", 1),
+    ("batch_size", "optimizer.batch_size", 1),
+    ("circuit_reps", "circuit.reps", 1),
+    ("encoder_reps", "encoder.reps", 1),
+    ("shots", "execution.shots", 32),
+    ("n_train", "training rows (sample the dataset or raise dataset.test_size)", 1),
+    ("n_qubits", "feature columns", 2),
+]
+
+
+def _fits(k: Dict[str, Any], budget_s: float) -> bool:
+    est = _estimate(k)
+    return est["estimated_seconds"] <= budget_s and _fits_memory(est)
+
+
+def _fits_memory(est: Dict[str, Any]) -> bool:
+    # Aer holds the statevector plus a working copy. Matrix-product states
+    # grow with entanglement rather than qubit count, so they are not checked.
+    if est["simulation_method"] == "matrix_product_state":
+        return True
+    return not RUN_MEMORY_LIMIT_MB or 2 * est["statevector_mb"] <= RUN_MEMORY_LIMIT_MB
+
+
+def _largest_fitting(k: Dict[str, Any], knob: str, floor: int, fits: Callable) -> Optional[int]:
+    """Largest value of ``knob`` below its current value that fits, or None."""
+    if k[knob] is None:
+        return None
+    lo, hi = floor, k[knob] - 1
+    if hi < lo or not fits({**k, knob: lo}):
+        return None
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if fits({**k, knob: mid}):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def suggestions(estimate: Dict[str, Any], budget_s: float) -> List[Dict[str, Any]]:
+    """
+    Single-knob changes that bring the spec within budget, easiest first
+    (the one needing the smallest relative cut).
+    """
+    fits = functools.partial(_fits, budget_s=budget_s)
+    out = []
+    for knob, label, floor in _SUGGESTIBLE:
+        value = _largest_fitting(estimate, knob, floor, fits)
+        if value is not None:
+            out.append({"knob": label, "current": estimate[knob], "max": value})
+    return sorted(out, key=lambda s: s["max"] / s["current"], reverse=True)
+
+
+def admit(
+    spec: Dict[str, Any],
+    budget_s: float = ADMISSION_MAX_S,
+    shape: Optional[Tuple[int, int]] = None,
+) -> Dict[str, Any]:
+    """Return the cost estimate, or raise AdmissionRejected if it is over ``budget_s``."""
+    est = estimate_cost(spec, shape=shape)
+    est["budget_s"] = budget_s
+    over_time = est["estimated_seconds"] > budget_s
+    over_memory = not _fits_memory(est)
+    if not (over_time or over_memory):
+        return est
+
+    if over_memory:
+        problem = (
+            f"A {est['n_qubits']}-qubit statevector needs about {2 * est['statevector_mb']:.0f} MB, "
+            f"over the {RUN_MEMORY_LIMIT_MB:.0f} MB run memory limit."
+        )
+    else:
+        problem = (
+            f"Estimated training cost is {est['estimated_seconds']:.0f} s, "
+            f"over the {budget_s:.0f} s budget."
+        )
+    est["suggestions"] = suggestions(est, budget_s)
+    if est["suggestions"]:
+        fixes = "; ".join(f"{s['knob']} {s['current']} → ≤ {s['max']}" for s in est["suggestions"])
+        advice = f" Lower one of: {fixes}."
+    else:
+        advice = " No single setting brings it within budget — reduce several of maxiter, reps, shots and features."
+    raise AdmissionRejected(problem + advice, est)
@@ -0,0 +1,103 @@
+"""
+AerSimulator settings from a spec's ``execution`` section.
+
+    method        "auto" (default), "automatic", "statevector", "matrix_product_state"
+    precision     "auto" (default), "double", "single"
+    fusion_enable, fusion_threshold, fusion_max_qubit
+                  Aer's gate-fusion settings; unset keeps Aer's defaults
+    max_parallel_threads, max_parallel_experiments, max_parallel_shots
+                  upper limits on Aer's parallelism — the run still stays
+                  within its THREAD_BUDGET allocation (see thread_budget)
+
+"auto" resolves per run: a dense statevector while it stays small enough to
+simulate (below _MPS_MIN_QUBITS), matrix-product states beyond that, in
+double precision. Parallelism is left to aer_thread_options, which spreads a
+batch of small circuits across threads and gives large circuits all of them.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict
+
+SIMULATION_METHODS = ("auto", "automatic", "statevector", "matrix_product_state")
+PRECISIONS = ("auto", "double", "single")
+FUSION_KEYS = ("fusion_enable", "fusion_threshold", "fusion_max_qubit")
+PARALLEL_KEYS = ("max_parallel_threads", "max_parallel_experiments", "max_parallel_shots")
+
+# A double-precision statevector is 16·2^n bytes: 1 GiB at 26 qubits, where
+# "auto" switches to matrix-product states.
+_MPS_MIN_QUBITS = 26
+
+
+def _choice(exec_spec: Dict[str, Any], key: str, allowed) -> str:
+    value = str(exec_spec.get(key) or "auto").lower()
+    if value not in allowed:
+        raise ValueError(f"execution.{key} must be one of {list(allowed)}, got '{value}'.")
+    return value
+
+
+def _positive_int(exec_spec: Dict[str, Any], key: str, minimum: int = 1) -> int:
+    try:
+        value = int(exec_spec[key])
+    except (TypeError, ValueError):
+        raise ValueError(f"execution.{key} must be an integer, got {exec_spec[key]!r}.") from None
+    if value < minimum:
+        raise ValueError(f"execution.{key} must be at least {minimum}, got {value}.")
+    return value
+
+
+def _bool(exec_spec: Dict[str, Any], key: str) -> bool:
+    """A JSON bool, or a form string such as "false", "0" or "yes"."""
+    value = exec_spec[key]
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ("true", "1", "yes", "on"):
+        return True
+    if text in ("false", "0", "no", "off"):
+        return False
+    raise ValueError(f"execution.{key} must be true or false, got {value!r}.")
+
+
+def resolve_method(exec_spec: Dict[str, Any], n_qubits: int) -> str:
+    method = _choice(exec_spec, "method", SIMULATION_METHODS)
+    if method == "auto":
+        return "matrix_product_state" if n_qubits >= _MPS_MIN_QUBITS else "statevector"
+    return method
+
+
+def simulator_options(exec_spec: Dict[str, Any], n_qubits: int) -> Dict[str, Any]:
+    """Method, precision and fusion options for AerSimulator (no parallelism)."""
+    precision = _choice(exec_spec, "precision", PRECISIONS)
+    options: Dict[str, Any] = {
+        "method": resolve_method(exec_spec, n_qubits),
+        "precision": "double" if precision == "auto" else precision,
+    }
+    if exec_spec.get("fusion_enable") is not None:
+        options["fusion_enable"] = _bool(exec_spec, "fusion_enable")
+    if exec_spec.get("fusion_threshold") is not None:
+        options["fusion_threshold"] = _positive_int(exec_spec, "fusion_threshold")
+    if exec_spec.get("fusion_max_qubit") is not None:
+        options["fusion_max_qubit"] = _positive_int(exec_spec, "fusion_max_qubit")
+    return options
+
+
+def parallel_caps(exec_spec: Dict[str, Any]) -> Dict[str, int]:
+    """The max_parallel_* limits the spec sets explicitly."""
+    return {key: _positive_int(exec_spec, key) for key in PARALLEL_KEYS if exec_spec.get(key) is not None}
+
+
+def describe_options() -> Dict[str, Any]:
+    """The execution settings above, for list_execution_backends()."""
+    return {
+        "method": {"values": list(SIMULATION_METHODS), "default": "auto"},
+        "precision": {"values": list(PRECISIONS), "default": "auto"},
+        "fusion_enable": {"type": "bool", "default": True},
+        "fusion_threshold": {"type": "int", "min": 1, "default": 14},
+        "fusion_max_qubit": {"type": "int", "min": 1, "default": 5},
+        **{key: {"type": "int", "min": 1, "default": "auto"} for key in PARALLEL_KEYS},
+        "auto": (
+            f"statevector below {_MPS_MIN_QUBITS} qubits, matrix_product_state from there; "
+            "double precision; small circuits run in parallel across the batch, "
+            "large ones parallelise each statevector — within the run's thread budget."
+        ),
+    }
@@ -0,0 +1,223 @@
+"""
+Encoded-state cache engine for VQC training (execution.engine = "cached_states").
+
+The feature-map half of every training circuit depends only on X_train,
+which is fixed for the whole fit, so CachedStateNetwork simulates each
+row's encoded statevector once. Every objective evaluation then only
+applies the ansatz gates to the batch of cached states and reads the parity
+probabilities VQC trains on — exactly, without shots. Gradients use the
+parameter-shift rule on the same cached states.
+
+The ansatz is compiled once, when the network is built, into a list of
+(axes, gate-matrix function) ops, so an evaluation only fills in rotation
+matrices. A gradient runs the unshifted evolution once and starts each
+weight's ± shifts from the state just before that weight's first gate,
+rebinding only the gates the weight drives.
+
+Only training takes this path: the fitted model is an ordinary VQC whose
+predictions (and the saved model) use the configured sampler.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from qiskit.circuit import ParameterExpression
+from qiskit.quantum_info import Operator, Statevector
+from qiskit_machine_learning.algorithms.classifiers import VQC
+
+from .monitored_vqc import MonitoredVQCMixin
+
+
+def _flatten(circuit):
+    """Decompose until every instruction acts on at most two qubits."""
+    while any(inst.operation.num_qubits > 2 for inst in circuit.data):
+        circuit = circuit.decompose()
+    return circuit
+
+
+def _rx(t):
+    c, s = np.cos(t / 2), np.sin(t / 2)
+    return np.array([[c, -1j * s], [-1j * s, c]])
+
+
+def _ry(t):
+    c, s = np.cos(t / 2), np.sin(t / 2)
+    return np.array([[c, -s], [s, c]], dtype=complex)
+
+
+def _rz(t):
+    return np.diag([np.exp(-0.5j * t), np.exp(0.5j * t)])
+
+
+def _p(t):
+    return np.diag([1, np.exp(1j * t)])
+
+
+# Closed forms of the parameterised gates the run_pipeline ansatze flatten to;
+# any other gate is rebuilt through its class.
+_ROTATIONS = {"rx": _rx, "ry": _ry, "rz": _rz, "p": _p}
+
+
+def _value_fn(expr, index):
+    """Gate parameter ``expr`` as a function of the weight vector."""
+    if expr in index:
+        return lambda w, i=index[expr]: w[i]
+    params = list(expr.parameters)
+    return lambda w: float(expr.bind({p: w[index[p]] for p in params}).numeric())
+
+
+def compile_circuit(circuit, parameters=()) -> List[Tuple[list, int, Any, frozenset]]:
+    """
+    Precompile a flat circuit into ops ``(axes, k, matrix, weights)`` for
+    apply_ops: the tensor axes and number of qubits a gate acts on, its
+    (2,)*2k matrix — fixed, or a function of the weight vector binding
+    ``parameters`` positionally — and the weight indices it depends on.
+    """
+    index = {p: i for i, p in enumerate(parameters)}
+    n = circuit.num_qubits
+    ops = []
+    for inst in circuit.data:
+        op = inst.operation
+        if op.name == "barrier":
+            continue
+        qubits = [circuit.find_bit(q).index for q in inst.qubits]
+        k = len(qubits)
+        # Axis 1 + (n-1-q) holds qubit q; the gate's own index is little-endian too.
+        axes = [1 + n - 1 - q for q in reversed(qubits)]
+        exprs = [v for v in op.params if isinstance(v, ParameterExpression) and v.parameters]
+        if not exprs:
+            ops.append((axes, k, Operator(op).data.reshape((2,) * (2 * k)), frozenset()))
+            continue
+        values = [_value_fn(v, index) if isinstance(v, ParameterExpression) else (lambda w, v=float(v): v)
+                  for v in op.params]
+        if op.name in _ROTATIONS:
+            rotation, value = _ROTATIONS[op.name], values[0]
+            matrix = (lambda w, f=rotation, v=value: f(v(w)))
+        else:
+            matrix = (lambda w, cls=type(op), vs=values, k=k:
+                      cls(*[v(w) for v in vs]).to_matrix().reshape((2,) * (2 * k)))
+        weights = frozenset(index[p] for v in exprs for p in v.parameters)
+        ops.append((axes, k, matrix, weights))
+    return ops
+
+
+def bind_ops(ops, weights=None) -> list:
+    """Each op's gate tensor at ``weights``."""
+    return [m if isinstance(m, np.ndarray) else m(weights) for _, _, m, _ in ops]
+
+
+def apply_ops(psi: np.ndarray, ops, gates, start: int = 0) -> np.ndarray:
+    """
+    Evolve ``psi``, a (batch, 2, ..., 2) tensor, through ``ops[start:]``
+    with their bound ``gates`` — O(gates·batch·2^n) without ever forming the
+    2^n x 2^n unitary.
+    """
+    for (axes, k, _, _), gate in zip(ops[start:], gates[start:]):
+        psi = np.moveaxis(np.tensordot(gate, psi, axes=(list(range(k, 2 * k)), axes)), range(k), axes)
+    return psi
+
+
+def apply_circuit(states: np.ndarray, circuit) -> np.ndarray:
+    """Evolve a (batch, 2^n) array of statevectors through a bound circuit."""
+    ops = compile_circuit(circuit)
+    psi = states.reshape((len(states),) + (2,) * circuit.num_qubits)
+    return apply_ops(psi, ops, bind_ops(ops)).reshape(len(states), -1)
+
+
+class CachedStateNetwork:
+    """
+    Stands in for VQC's SamplerQNN in the training objective: same
+    forward/backward shapes, computed from cached encoded statevectors.
+    """
+
+    def __init__(self, feature_map, ansatz, num_classes: int = 2):
+        self.feature_map = feature_map
+        self.ansatz = ansatz
+        # Flattening keeps the ansatz's parameter order, so weights bind positionally.
+        self._ops = compile_circuit(_flatten(ansatz), ansatz.parameters)
+        self._first_op = {}                                  # weight -> index of the first op it drives
+        for g, (_, _, _, depends) in enumerate(self._ops):
+            for w in depends:
+                self._first_op.setdefault(w, g)
+        self.num_classes = num_classes
+        self.num_weights = ansatz.num_parameters
+        self.output_shape = (num_classes,)
+        self.circuits_executed = 0
+        self.gradient_evaluations = 0
+        self._cache_key: Optional[bytes] = None
+        self._states: Optional[np.ndarray] = None
+        self._row_states: Dict[bytes, np.ndarray] = {}
+        # VQC's parity interpretation: basis index x is class x % num_classes.
+        dim = 2 ** feature_map.num_qubits
+        self._classes = np.arange(dim) % num_classes
+
+    def encoded_states(self, X: np.ndarray) -> np.ndarray:
+        """
+        Statevectors of the feature map for each row of ``X``. Each distinct
+        row is simulated once, so mini-batches drawn from X_train reuse them.
+        """
+        X = np.asarray(X, dtype=float)
+        key = X.tobytes() + bytes(str(X.shape), "ascii")
+        if key != self._cache_key:
+            for row in X:
+                if row.tobytes() not in self._row_states:
+                    self._row_states[row.tobytes()] = Statevector(self.feature_map.assign_parameters(row)).data
+            self._states = np.array([self._row_states[row.tobytes()] for row in X])
+            self._cache_key = key
+        return self._states
+
+    def _evolve(self, states: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        gates = bind_ops(self._ops, np.asarray(weights, dtype=float))
+        psi = states.reshape((len(states),) + (2,) * self.feature_map.num_qubits)
+        return apply_ops(psi, self._ops, gates).reshape(len(states), -1)
+
+    def _class_probabilities(self, states: np.ndarray) -> np.ndarray:
+        probs = np.abs(states) ** 2
+        out = np.zeros((len(states), self.num_classes))
+        for c in range(self.num_classes):
+            out[:, c] = probs[:, self._classes == c].sum(axis=1)
+        return out
+
+    def forward(self, X: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Class probabilities, shape (n_samples, num_classes)."""
+        self.circuits_executed += len(X)
+        return self._class_probabilities(self._evolve(self.encoded_states(X), weights))
+
+    def backward(self, X: np.ndarray, weights: np.ndarray) -> Tuple[None, np.ndarray]:
+        """(input gradient — not needed, weight gradient of shape (n_samples, num_classes, num_weights))."""
+        states = self.encoded_states(X)
+        weights = np.asarray(weights, dtype=float)
+        grad = np.zeros((len(states), self.num_classes, self.num_weights))
+        gates = bind_ops(self._ops, weights)
+        # The state before each op that starts a weight's shifts.
+        psi = states.reshape((len(states),) + (2,) * self.feature_map.num_qubits)
+        prefix, starts = {}, sorted(set(self._first_op.values()))
+        for g, stop in zip([0] + starts, starts):
+            psi = apply_ops(psi, self._ops[:stop], gates[:stop], g)
+            prefix[stop] = psi
+        for k, g in self._first_op.items():
+            probs = []
+            for shift in (np.pi / 2, -np.pi / 2):
+                shifted = list(gates)
+                w = weights.copy()
+                w[k] += shift
+                for i in range(g, len(self._ops)):
+                    if k in self._ops[i][3]:
+                        shifted[i] = self._ops[i][2](w)
+                out = apply_ops(prefix[g], self._ops, shifted, g).reshape(len(states), -1)
+                probs.append(self._class_probabilities(out))
+            grad[:, :, k] = (probs[0] - probs[1]) / 2
+        self.circuits_executed += 2 * self.num_weights * len(states)
+        self.gradient_evaluations += 1
+        return None, grad
+
+
+class CachedStateVQC(MonitoredVQCMixin, VQC):
+    """
+    VQC whose training objective runs on CachedStateNetwork; prediction is
+    unchanged. Training hooks are MonitoredVQCMixin's.
+    """
+
+    def _training_network(self):
+        return CachedStateNetwork(self.feature_map, self.ansatz, self.num_classes)
@@ -0,0 +1,126 @@
+"""
+CMA-ES with whole-population evaluation (optimizer.type = "cmaes").
+
+Each generation samples ``population`` weight vectors from N(m, σ²C) and
+evaluates them all through the objective's batch hook — on the sampler
+engine one submission of population × n_train circuits (see
+ParameterShiftNetwork.forward_many), which Aer spreads over the run's
+threads as parallel experiments (see thread_budget). COBYLA and SPSA only
+ever have one or two weight vectors in flight.
+
+The update is the standard (μ/μ_w, λ)-CMA-ES with cumulative step-size
+adaptation and rank-one + rank-μ covariance updates, using Hansen's default
+strategy parameters. ``maxiter`` counts generations.
+
+The result is the best candidate evaluated, unless ``keep_best`` is off:
+under mini-batch training (optimizer.batch_size) every generation is scored
+on a different batch, so losses are not comparable across generations and
+the final distribution mean is returned instead.
+"""
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+import numpy as np
+
+
+def default_population(n_weights: int) -> int:
+    return 4 + int(3 * np.log(n_weights))
+
+
+class CMAES:
+    """Minimizer with qiskit's ``minimize`` signature plus an optional ``batch_fun``."""
+
+    # MonitoredOptimizer passes a batch objective only to optimizers that take one.
+    accepts_batch_fun = True
+
+    def __init__(
+        self,
+        maxiter: int = 100,
+        population: Optional[int] = None,
+        sigma0: float = 0.5,
+        seed: Optional[int] = None,
+        keep_best: bool = True,
+    ):
+        if population is not None and population < 4:
+            raise ValueError(f"optimizer.population must be at least 4, got {population}.")
+        if sigma0 <= 0:
+            raise ValueError(f"optimizer.sigma0 must be positive, got {sigma0}.")
+        self.maxiter = maxiter
+        self.population = population
+        self.sigma0 = sigma0
+        self.seed = seed
+        self.keep_best = keep_best
+
+    def minimize(
+        self,
+        fun: Callable[[np.ndarray], float],
+        x0: np.ndarray,
+        jac=None,
+        bounds=None,
+        batch_fun: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    ):
+        """
+        Minimise ``fun`` from ``x0`` and return the best candidate evaluated.
+        ``batch_fun`` maps a (population, n_weights) array to its losses in
+        one go; without it each candidate is evaluated with ``fun``.
+        """
+        from qiskit_algorithms.optimizers import OptimizerResult
+
+        if batch_fun is None:
+            batch_fun = lambda points: np.array([fun(p) for p in points])  # noqa: E731
+        rng = np.random.default_rng(self.seed)
+        mean = np.array(x0, dtype=float)
+        n = len(mean)
+        lam = self.population or default_population(n)
+        mu = lam // 2
+
+        weights = np.log(mu + 0.5) - np.log(np.arange(1, mu + 1))
+        weights /= weights.sum()
+        mu_eff = 1.0 / np.sum(weights ** 2)
+        c_c = (4 + mu_eff / n) / (n + 4 + 2 * mu_eff / n)
+        c_s = (mu_eff + 2) / (n + mu_eff + 5)
+        c_1 = 2 / ((n + 1.3) ** 2 + mu_eff)
+        c_mu = min(1 - c_1, 2 * (mu_eff - 2 + 1 / mu_eff) / ((n + 2) ** 2 + mu_eff))
+        d_s = 1 + 2 * max(0.0, np.sqrt((mu_eff - 1) / (n + 1)) - 1) + c_s
+        chi_n = np.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n ** 2))
+
+        sigma = self.sigma0
+        cov = np.eye(n)
+        p_c, p_s = np.zeros(n), np.zeros(n)
+        best_x, best_f = mean.copy(), np.inf
+
+        for gen in range(self.maxiter):
+            eigvals, basis = np.linalg.eigh(cov)
+            scales = np.sqrt(np.maximum(eigvals, 1e-20))
+            steps = rng.standard_normal((lam, n)) * scales @ basis.T          # y_k ~ N(0, C)
+            candidates = mean + sigma * steps
+            losses = np.asarray(batch_fun(candidates), dtype=float)
+
+            order = np.argsort(losses)
+            if losses[order[0]] < best_f:
+                best_f, best_x = float(losses[order[0]]), candidates[order[0]].copy()
+            selected = steps[order[:mu]]
+            step_w = weights @ selected
+            mean = mean + sigma * step_w
+
+            inv_sqrt = basis @ np.diag(1 / scales) @ basis.T                  # C^(-1/2)
+            p_s = (1 - c_s) * p_s + np.sqrt(c_s * (2 - c_s) * mu_eff) * inv_sqrt @ step_w
+            h_s = (np.linalg.norm(p_s) / np.sqrt(1 - (1 - c_s) ** (2 * (gen + 1)))
+                   < (1.4 + 2 / (n + 1)) * chi_n)
+            p_c = (1 - c_c) * p_c + h_s * np.sqrt(c_c * (2 - c_c) * mu_eff) * step_w
+            cov = ((1 - c_1 - c_mu) * cov
+                   + c_1 * (np.outer(p_c, p_c) + (1 - h_s) * c_c * (2 - c_c) * cov)
+                   + c_mu * (selected.T * weights) @ selected)
+            cov = (cov + cov.T) / 2
+            sigma *= np.exp((c_s / d_s) * (np.linalg.norm(p_s) / chi_n - 1))
+
+        result = OptimizerResult()
+        result.nfev = lam * self.maxiter
+        if self.keep_best:
+            result.x, result.fun = best_x, best_f
+        else:
+            result.x, result.fun = mean, float(fun(mean))
+            result.nfev += 1
+        result.nit = self.maxiter
+        return result
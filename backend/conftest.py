@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def models_dir(tmp_path, monkeypatch):
+    """Directory trained models are saved to and served from — per test, not the repo's models/."""
+    import app
+    from backend import quantum_runner
+    from backend.result_cache import RESULT_CACHE
+
+    path = tmp_path / 'models'
+    path.mkdir()
+    monkeypatch.setattr(quantum_runner, 'MODELS_DIR', path)
+    monkeypatch.setattr(app, 'MODELS_DIR', path)
+    monkeypatch.setattr(RESULT_CACHE, 'models_dir', path)
+    return path
+
+
+@pytest.fixture
+def quadratic():
+    """Smooth test objective with its minimum at all-ones."""
+    return lambda x: float(np.sum((np.asarray(x) - 1.0) ** 2))
+
+
+@pytest.fixture
+def sampler_submissions(monkeypatch):
+    """Parameter-value rows of every PUB ParameterShiftNetwork submits, one entry per submission."""
+    pytest.importorskip('qiskit')
+    from backend.parameter_shift import ParameterShiftNetwork
+
+    submissions = []
+    probabilities = ParameterShiftNetwork._class_probabilities
+    monkeypatch.setattr(ParameterShiftNetwork, '_class_probabilities',
+                        lambda self, values: submissions.append(len(values)) or probabilities(self, values))
+    return submissions
@@ -0,0 +1,141 @@
+"""
+Early stopping with best-weights tracking (optimizer.early_stopping).
+
+    early_stopping: true | {patience, min_delta, validation_split}
+
+    patience          iterations without an improvement larger than
+                      min_delta before training stops (default 10)
+    min_delta         smallest loss decrease that counts as an improvement
+                      (default 0)
+    validation_split  fraction of X_train held out, stratified; the
+                      held-out loss is what must keep improving (default 0:
+                      the training loss in loss_history is watched;
+                      required with optimizer.batch_size, whose training
+                      loss changes batch every iteration)
+
+TrainingMonitor calls update() once per optimizer iteration — each
+evaluation for COBYLA, each gradient for ADAM / SLSQP / L-BFGS-B, each
+batch call (a BatchedSPSA iteration, a CMA-ES generation) with its best
+point — so the validation loss is computed once per iteration, not for
+every line-search step or population member. When patience runs out it ends
+training through StopTraining, and MonitoredOptimizer returns the weights
+of the best iteration rather than the last ones. Those weights are kept
+even when training runs to maxiter.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+from sklearn.model_selection import train_test_split
+
+
+class EarlyStopping:
+    """Patience counter over the per-iteration loss, plus the best weights seen."""
+
+    def __init__(self, patience: int = 10, min_delta: float = 0.0, validation_split: float = 0.0,
+                 seed: Optional[int] = None):
+        self.patience = patience
+        self.min_delta = min_delta
+        self.validation_split = validation_split
+        self.seed = seed
+        # Loss of the held-out rows at given weights; set by the VQC once it has them.
+        self.validation_loss: Optional[Callable[[np.ndarray], float]] = None
+        self.validation_rows = 0
+        self.iterations = 0
+        self.best_iteration: Optional[int] = None
+        self.best_loss: Optional[float] = None
+        self.best_weights: Optional[np.ndarray] = None
+        self.stopped_at: Optional[int] = None
+        self._reference: Optional[float] = None            # last loss that counted as an improvement
+        self._wait = 0
+        self._last_weights: Optional[np.ndarray] = None
+
+    def holdout_rows(self, n_train: int) -> int:
+        """Training rows carve_validation() holds out of ``n_train``."""
+        return math.ceil(self.validation_split * n_train) if self.validation_split else 0
+
+    def carve_validation(self, X: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Any, Any]:
+        """
+        (X_fit, y_fit, X_val, y_val) for one-hot ``y``; without a
+        validation split X_val and y_val are None and all rows train.
+        """
+        if not self.validation_split:
+            return X, y, None, None
+        labels = np.argmax(y, axis=1)
+        stratify = labels if np.bincount(labels).min() >= 2 else None
+        X_fit, X_val, y_fit, y_val = train_test_split(
+            X, y, test_size=self.holdout_rows(len(X)), random_state=self.seed, stratify=stratify
+        )
+        self.validation_rows = len(X_val)
+        return X_fit, y_fit, X_val, y_val
+
+    def update(self, weights: np.ndarray, loss: float) -> bool:
+        """Record one iteration; True once ``patience`` iterations in a row failed to improve."""
+        weights = np.asarray(weights, dtype=float)
+        if self._last_weights is not None and np.array_equal(weights, self._last_weights):
+            return False                                     # loss and gradient at the same point
+        self._last_weights = weights.copy()
+        self.iterations += 1
+        if self.validation_loss is not None:
+            loss = self.validation_loss(weights)
+        loss = float(loss)
+        if self.best_loss is None or loss < self.best_loss:
+            self.best_loss, self.best_weights, self.best_iteration = loss, weights.copy(), self.iterations
+        if self._reference is None or loss < self._reference - self.min_delta:
+            self._reference, self._wait = loss, 0
+            return False
+        self._wait += 1
+        if self._wait >= self.patience:
+            self.stopped_at = self.iterations
+            return True
+        return False
+
+    def summary(self, maxiter: int, evaluations: int, expected: int) -> Dict[str, Any]:
+        """The run result's ``early_stopping`` entry."""
+        saved = max(0, expected - evaluations)
+        return {
+            "patience": self.patience,
+            "min_delta": self.min_delta,
+            "validation_rows": self.validation_rows,
+            "monitored": "validation_loss" if self.validation_loss is not None else "training_loss",
+            "stopped": self.stopped_at is not None,
+            "stopped_at_iteration": self.stopped_at,
+            "best_iteration": self.best_iteration,
+            "best_loss": self.best_loss,
+            "maxiter": maxiter,
+            "evaluations_saved": saved,
+            "compute_saved": round(saved / expected, 3) if expected else 0.0,
+        }
+
+
+def _number(options: Dict[str, Any], key: str, cast, default, minimum, maximum=None):
+    value = default if options.get(key) is None else options[key]
+    try:
+        value = cast(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"optimizer.early_stopping.{key} must be a number, got {value!r}.") from None
+    if value < minimum or (maximum is not None and value >= maximum):
+        bound = f"in [{minimum}, {maximum})" if maximum is not None else f"at least {minimum}"
+        raise ValueError(f"optimizer.early_stopping.{key} must be {bound}, got {value}.")
+    return value
+
+
+def early_stopping_from_spec(opt_spec: Dict[str, Any], default_seed: int) -> Optional[EarlyStopping]:
+    """EarlyStopping for ``optimizer.early_stopping``, or None when it is unset or false."""
+    options = opt_spec.get("early_stopping")
+    if options is None or options is False:
+        return None
+    if options is True:
+        options = {}
+    if not isinstance(options, dict):
+        raise ValueError("optimizer.early_stopping must be true or an object with "
+                         "patience, min_delta and validation_split.")
+    seed = opt_spec.get("seed")
+    return EarlyStopping(
+        patience=_number(options, "patience", int, 10, 1),
+        min_delta=_number(options, "min_delta", float, 0.0, 0.0),
+        validation_split=_number(options, "validation_split", float, 0.0, 0.0, 1.0),
+        seed=default_seed if seed is None else int(seed),
+    )
@@ -0,0 +1,102 @@
+"""
+Canonical spec fingerprints.
+
+Two specs that would train the same model on the same data get the same
+fingerprint: section types are lower-cased, run_pipeline's defaults are filled
+in, keys that do not affect training are dropped, and the dataset is identified
+by the SHA-256 of its file content rather than by its path.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from .quantum_runner import parse_shots, split_key
+
+# Top-level spec keys that never change what run_pipeline computes.
+_NON_SEMANTIC_KEYS = {"cache", "pipeline", "outputs"}
+
+_content_hashes: Dict[Tuple[str, int, int], str] = {}
+_content_lock = threading.Lock()
+
+
+def dataset_content_hash(path: str | Path) -> str:
+    """SHA-256 of a dataset file, memoised on (path, mtime, size)."""
+    p = Path(path)
+    st = p.stat()
+    memo_key = (str(p), st.st_mtime_ns, st.st_size)
+    with _content_lock:
+        cached = _content_hashes.get(memo_key)
+    if cached is not None:
+        return cached
+    digest = hashlib.sha256()
+    with open(p, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    value = digest.hexdigest()
+    with _content_lock:
+        _content_hashes[memo_key] = value
+    return value
+
+
+def normalise_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Canonical form of a spec with defaults filled in and the dataset content-addressed."""
+    ds = spec.get("dataset") or {}
+    if not ds:
+        raise ValueError("dataset configuration is required.")
+    path, label_col, feature_cols, test_size, seed = split_key(ds)
+
+    enc = dict(spec.get("encoder") or {})
+    cir = dict(spec.get("circuit") or {})
+    opt = dict(spec.get("optimizer") or {})
+    exe = dict(spec.get("execution") or {})
+
+    normalised = {
+        key: value for key, value in spec.items()
+        if key not in _NON_SEMANTIC_KEYS
+        and key not in {"dataset", "encoder", "circuit", "optimizer", "execution", "framework"}
+    }
+    normalised.update({
+        "framework": str(spec.get("framework", "qiskit")).lower(),
+        "dataset": {
+            "name": ds.get("name", ""),
+            "content_sha256": dataset_content_hash(path),
+            "label_column": label_col,
+            "feature_columns": list(feature_cols),
+            "test_size": test_size,
+            "seed": seed,
+        },
+        "encoder": {
+            **enc,
+            "type": str(enc.get("type") or "angle").lower(),
+            "reps": max(1, int(enc.get("reps", 1))),
+        },
+        "circuit": {
+            **cir,
+            "type": str(cir.get("type") or "realamplitudes").lower(),
+            "reps": max(1, int(cir.get("reps", 2))),
+            "num_qubits": int(cir.get("num_qubits", len(feature_cols))),
+        },
+        "optimizer": {
+            **opt,
+            "type": str(opt.get("type") or "cobyla").lower(),
+            "maxiter": max(1, int(opt.get("maxiter", 20))),
+        },
+        "execution": {
+            **exe,
+            "shots": parse_shots(exe),
+            "engine": str(exe.get("engine") or "sampler").lower(),
+            "method": str(exe.get("method") or "auto").lower(),
+            "precision": str(exe.get("precision") or "auto").lower(),
+        },
+    })
+    return normalised
+
+
+def spec_fingerprint(spec: Dict[str, Any]) -> str:
+    """Hex SHA-256 of the canonical JSON encoding of normalise_spec(spec)."""
+    canonical = json.dumps(normalise_spec(spec), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,399 @@
+"""
+Asynchronous job queue for pipeline runs.
+
+POST /api/jobs hands a spec to this queue and returns a job ID straight away;
+POST /api/run submits the same way and waits for the job (JobQueue.run).
+Up to JOB_WORKERS specs run at once, each in its own resource-limited child
+process (see sandbox.py), so a long VQC fit never occupies one of the web
+server's request threads and can be cancelled or killed on its own. Progress
+events from the child are kept per job for /api/jobs/<id>/events.
+Finished jobs are kept for JOB_RESULT_TTL_S seconds and then dropped.
+
+Work is started only when a worker slot is free; until then it waits in a
+priority queue (see scheduler.PRIORITY_CLASSES), so a single training job
+submitted after a batch still starts before the batch's remaining specs.
+"""
+from __future__ import annotations
+
+import atexit
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .result_cache import RESULT_CACHE
+from .sandbox import RunAborted, StopSignal, run_isolated
+from .scheduler import PRIORITY_CLASSES
+from .training_monitor import ProgressCallback
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = max(1, int(os.getenv("JOB_WORKERS", "2")))
+JOB_RESULT_TTL_S = float(os.getenv("JOB_RESULT_TTL_S", "3600"))
+
+JOB_STATUSES = ("queued", "running", "done", "cancelled", "error")
+
+
+def _execute_spec(
+    spec: Dict[str, Any],
+    split: Optional[Tuple] = None,
+    progress: Optional[ProgressCallback] = None,
+    stop: Optional[StopSignal] = None,
+) -> Dict[str, Any]:
+    t0 = time.time()
+    result = run_isolated(spec, split=split, progress=progress, stop=stop)
+    result.setdefault("status", "ok")
+    result["execution_time_s"] = round(time.time() - t0, 2)
+    return result
+
+
+# ─── Queue ────────────────────────────────────────────────────────────────────
+
+class JobQueue:
+    """Thread-safe registry of jobs, each run in its own child process."""
+
+    def __init__(self, max_workers: int = JOB_WORKERS, ttl_s: float = JOB_RESULT_TTL_S):
+        self.max_workers = max_workers
+        self.ttl_s = ttl_s
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._events: Dict[str, List[Dict[str, Any]]] = {}
+        self._futures: Dict[str, Future] = {}
+        self._inflight: Dict[str, str] = {}   # spec fingerprint -> job_id
+        self._job_keys: Dict[str, str] = {}   # job_id -> spec fingerprint
+        self._stops: Dict[str, StopSignal] = {}
+        # Guards all state above; notified whenever a job gains an event.
+        self._cond = threading.Condition()
+        # (priority, seq, future, fn, args) waiting for a free worker.
+        self._pending: List[Tuple[int, int, Future, Any, Tuple]] = []
+        self._seq = itertools.count()
+        self._running = 0
+
+    def submit(
+        self,
+        spec: Dict[str, Any],
+        label: str = "",
+        key: Optional[str] = None,
+        priority: str = "train",
+    ) -> Dict[str, Any]:
+        """
+        Enqueue a spec and return its job record. If ``key`` (a spec
+        fingerprint) matches a job that is still queued or running, the caller
+        is attached to that job instead of starting another simulation.
+        """
+        with self._cond:
+            self._purge_expired()
+            leader_id = self._inflight.get(key) if key is not None else None
+            if (leader_id is not None and leader_id in self._jobs
+                    and not self._jobs[leader_id]["cancel_requested"]):
+                job = self._jobs[leader_id]
+                job["coalesced_callers"] += 1
+                logger.info(f"[job {leader_id}] coalesced caller #{job['coalesced_callers']}")
+                return {**self._public(job), "coalesced": True}
+
+            job_id = uuid.uuid4().hex[:12]
+            job = {
+                "job_id": job_id,
+                "status": "queued",
+                "label": label,
+                "coalesced_callers": 1,
+                "cancel_requested": False,
+                "submitted_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+                "progress": None,
+                "result": None,
+                "error": None,
+            }
+            self._jobs[job_id] = job
+            self._events[job_id] = []
+            self._stops[job_id] = StopSignal()
+            self._append_event(job_id, {"type": "queued", "priority": priority})
+            future = self._enqueue(priority, self._run_job, (job_id, spec))
+            self._futures[job_id] = future
+            if key is not None:
+                self._inflight[key] = job_id
+                self._job_keys[job_id] = key
+        future.add_done_callback(lambda f, jid=job_id: self._on_done(jid, f))
+        logger.info(f"[job {job_id}] queued | {label}")
+        return {**self._public(job), "coalesced": False}
+
+    def run(
+        self,
+        spec: Dict[str, Any],
+        label: str = "",
+        key: Optional[str] = None,
+        priority: str = "train",
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        submit() a spec and block until its job (or the job it was coalesced
+        onto) finishes. Returns (result, job snapshot); a failed run raises
+        its exception here, a job cancelled before it started RunAborted.
+        """
+        job = self.submit(spec, label=label, key=key, priority=priority)
+        job_id = job["job_id"]
+        with self._cond:
+            future = self._futures.get(job_id)
+            # Wait for _on_done, which caches the result, not just the future.
+            while job_id in self._jobs and self._jobs[job_id]["finished_at"] is None:
+                self._cond.wait()
+            done = self._public(self._jobs[job_id]) if job_id in self._jobs else None
+        if future is not None and not future.cancelled() and future.exception() is not None:
+            raise future.exception()
+        if done is None or done["result"] is None:
+            raise RunAborted(done["error"] if done else f"Job {job_id} expired before it finished.")
+        return done["result"], {**done, "coalesced": job["coalesced"]}
+
+    def add_finished(self, result: Dict[str, Any], label: str = "") -> Dict[str, Any]:
+        """Register a job that is already complete (e.g. served from the result cache)."""
+        now = time.time()
+        job_id = uuid.uuid4().hex[:12]
+        job = {
+            "job_id": job_id,
+            "status": "done",
+            "label": label,
+            "coalesced_callers": 1,
+            "cancel_requested": False,
+            "submitted_at": now,
+            "started_at": now,
+            "finished_at": None,
+            "progress": None,
+            "result": result,
+            "error": None,
+        }
+        with self._cond:
+            self._purge_expired()
+            self._jobs[job_id] = job
+            self._events[job_id] = []
+            self._append_event(job_id, {"type": "result", "result": result})
+            job["finished_at"] = time.time()
+        return {**self._public(job), "coalesced": False}
+
+    def run_parallel(
+        self,
+        specs: Sequence[Dict[str, Any]],
+        splits: Sequence[Optional[Tuple]],
+        priority: str = "batch",
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several specs concurrently on the worker pool and block until all
+        finish. Returns one {"status", "result" | "error"} entry per spec, in order.
+        """
+        with self._cond:
+            futures = [
+                self._enqueue(priority, _execute_spec, (spec, split))
+                for spec, split in zip(specs, splits)
+            ]
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append({"status": "ok", "result": future.result()})
+            except Exception as exc:
+                outcomes.append({"status": "error", "error": str(exc) or type(exc).__name__})
+        return outcomes
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a job on behalf of one of its callers. While other coalesced
+        callers are still attached, the caller is detached and the job keeps
+        running (the snapshot then has cancel_requested False). The last
+        caller's cancel drops a queued job, or asks a running one to stop,
+        and it finishes with the best weights found so far. Returns the job
+        snapshot, or None if the job is unknown or expired.
+        """
+        with self._cond:
+            self._purge_expired()
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job["finished_at"] is None and not job["cancel_requested"]:
+                if job["coalesced_callers"] > 1:
+                    job["coalesced_callers"] -= 1
+                    logger.info(f"[job {job_id}] caller detached, {job['coalesced_callers']} still attached")
+                    return self._public(job)
+                job["cancel_requested"] = True
+                self._append_event(job_id, {"type": "cancelling"})
+                future = self._futures.get(job_id)
+                if future is None or not future.cancel():
+                    self._stops[job_id].request("cancelled")
+                logger.info(f"[job {job_id}] cancel requested")
+            return self._public(job)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a snapshot of the job, or None if unknown or expired."""
+        with self._cond:
+            self._purge_expired()
+            job = self._jobs.get(job_id)
+            return self._public(job) if job is not None else None
+
+    def wait_events(
+        self, job_id: str, cursor: int, timeout: float
+    ) -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+        """
+        Return (events with id >= cursor, finished), waiting up to ``timeout``
+        seconds for new events if there are none yet. ``finished`` is True once
+        the job is over and the returned batch contains its final event.
+        Returns None if the job is unknown or expired.
+        """
+        with self._cond:
+            if job_id not in self._jobs:
+                return None
+            if len(self._events[job_id]) <= cursor and self._jobs[job_id]["finished_at"] is None:
+                self._cond.wait(timeout)
+                if job_id not in self._jobs:
+                    return None
+            events = list(self._events[job_id][cursor:])
+            finished = self._jobs[job_id]["finished_at"] is not None
+            return events, finished
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            self._purge_expired()
+            counts = {s: 0 for s in JOB_STATUSES}
+            for job in self._jobs.values():
+                counts[job["status"]] += 1
+            pending = {c: 0 for c in PRIORITY_CLASSES}
+            for prio, *_ in self._pending:
+                pending[PRIORITY_CLASSES[prio]] += 1
+            return {
+                "workers": self.max_workers,
+                "ttl_s": self.ttl_s,
+                "jobs": counts,
+                "running": self._running,
+                "pending": pending,
+            }
+
+    def shutdown(self) -> None:
+        with self._cond:
+            pending, self._pending = self._pending, []
+            stops = list(self._stops.values())
+        for _, _, future, _, _ in pending:
+            future.cancel()
+        for stop in stops:
+            stop.request("cancelled")
+
+    # ── internals ────────────────────────────────────────────────────────────
+
+    def _enqueue(self, priority: str, fn, args: Tuple) -> Future:
+        """
+        Queue ``fn(*args)`` under a priority class and return a Future for it.
+        Caller must hold the lock.
+        """
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(f"Unknown priority class '{priority}'. Choose from {PRIORITY_CLASSES}")
+        future: Future = Future()
+        heapq.heappush(
+            self._pending, (PRIORITY_CLASSES.index(priority), next(self._seq), future, fn, args)
+        )
+        self._dispatch()
+        return future
+
+    def _dispatch(self) -> None:
+        """Start pending work while worker slots are free. Caller must hold the lock."""
+        while self._pending and self._running < self.max_workers:
+            _, _, future, fn, args = heapq.heappop(self._pending)
+            if not future.set_running_or_notify_cancel():
+                continue
+            self._running += 1
+            threading.Thread(
+                target=self._work, args=(future, fn, args), name="job-worker", daemon=True
+            ).start()
+
+    def _work(self, future: Future, fn, args: Tuple) -> None:
+        try:
+            result = fn(*args)
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+        finally:
+            with self._cond:
+                self._running -= 1
+                self._dispatch()
+
+    def _run_job(self, job_id: str, spec: Dict[str, Any]) -> Dict[str, Any]:
+        with self._cond:
+            stop = self._stops[job_id]
+
+        def progress(event: Dict[str, Any]) -> None:
+            self._on_progress(job_id, event)
+
+        progress({"type": "started"})
+        return _execute_spec(spec, progress=progress, stop=stop)
+
+    def _on_progress(self, job_id: str, event: Dict[str, Any]) -> None:
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None or job["finished_at"] is not None:
+                return
+            if event.get("type") == "started":
+                job["status"], job["started_at"] = "running", time.time()
+            elif event.get("type") == "progress":
+                job["progress"] = event
+            self._append_event(job_id, event)
+
+    def _append_event(self, job_id: str, event: Dict[str, Any]) -> None:
+        """Caller must hold the lock."""
+        events = self._events[job_id]
+        events.append({"id": len(events), "job_id": job_id, "time": time.time(), **event})
+        self._cond.notify_all()
+
+    def _on_done(self, job_id: str, future: Future) -> None:
+        with self._cond:
+            job = self._jobs.get(job_id)
+            self._futures.pop(job_id, None)
+            self._stops.pop(job_id, None)
+            key = self._job_keys.pop(job_id, None)
+            if key is not None and self._inflight.get(key) == job_id:
+                del self._inflight[key]
+            if job is None:
+                return
+            exc = future.exception() if not future.cancelled() else None
+            if future.cancelled():
+                job["status"], job["error"] = "cancelled", "Job was cancelled before it started."
+            elif exc is not None:
+                job["status"] = "cancelled" if job["cancel_requested"] else "error"
+                job["error"] = str(exc) or type(exc).__name__
+            else:
+                # A cancelled run still returns a result holding its best weights.
+                job["status"] = "cancelled" if job["cancel_requested"] else "done"
+                job["result"] = future.result()
+                if key is not None:
+                    RESULT_CACHE.put(key, job["result"])
+                    job["result"]["cache"] = {
+                        "hit": False, "key": key,
+                        "training_time_s": job["result"].get("execution_time_s"),
+                    }
+            if job["result"] is not None:
+                self._append_event(job_id, {"type": "result", "result": job["result"]})
+            else:
+                self._append_event(job_id, {"type": "error", "error": job["error"]})
+            job["finished_at"] = time.time()
+        elapsed = round(job["finished_at"] - job["submitted_at"], 2)
+        logger.info(f"[job {job_id}] {job['status']} after {elapsed}s")
+
+    def _purge_expired(self) -> None:
+        """Drop finished jobs older than the TTL. Caller must hold the lock."""
+        cutoff = time.time() - self.ttl_s
+        expired = [
+            jid for jid, job in self._jobs.items()
+            if job["finished_at"] is not None and job["finished_at"] < cutoff
+        ]
+        for jid in expired:
+            del self._jobs[jid]
+            self._events.pop(jid, None)
+
+    def _public(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        out = dict(job)
+        out["expires_at"] = (
+            job["finished_at"] + self.ttl_s if job["finished_at"] is not None else None
+        )
+        return out
+
+
+JOB_QUEUE = JobQueue()
+atexit.register(JOB_QUEUE.shutdown)
@@ -0,0 +1,165 @@
+"""
+Mini-batch training objective (optimizer.batch_size, optimizer.sampling).
+
+    batch_size       training rows per objective evaluation; unset, or at
+                     least the number of training rows, trains on all of X_train
+    sampling         "stratified" (default) gives every batch X_train's class
+                     mix; "random" draws rows uniformly
+    full_eval_every  every K batches, also evaluate the loss on all of X_train
+                     — that series becomes the run's loss curve; unset or 0 skips it
+    seed             optimizer.seed (else dataset.seed) fixes the batches
+
+Without it every objective evaluation simulates every training row, so an
+iteration costs time in proportion to the dataset. MiniBatchObjective draws a
+new batch for each new weight vector the optimizer evaluates, and keeps it for
+the gradient at the same weights, so loss and gradient come from the same
+rows. Each batch gets its own objective function, built on just its rows. A
+batch call (a BatchedSPSA iteration, a CMA-ES generation) gets one batch for
+all of its points, so they are compared on the same rows. Early stopping
+under mini-batches needs its validation_split: the per-batch loss is too
+noisy to watch.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+SAMPLING_MODES = ("stratified", "random")
+
+
+class MiniBatchSettings:
+    """The optimizer.batch_size / sampling / full_eval_every / seed options of a run."""
+
+    def __init__(self, batch_size: int, sampling: str = "stratified", full_eval_every: int = 0,
+                 seed: Optional[int] = None):
+        self.batch_size = batch_size
+        self.sampling = sampling
+        self.full_eval_every = full_eval_every
+        self.seed = seed
+
+
+def _int_option(opt_spec: Dict[str, Any], key: str, minimum: int) -> int:
+    try:
+        value = int(opt_spec[key])
+    except (TypeError, ValueError):
+        raise ValueError(f"optimizer.{key} must be an integer, got {opt_spec[key]!r}.") from None
+    if value < minimum:
+        raise ValueError(f"optimizer.{key} must be at least {minimum}, got {value}.")
+    return value
+
+
+def minibatch_settings(opt_spec: Dict[str, Any], n_train: int, default_seed: int) -> Optional[MiniBatchSettings]:
+    """Mini-batch settings from the optimizer spec, or None to train on the full X_train."""
+    sampling = str(opt_spec.get("sampling") or "stratified").lower()
+    if sampling not in SAMPLING_MODES:
+        raise ValueError(f"optimizer.sampling must be one of {list(SAMPLING_MODES)}, got '{sampling}'.")
+    if opt_spec.get("batch_size") is None:
+        return None
+    batch_size = _int_option(opt_spec, "batch_size", 1)
+    full_eval_every = _int_option(opt_spec, "full_eval_every", 0) if opt_spec.get("full_eval_every") else 0
+    if batch_size >= n_train:
+        return None
+    seed = opt_spec.get("seed")
+    return MiniBatchSettings(batch_size, sampling, full_eval_every, default_seed if seed is None else int(seed))
+
+
+def stratified_counts(class_sizes: np.ndarray, batch_size: int) -> np.ndarray:
+    """
+    Rows to draw from each class: proportional to its size (largest
+    remainder), with at least one row of every class while the batch has room.
+    """
+    class_sizes = np.asarray(class_sizes)
+    exact = class_sizes * batch_size / class_sizes.sum()
+    counts = np.floor(exact).astype(int)
+    for c in np.argsort(counts - exact, kind="stable")[: batch_size - counts.sum()]:
+        counts[c] += 1
+    for c in np.flatnonzero((counts == 0) & (class_sizes > 0)):
+        donor = np.argmax(counts)
+        if counts[donor] <= 1:
+            break
+        counts[donor] -= 1
+        counts[c] += 1
+    return counts
+
+
+class MiniBatchObjective:
+    """
+    VQC objective whose evaluations each see a mini-batch of ``X``, ``y``
+    (y one-hot). ``make_objective(X, y)`` builds the underlying objective
+    function (OneHotObjectiveFunction or a subclass) for a set of rows: one is
+    built per batch, so its forward-pass cache serves that batch's loss and
+    gradient, and one for all rows serves full_objective().
+    """
+
+    def __init__(self, make_objective: Callable[[np.ndarray, np.ndarray], Any],
+                 X: np.ndarray, y: np.ndarray, settings: MiniBatchSettings):
+        self.make_objective = make_objective
+        self.settings = settings
+        self._X, self._y = X, y
+        labels = np.argmax(y, axis=1)
+        self._strata = [np.flatnonzero(labels == c) for c in np.unique(labels)]
+        self._rng = np.random.default_rng(settings.seed)
+        self._full = None
+        self.function = None                                     # objective of the current batch
+        self._batch_weights: Optional[np.ndarray] = None
+        self.batches_drawn = 0
+        self.full_loss_history: List[float] = []
+
+    def _sample(self) -> np.ndarray:
+        size = self.settings.batch_size
+        if self.settings.sampling == "random":
+            return np.sort(self._rng.choice(len(self._X), size, replace=False))
+        counts = stratified_counts(np.array([len(s) for s in self._strata]), size)
+        return np.sort(np.concatenate([
+            self._rng.choice(rows, k, replace=False) for rows, k in zip(self._strata, counts)
+        ]))
+
+    def _draw(self, weights: np.ndarray) -> None:
+        """Build the objective of a fresh batch, drawn for ``weights``."""
+        rows = self._sample()
+        self.function = self.make_objective(self._X[rows], self._y[rows])
+        self.batches_drawn += 1
+        every = self.settings.full_eval_every
+        if every and self.batches_drawn % every == 0:
+            self.full_loss_history.append(self.full_objective(weights))
+
+    def _batch_for(self, weights: np.ndarray) -> None:
+        if self._batch_weights is None or not np.array_equal(weights, self._batch_weights):
+            self._draw(weights)
+            self._batch_weights = np.array(weights, dtype=float, copy=True)
+
+    def objective(self, weights: np.ndarray) -> float:
+        self._batch_for(weights)
+        return self.function.objective(weights)
+
+    def gradient(self, weights: np.ndarray) -> np.ndarray:
+        self._batch_for(weights)
+        return self.function.gradient(weights)
+
+    def objectives(self, weight_sets: np.ndarray) -> np.ndarray:
+        """
+        Losses of several weight vectors on one batch. A full-data evaluation
+        falling due is taken at their centroid — BatchedSPSA's current point,
+        roughly the CMA-ES distribution mean.
+        """
+        weight_sets = np.asarray(weight_sets, dtype=float)
+        self._draw(weight_sets.mean(axis=0))
+        self._batch_weights = None                             # the next single point draws anew
+        if hasattr(self.function, "objectives"):
+            return self.function.objectives(weight_sets)
+        return np.array([self.function.objective(w) for w in weight_sets])
+
+    def full_objective(self, weights: np.ndarray) -> float:
+        """Loss on every training row."""
+        if self._full is None:
+            self._full = self.make_objective(self._X, self._y)
+        return float(self._full.objective(weights))
+
+
+def wrap_objective(make_objective: Callable[[np.ndarray, np.ndarray], Any], X: np.ndarray, y: np.ndarray,
+                   settings: Optional[MiniBatchSettings]):
+    """``make_objective(X, y)`` without mini-batch settings, else a MiniBatchObjective over it."""
+    if settings is None:
+        return make_objective(X, y)
+    return MiniBatchObjective(make_objective, X, y, settings)
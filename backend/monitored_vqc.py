@@ -0,0 +1,59 @@
+"""
+Training hooks shared by the VQC subclasses run_pipeline trains with
+(ParameterShiftVQC, CachedStateVQC).
+
+Each subclass only says which network computes the training objective
+(``_training_network()``) and which objective class wraps it. The mixin
+does the rest the same way for both: with ``early_stopping`` set (see
+early_stopping.py) the validation rows are held out of training; with
+``minibatch`` set (see minibatch.py) each evaluation trains on a batch of
+rows; and a MonitoredOptimizer also gets the objective's batch hook, when it
+has one, for BatchedSPSA iterations and CMA-ES generations.
+"""
+from __future__ import annotations
+
+import numpy as np
+from qiskit_machine_learning.algorithms.objective_functions import OneHotObjectiveFunction
+
+from .minibatch import wrap_objective
+from .training_monitor import MonitoredOptimizer
+
+
+class MonitoredVQCMixin:
+    """Mix in before VQC; subclasses implement ``_training_network()``."""
+
+    objective_function = OneHotObjectiveFunction
+    training_network = None
+    training_objective = None
+    minibatch = None
+    early_stopping = None
+
+    def _training_network(self):
+        """Network (forward/backward like SamplerQNN) the training objective evaluates."""
+        raise NotImplementedError
+
+    def _create_objective(self, X: np.ndarray, y: np.ndarray):
+        self.training_network = self._training_network()
+        if self.early_stopping is not None:
+            X, y, X_val, y_val = self.early_stopping.carve_validation(X, y)
+            if X_val is not None:
+                # Runs once per optimizer iteration (see TrainingMonitor), on
+                # the same network and objective class as training.
+                self.early_stopping.validation_loss = self.objective_function(
+                    X_val, y_val, self.training_network, self._loss
+                ).objective
+        self.training_objective = wrap_objective(
+            lambda X_rows, y_rows: self.objective_function(X_rows, y_rows, self.training_network, self._loss),
+            X, y, self.minibatch,
+        )
+        return self.training_objective
+
+    def _minimize(self, function):
+        if not isinstance(self._optimizer, MonitoredOptimizer):
+            return super()._minimize(function)
+        return self._optimizer(
+            fun=self._get_objective(function),
+            x0=self._choose_initial_point(),
+            jac=function.gradient,
+            batch_fun=getattr(function, "objectives", None),
+        )
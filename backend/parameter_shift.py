@@ -0,0 +1,133 @@
+"""
+Batched parameter-shift gradients for VQC training.
+
+VQC's SamplerQNN hands gradients to qiskit's sampler-gradient classes,
+which submit one PUB per circuit and fail on a transpiled circuit run through
+the V2 sampler — so ADAM, SLSQP and L_BFGS_B had no working gradient.
+ParameterShiftNetwork takes over the backward pass: the 2P shifted weight
+vectors (θ ± π/2·e_k) for every training row go to the sampler as a single
+PUB — one circuit with a (2P·n_rows, n_params) array of parameter values —
+and the probabilities are read from the packed result arrays in bulk. The
+PUB runs on Aer's own SamplerV2 over the run's AerSimulator, which binds the
+whole parameter array inside Aer; qiskit's BackendSamplerV2 would build one
+bound circuit per row in Python first, several times slower.
+
+The shift rule is exact for the ansatze run_pipeline builds (RealAmplitudes,
+EfficientSU2, TwoLocal): every weight drives exactly one Pauli rotation.
+
+The forward pass is SamplerQNN's own. forward_many() evaluates several
+weight vectors in one submission the same way, for optimizers that take a
+batch objective (BatchedSPSA). Every pass counts the circuits it executes,
+which run_pipeline reports per optimizer.
+"""
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+from qiskit.primitives import BaseSamplerV2
+from qiskit_aer import AerSimulator
+from qiskit_aer.primitives import SamplerV2 as AerSamplerV2
+from qiskit_machine_learning.algorithms.classifiers import VQC
+from qiskit_machine_learning.algorithms.objective_functions import OneHotObjectiveFunction
+
+from .monitored_vqc import MonitoredVQCMixin
+
+
+def _outcomes(bit_array) -> np.ndarray:
+    """Measured outcomes of a BitArray as integers, shape (*pub_shape, shots)."""
+    packed = bit_array.array                        # big-endian bytes, (..., shots, nbytes)
+    values = np.zeros(packed.shape[:-1], dtype=np.int64)
+    for k in range(packed.shape[-1]):
+        values = (values << 8) | packed[..., k]
+    return values
+
+
+class ParameterShiftNetwork:
+    """
+    Stands in for VQC's SamplerQNN in the training objective: forward is
+    delegated, backward is a batched parameter-shift gradient of the same
+    shape as SamplerQNN's (None, (n_samples, num_classes, num_weights)).
+    """
+
+    def __init__(self, qnn, num_classes: int = 2, backend=None):
+        self.qnn = qnn
+        self.num_classes = num_classes
+        self.num_weights = qnn.num_weights
+        self.output_shape = qnn.output_shape
+        self.circuits_executed = 0
+        self.gradient_evaluations = 0
+        # VQC's parity interpretation, over every measurable outcome.
+        self._classes = np.array([qnn.interpret(x) for x in range(2 ** qnn.circuit.num_clbits)])
+        # Shot-based runs submit through Aer's SamplerV2 over the run's simulator
+        # (``backend``, else the V2 sampler's own); exact mode keeps the V1 sampler.
+        self._sampler = qnn.sampler
+        backend = backend if backend is not None else getattr(qnn.sampler, "backend", None)
+        if isinstance(qnn.sampler, BaseSamplerV2) and isinstance(backend, AerSimulator):
+            self._sampler = AerSamplerV2.from_backend(
+                backend, default_shots=qnn.sampler.options.default_shots
+            )
+
+    def forward(self, X: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        self.circuits_executed += len(X)
+        return self.qnn.forward(X, weights)
+
+    def _class_probabilities(self, values: np.ndarray) -> np.ndarray:
+        """Run the circuit once per row of parameter ``values`` in one sampler submission."""
+        sampler = self._sampler
+        out = np.zeros((len(values), self.num_classes))
+        if isinstance(sampler, BaseSamplerV2):
+            data = sampler.run([(self.qnn.circuit, values)]).result()[0].data
+            bits = data.meas if hasattr(data, "meas") else data.c
+            classes = self._classes[_outcomes(bits)]
+            for c in range(self.num_classes):
+                out[:, c] = np.mean(classes == c, axis=1)
+            return out
+        # V1 (exact mode): one call over the whole batch, quasi-distributions back.
+        dists = sampler.run([self.qnn.circuit] * len(values), values).result().quasi_dists
+        for i, dist in enumerate(dists):
+            for outcome, p in dist.items():
+                out[i, self._classes[outcome]] += p
+        return out
+
+    def forward_many(self, X: np.ndarray, weight_sets: np.ndarray) -> np.ndarray:
+        """Class probabilities for each of K weight vectors, shape (K, n_samples, num_classes)."""
+        X = np.asarray(X, dtype=float)
+        weight_sets = np.asarray(weight_sets, dtype=float)
+        k, n = len(weight_sets), len(X)
+        values = np.concatenate([
+            np.broadcast_to(X, (k,) + X.shape),
+            np.broadcast_to(weight_sets[:, None, :], (k, n, weight_sets.shape[1])),
+        ], axis=2).reshape(k * n, -1)                                            # inputs, then weights
+        self.circuits_executed += len(values)
+        return self._class_probabilities(values).reshape(k, n, self.num_classes)
+
+    def backward(self, X: np.ndarray, weights: np.ndarray) -> Tuple[None, np.ndarray]:
+        p = self.num_weights
+        shifted = np.asarray(weights, dtype=float) + np.pi / 2 * np.vstack([np.eye(p), -np.eye(p)])
+        probs = self.forward_many(X, shifted)                                    # (2P, n, classes)
+        self.gradient_evaluations += 1
+        grad = (probs[:p] - probs[p:]) / 2                                       # (P, n, classes)
+        return None, grad.transpose(1, 2, 0)
+
+
+class BatchedObjectiveFunction(OneHotObjectiveFunction):
+    """VQC's one-hot objective, plus the loss of several weight vectors from one submission."""
+
+    def objectives(self, weight_sets: np.ndarray) -> np.ndarray:
+        probs = self._neural_network.forward_many(self._X, weight_sets)
+        return np.array([np.sum(self._loss(p, self._y)) / self._num_samples for p in probs])
+
+
+class ParameterShiftVQC(MonitoredVQCMixin, VQC):
+    """
+    VQC whose training gradient is ParameterShiftNetwork's; prediction is
+    unchanged. Training hooks are MonitoredVQCMixin's; ``aer_backend`` is the
+    run's AerSimulator from _build_sampler.
+    """
+
+    objective_function = BatchedObjectiveFunction
+    aer_backend = None
+
+    def _training_network(self):
+        return ParameterShiftNetwork(self._neural_network, self.num_classes, self.aer_backend)
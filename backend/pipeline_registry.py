@@ -4,6 +4,9 @@ Pipeline component registry.
 Defines the supported encoders, ansatze, and optimizers.
 Flask serves this via /api/registry so the frontend builds dropdowns dynamically —
 adding a new component here automatically makes it available in the UI.
+
+``qiskit_class`` names the Qiskit class a component is built from;
+``local_class`` marks an optimizer implemented in this package instead.
 """
 from __future__ import annotations
 
@@ -57,7 +60,7 @@ OPTIMIZER_REGISTRY: dict = {
     "spsa": {
         "label": "SPSA (stochastic gradient)",
         "description": "Simultaneous Perturbation Stochastic Approximation. Robust to noise.",
-        "qiskit_class": "SPSA",
+        "local_class": "backend.batched_spsa.BatchedSPSA",
     },
     "adam": {
         "label": "ADAM (adaptive gradient)",
@@ -69,4 +72,9 @@ OPTIMIZER_REGISTRY: dict = {
         "description": "Sequential Least Squares Programming. Best for noiseless simulators.",
         "qiskit_class": "SLSQP",
     },
+    "cmaes": {
+        "label": "CMA-ES (population-based)",
+        "description": "Covariance Matrix Adaptation. Evaluates each generation in one batched simulation.",
+        "local_class": "backend.cma_es.CMAES",
+    },
 }
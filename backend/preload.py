@@ -0,0 +1,20 @@
+"""
+Forkserver preload: builds what every training run needs before any fork.
+
+sandbox._PRELOAD imports this module in the forkserver, so the circuit
+templates of each catalog dataset's recommended config and the pass manager
+exist there once, and every run forked from it starts with them instead of
+rebuilding them. The web process warms its own copies (backend.warmup) for
+predictions. Best effort: a failure is logged and runs build lazily.
+"""
+import logging
+
+from .warmup import _build_pass_manager, _build_templates
+
+logger = logging.getLogger(__name__)
+
+try:
+    _build_templates()
+    _build_pass_manager()
+except Exception as exc:
+    logger.warning(f"Forkserver preload failed: {exc}")
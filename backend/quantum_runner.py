@@ -7,13 +7,17 @@ the spec dict — nothing is hardcoded here.
 """
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import sys
+import threading
 import time
 import types
 import uuid
+import warnings
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import joblib
 import numpy as np
@@ -29,19 +33,41 @@ from sklearn.metrics import (
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 
+from .aer_config import describe_options, parallel_caps, simulator_options
+from .cma_es import CMAES, default_population
 from .dataset_catalog import DATASET_CONFIGS
+from .early_stopping import early_stopping_from_spec
+from .minibatch import minibatch_settings
+from .thread_budget import ThreadFollower, aer_thread_options
+from .training_monitor import (
+    MonitoredOptimizer,
+    ProgressCallback,
+    StopCheck,
+    TrainingMonitor,
+    expected_evaluations,
+)
 
 logger = logging.getLogger(__name__)
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
-MODELS_DIR = ROOT_DIR / "models"
+MODELS_DIR = Path(os.getenv("MODELS_DIR", str(ROOT_DIR / "models")))
+
+# execution.engine: "sampler" trains through the Aer sampler; "cached_states"
+# simulates each training row's encoded state once (see cached_states.py).
+TRAINING_ENGINES = ("sampler", "cached_states")
+
+# execution.shots: null or "exact" samples nothing — the sampler returns the
+# exact statevector probabilities instead of shot counts.
+EXACT_SHOTS = (None, "exact")
 
 
 # ─── Dependency loader ────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def _load_quantum_stack() -> Dict[str, Any]:
     """
     Lazy-import the full Qiskit stack and return a dict of classes.
+    Memoised, so only the first call pays the import time (see warmup.py).
     Raises a clear ImportError if dependencies are missing.
     """
     try:
@@ -49,6 +75,7 @@ def _load_quantum_stack() -> Dict[str, Any]:
         from qiskit.primitives import BackendSamplerV2
         from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
         from qiskit_aer import AerSimulator
+        from qiskit_aer.primitives import Sampler as AerSampler
         from qiskit_machine_learning.algorithms.classifiers import VQC
         from qiskit_algorithms.optimizers import COBYLA, SPSA
     except ImportError as exc:
@@ -70,6 +97,7 @@ def _load_quantum_stack() -> Dict[str, Any]:
         "ZZFeatureMap": ZZFeatureMap,
         "BackendSamplerV2": BackendSamplerV2,
         "AerSimulator": AerSimulator,
+        "AerSampler": AerSampler,
         "generate_preset_pass_manager": generate_preset_pass_manager,
         "VQC": VQC,
         "COBYLA": COBYLA,
@@ -157,13 +185,45 @@ def _resolve_dataset(ds_spec: Dict) -> Tuple[np.ndarray, np.ndarray]:
     return _load_csv(p, ds_spec)
 
 
-# ─── Circuit builders ─────────────────────────────────────────────────────────
+def split_key(ds_spec: Dict) -> Tuple:
+    """
+    Identity of a dataset + train/test split. Specs with equal keys produce
+    identical arrays from load_split, so callers can load once and share.
+    """
+    name = ds_spec.get("name", "")
+    if name and name in DATASET_CONFIGS:
+        cfg = DATASET_CONFIGS[name]
+        path = str(Path(cfg["path"]).resolve())
+        label_col = ds_spec.get("label_column", cfg["label_column"])
+        feature_cols = ds_spec.get("feature_columns") or cfg["feature_columns"]
+    else:
+        p = Path(ds_spec.get("path") or "")
+        path = str((p if p.is_absolute() else ROOT_DIR / p).resolve())
+        label_col = ds_spec.get("label_column")
+        feature_cols = ds_spec.get("feature_columns") or []
+    return (
+        path,
+        label_col,
+        tuple(feature_cols),
+        float(ds_spec.get("test_size", 0.25)),
+        int(ds_spec.get("seed", 42)),
+    )
+
+
+def load_split(ds_spec: Dict) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Load the dataset and return the unscaled (X_train, X_test, y_train, y_test)."""
+    X, y = _resolve_dataset(ds_spec)
+    test_size = float(ds_spec.get("test_size", 0.25))
+    seed = int(ds_spec.get("seed", 42))
+    return tuple(train_test_split(
+        X, y, test_size=test_size, random_state=seed,
+        stratify=y if len(np.unique(y)) == 2 else None,
+    ))
 
-def _build_feature_map(n_features: int, enc_spec: Dict, stack: Dict):
-    """Build a Qiskit feature map from encoder spec. All types are genuine."""
-    enc_type = (enc_spec.get("type") or "angle").lower()
-    reps = max(1, int(enc_spec.get("reps", 1)))
 
+# ─── Circuit builders ─────────────────────────────────────────────────────────
+
+def _make_feature_map(n_features: int, enc_type: str, reps: int, stack: Dict):
     if enc_type == "basis":
         return stack["PauliFeatureMap"](feature_dimension=n_features, reps=reps, paulis=["Z", "ZZ"])
     if enc_type == "iqp":
@@ -172,14 +232,7 @@ def _build_feature_map(n_features: int, enc_spec: Dict, stack: Dict):
     return stack["ZZFeatureMap"](feature_dimension=n_features, reps=reps)
 
 
-def _build_ansatz(n_qubits: int, circuit_spec: Dict, stack: Dict):
-    """
-    Build the variational ansatz from circuit spec.
-    Every branch is genuinely different — circuit_spec['type'] is always read.
-    """
-    reps = max(1, int(circuit_spec.get("reps", 2)))
-    circuit_type = (circuit_spec.get("type") or "realamplitudes").lower()
-
+def _make_ansatz(n_qubits: int, circuit_type: str, reps: int, stack: Dict):
     if circuit_type == "efficientsu2":
         cls = stack.get("EfficientSU2")
         if cls is None:
@@ -205,13 +258,54 @@ def _build_ansatz(n_qubits: int, circuit_spec: Dict, stack: Dict):
     return stack["RealAmplitudes"](num_qubits=n_qubits, reps=reps, entanglement=entanglement)
 
 
-def _build_optimizer(opt_spec: Dict, stack: Dict):
+@functools.lru_cache(maxsize=128)
+def _circuit_template(kind: str, n_qubits: int, circuit_type: str, reps: int):
+    """Built feature map / ansatz, shared per configuration; callers get a copy."""
+    make = _make_feature_map if kind == "feature_map" else _make_ansatz
+    circuit = make(n_qubits, circuit_type, reps, _load_quantum_stack())
+    circuit.num_parameters  # library circuits build lazily; build the template now
+    return circuit
+
+
+def _build_feature_map(n_features: int, enc_spec: Dict):
+    """Build a Qiskit feature map from encoder spec. All types are genuine."""
+    enc_type = (enc_spec.get("type") or "angle").lower()
+    reps = max(1, int(enc_spec.get("reps", 1)))
+    return _circuit_template("feature_map", n_features, enc_type, reps).copy()
+
+
+def _build_ansatz(n_qubits: int, circuit_spec: Dict):
+    """
+    Build the variational ansatz from circuit spec.
+    Every branch is genuinely different — circuit_spec['type'] is always read.
+    """
+    reps = max(1, int(circuit_spec.get("reps", 2)))
+    circuit_type = (circuit_spec.get("type") or "realamplitudes").lower()
+    return _circuit_template("ansatz", n_qubits, circuit_type, reps).copy()
+
+
+def _build_optimizer(opt_spec: Dict, stack: Dict, minibatch=None):
     """Build optimizer from spec. Falls back gracefully if a class isn't installed."""
     opt_type = (opt_spec.get("type") or "cobyla").lower()
     maxiter = max(1, int(opt_spec.get("maxiter", 20)))
 
     if opt_type == "spsa":
-        return stack["SPSA"](maxiter=maxiter)
+        from .batched_spsa import BatchedSPSA
+        return BatchedSPSA(
+            maxiter=maxiter,
+            resamplings=int(opt_spec.get("resamplings", 1)),
+            seed=opt_spec.get("seed"),
+        )
+    if opt_type == "cmaes":
+        population = opt_spec.get("population")
+        return CMAES(
+            maxiter=maxiter,
+            population=int(population) if population is not None else None,
+            sigma0=float(opt_spec.get("sigma0", 0.5)),
+            seed=opt_spec.get("seed"),
+            # Per-generation batches make candidate losses incomparable across generations.
+            keep_best=minibatch is None,
+        )
     if opt_type == "adam":
         cls = stack.get("ADAM")
         if cls:
@@ -230,13 +324,86 @@ def _build_optimizer(opt_spec: Dict, stack: Dict):
     return stack["COBYLA"](maxiter=maxiter)
 
 
-def _build_sampler(exec_spec: Dict, stack: Dict):
-    shots = max(32, int(exec_spec.get("shots", 128)))
-    backend = stack["AerSimulator"]()
+# ─── Sampler and transpilation ────────────────────────────────────────────────
+
+def parse_shots(exec_spec: Dict) -> Optional[int]:
+    """execution.shots as an int (at least 32), or None for exact probabilities."""
+    shots = exec_spec.get("shots", 128)
+    if isinstance(shots, str) and shots.strip().lower() == "exact":
+        shots = None
+    if shots in EXACT_SHOTS:
+        return None
+    return max(32, int(shots))
+
+
+def _build_sampler(
+    exec_spec: Dict,
+    stack: Dict,
+    n_qubits: int = 0,
+    threads: int | None = None,
+    batch_size: int | None = None,
+):
+    """
+    Returns (sampler, AerSimulator it runs on, shots). The simulator follows
+    the spec's method / precision / fusion / max_parallel_* settings (see
+    aer_config). ``threads`` caps Aer's OpenMP parallelism (see thread_budget)
+    for jobs of ``batch_size`` circuits; None leaves Aer's default.
+
+    Exact mode (shots None) uses Aer's V1 Sampler with shots=None, which reads
+    the probabilities straight from the final statevector. It is the only
+    sampler VQC accepts that returns probabilities rather than counts; the
+    circuits are already transpiled by _pass_manager(), so it skips its own pass.
+    It cannot be handed a simulator, so it gets the same options instead; the
+    returned AerSimulator describes the run and feeds ParameterShiftNetwork.
+    """
+    shots = parse_shots(exec_spec)
+    caps = parallel_caps(exec_spec)
+    options = {
+        **simulator_options(exec_spec, n_qubits),
+        **(aer_thread_options(threads, n_qubits, batch_size, caps) if threads is not None else caps),
+    }
+    backend = stack["AerSimulator"](**options)
+    if shots is None:
+        # The V1 sampler builds its own simulator from the same options.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            sampler = stack["AerSampler"](
+                backend_options=options, run_options={"shots": None}, skip_transpilation=True,
+            )
+        return sampler, backend, None
     sampler = stack["BackendSamplerV2"](backend=backend, options={"default_shots": shots})
     return sampler, backend, shots
 
 
+class _SerialPassManager:
+    """
+    The process's preset pass manager behind a lock. Passes keep the running
+    property set on the instance, so two threads must not run it at once;
+    transpiling a circuit takes milliseconds, so they take turns instead of
+    each building their own.
+    """
+
+    def __init__(self, pass_manager):
+        self._pass_manager = pass_manager
+        self._lock = threading.Lock()
+
+    def run(self, circuits, *args, **kwargs):
+        with self._lock:
+            return self._pass_manager.run(circuits, *args, **kwargs)
+
+
+@functools.lru_cache(maxsize=1)
+def _pass_manager() -> _SerialPassManager:
+    """
+    Preset pass manager for AerSimulator, built once per process. Generating
+    one takes ~0.1 s and every AerSimulator has the same target; the sandbox
+    forkserver builds it (backend.preload) so training runs inherit it.
+    """
+    stack = _load_quantum_stack()
+    pm = stack["generate_preset_pass_manager"](backend=stack["AerSimulator"](), optimization_level=1)
+    return _SerialPassManager(pm)
+
+
 # ─── Model persistence ────────────────────────────────────────────────────────
 
 def _save_model(classifier, scaler, feature_columns: list, spec: Dict) -> str:
@@ -258,9 +425,10 @@ def _save_model(classifier, scaler, feature_columns: list, spec: Dict) -> str:
     return model_id
 
 
-def rebuild_classifier(weights: np.ndarray, spec: Dict) -> Any:
+def rebuild_classifier(weights: np.ndarray, spec: Dict, threads: int | None = None) -> Any:
     """
     Reconstruct a fitted VQC from saved weights and the original pipeline spec.
+    ``threads`` caps the simulator's thread count for predictions.
 
     VQC.weights has no setter in qiskit-machine-learning 0.7+.  The property
     reads from self._fit_result.x, so we build a minimal OptimizerResult and
@@ -279,19 +447,17 @@ def rebuild_classifier(weights: np.ndarray, spec: Dict) -> Any:
     opt_spec  = spec.get("optimizer") or {}
     exec_spec = spec.get("execution") or {}
 
-    feature_map = _build_feature_map(n_features, enc_spec, stack)
-    ansatz      = _build_ansatz(n_features, cir_spec, stack)
+    feature_map = _build_feature_map(n_features, enc_spec)
+    ansatz      = _build_ansatz(n_features, cir_spec)
     optimizer   = _build_optimizer(opt_spec, stack)
-    sampler, aer_backend, _ = _build_sampler(exec_spec, stack)
+    sampler, _, _ = _build_sampler(exec_spec, stack, n_features, threads)
 
     vqc = stack["VQC"](
         feature_map=feature_map,
         ansatz=ansatz,
         optimizer=optimizer,
         sampler=sampler,
-        pass_manager=stack["generate_preset_pass_manager"](
-            backend=aer_backend, optimization_level=1
-        ),
+        pass_manager=_pass_manager(),
     )
 
     # Inject saved weights via the internal _fit_result attribute.
@@ -306,10 +472,28 @@ def rebuild_classifier(weights: np.ndarray, spec: Dict) -> Any:
 
 # ─── Main pipeline entry point ────────────────────────────────────────────────
 
-def run_pipeline(spec: Dict[str, Any]) -> Dict[str, Any]:
+def _emit(progress: ProgressCallback | None, event: Dict[str, Any]) -> None:
+    if progress is not None:
+        progress(event)
+
+
+def run_pipeline(
+    spec: Dict[str, Any],
+    split: Tuple | None = None,
+    progress: ProgressCallback | None = None,
+    should_stop: StopCheck | None = None,
+) -> Dict[str, Any]:
     """
     Execute a full VQC training run from a pipeline spec dict.
     Returns a dashboard-ready metrics dict including model_id for prediction.
+
+    ``split`` optionally supplies the (X_train, X_test, y_train, y_test) arrays
+    already produced by load_split for this spec's dataset, so batch callers
+    can load and split a shared dataset once. ``progress`` is called with an
+    event dict for every objective evaluation and at each stage change.
+    ``should_stop`` is polled before each evaluation; when it returns a reason,
+    training ends early and the model keeps the best weights seen so far
+    (reported as ``stopped`` in the result).
     """
     t_start = time.time()
     stack = _load_quantum_stack()
@@ -318,16 +502,11 @@ def run_pipeline(spec: Dict[str, Any]) -> Dict[str, Any]:
     ds_spec = spec.get("dataset") or {}
     if not ds_spec:
         raise ValueError("dataset configuration is required.")
-    X, y = _resolve_dataset(ds_spec)
 
-    test_size = float(ds_spec.get("test_size", 0.25))
     seed = int(ds_spec.get("seed", 42))
     feature_columns = ds_spec.get("feature_columns", [])
 
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=test_size, random_state=seed,
-        stratify=y if len(np.unique(y)) == 2 else None,
-    )
+    X_train, X_test, y_train, y_test = split if split is not None else load_split(ds_spec)
 
     # ── 2. Preprocess ────────────────────────────────────────────────────────
     scaler = StandardScaler()
@@ -349,37 +528,94 @@ def run_pipeline(spec: Dict[str, Any]) -> Dict[str, Any]:
     opt_spec = spec.get("optimizer") or {}
     exec_spec = spec.get("execution") or {}
     framework = str(spec.get("framework", "qiskit")).lower()
-
-    feature_map = _build_feature_map(n_features, enc_spec, stack)
-    ansatz = _build_ansatz(n_features, cir_spec, stack)
-    optimizer = _build_optimizer(opt_spec, stack)
-    sampler, aer_backend, shots = _build_sampler(exec_spec, stack)
+    engine = str(exec_spec.get("engine") or "sampler").lower()
+    if engine not in TRAINING_ENGINES:
+        raise ValueError(f"execution.engine must be one of {list(TRAINING_ENGINES)}, got '{engine}'.")
+    # optimizer.early_stopping may hold validation rows out of training (see early_stopping.py).
+    early_stopping = early_stopping_from_spec(opt_spec, seed)
+    n_fit = len(X_train) - (early_stopping.holdout_rows(len(X_train)) if early_stopping else 0)
+    # optimizer.batch_size: each objective evaluation sees that many rows (see minibatch.py).
+    minibatch = minibatch_settings(opt_spec, n_fit, seed)
+    if minibatch and early_stopping and not early_stopping.validation_split:
+        # Each iteration's training loss would come from a different batch: too noisy to watch.
+        raise ValueError("optimizer.early_stopping with optimizer.batch_size needs a validation_split.")
+    rows_per_evaluation = minibatch.batch_size if minibatch else n_fit
+
+    feature_map = _build_feature_map(n_features, enc_spec)
+    ansatz = _build_ansatz(n_features, cir_spec)
+    optimizer = _build_optimizer(opt_spec, stack, minibatch)
+    sampler, aer_backend, shots = _build_sampler(exec_spec, stack, n_features, batch_size=rows_per_evaluation)
+    # In a sandboxed run, follow this process's share of the thread budget. The
+    # exact-mode V1 sampler runs on its own simulator: its run options reach it.
+    follow_thread_budget = ThreadFollower(
+        aer_backend if shots is not None else sampler, n_features,
+        batch_size=rows_per_evaluation, caps=parallel_caps(exec_spec),
+    )
+    follow_thread_budget()
 
     logger.info(
         f"Running VQC | encoder={enc_spec.get('type','angle')} | "
         f"ansatz={cir_spec.get('type','realamplitudes')} | "
         f"optimizer={opt_spec.get('type','cobyla')} | "
-        f"qubits={n_features} | shots={shots} | "
+        f"qubits={n_features} | shots={shots or 'exact'} | engine={engine} | "
+        f"method={aer_backend.options.method} | precision={aer_backend.options.precision} | "
         f"maxiter={opt_spec.get('maxiter',20)}"
     )
 
     # ── 4. Train VQC ─────────────────────────────────────────────────────────
-    loss_history: list[float] = []
-
-    def _callback(_weights, obj_val):
-        loss_history.append(float(obj_val))
+    # Every objective evaluation goes through the monitor, which feeds both
+    # loss_history and the optional live progress stream.
+    maxiter = max(1, int(opt_spec.get("maxiter", 20)))
+    monitor = TrainingMonitor(
+        expected_evaluations(
+            opt_spec.get("type", "cobyla"),
+            maxiter,
+            resamplings=int(opt_spec.get("resamplings", 1)),
+            population=int(opt_spec.get("population") or default_population(ansatz.num_parameters)),
+        ),
+        on_progress=progress,
+        should_stop=should_stop,
+        before_evaluation=follow_thread_budget,
+        early_stopping=early_stopping,
+    )
+    _emit(progress, {"type": "stage", "stage": "training", "n_train": int(len(X_train)),
+                     "n_qubits": n_features, "maxiter": maxiter})
 
-    classifier = stack["VQC"](
+    if engine == "cached_states":
+        from .cached_states import CachedStateVQC
+        vqc_cls = CachedStateVQC
+    else:
+        from .parameter_shift import ParameterShiftVQC
+        vqc_cls = ParameterShiftVQC
+    classifier = vqc_cls(
         feature_map=feature_map,
         ansatz=ansatz,
-        optimizer=optimizer,
+        optimizer=MonitoredOptimizer(optimizer, monitor),
         sampler=sampler,
-        callback=_callback,
-        pass_manager=stack["generate_preset_pass_manager"](
-            backend=aer_backend, optimization_level=1
-        ),
+        pass_manager=_pass_manager(),
     )
+    classifier.minibatch = minibatch
+    classifier.early_stopping = early_stopping
+    classifier.aer_backend = aer_backend
+    t_train = time.time()
     classifier.fit(X_train, y_train)
+    training_time = time.time() - t_train
+    loss_history = monitor.loss_history
+    if minibatch and minibatch.full_eval_every:
+        # Mini-batch losses are noisy; chart the periodic full-data losses instead.
+        loss_history = classifier.training_objective.full_loss_history
+    if monitor.stopped:
+        logger.warning(
+            f"Training stopped early ({monitor.stopped}) after {monitor.steps} evaluations; "
+            f"keeping best loss {monitor.best_loss:.4f}"
+        )
+    elif early_stopping is not None and early_stopping.stopped_at is not None:
+        logger.info(
+            f"Early stopping at iteration {early_stopping.stopped_at}; "
+            f"keeping iteration {early_stopping.best_iteration} (loss {early_stopping.best_loss:.4f})"
+        )
+    _emit(progress, {"type": "stage", "stage": "evaluating", "stopped": monitor.stopped,
+                     "elapsed_s": round(time.time() - t_start, 3)})
 
     # ── 5. Evaluate ──────────────────────────────────────────────────────────
     train_preds = classifier.predict(X_train)
@@ -419,7 +655,7 @@ def run_pipeline(spec: Dict[str, Any]) -> Dict[str, Any]:
     base_loss = float(log_loss(y_train, baseline.predict_proba(X_train)))
 
     # ── 7. Build training curves ──────────────────────────────────────────────
-    # loss_history contains real Qiskit VQC objective callback values.
+    # loss_history contains the real VQC objective values seen by the optimizer.
     # We pad/extend to match requested epochs for a consistent chart length.
     requested_epochs = max(1, int(opt_spec.get("maxiter", 20)))
     observed_loss = [float(v) for v in loss_history]
@@ -457,6 +693,10 @@ def run_pipeline(spec: Dict[str, Any]) -> Dict[str, Any]:
         "provider": "aer",
         "backend": "qiskit-aer",
         "shots": shots,
+        "sampling": "shots" if shots else "exact",
+        "engine": engine,
+        "simulation_method": aer_backend.options.method,
+        "simulation_precision": aer_backend.options.precision,
         "n_qubits": n_features,
         "n_train": int(len(X_train)),
         "n_test": int(len(X_test)),
@@ -474,6 +714,15 @@ def run_pipeline(spec: Dict[str, Any]) -> Dict[str, Any]:
         "loss_history": final_loss_curve,
         "accuracy_history": accuracy_curve,
         "loss_history_real_points": n_observed,
+        "optimizer_stats": _optimizer_stats(classifier, monitor, training_time),
+        "minibatch": _minibatch_stats(classifier, minibatch),
+        # Where optimizer.early_stopping stopped and the evaluations it saved against maxiter.
+        "early_stopping": (
+            early_stopping.summary(maxiter, monitor.steps, monitor.expected_steps) if early_stopping else None
+        ),
+        # Set when training ended early (cancelled, timeout, cpu_limit, memory_limit);
+        # the saved model then holds the best weights seen before the stop.
+        "stopped": monitor.stopped,
         # Classical baseline
         "baseline": {
             "model": "logistic_regression",
@@ -502,6 +751,34 @@ def run_pipeline(spec: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _optimizer_stats(classifier, monitor: TrainingMonitor, training_time: float) -> Dict[str, Any]:
+    """Iterations, evaluations, circuits executed and wall time of the training run."""
+    fit_result = classifier.fit_result
+    network = classifier.training_network
+    return {
+        # Optimizers that do not count iterations (COBYLA) report their evaluations.
+        "iterations": int(fit_result.nit if fit_result.nit is not None else monitor.steps),
+        "evaluations": monitor.steps,  # one per loss_history point
+        "gradient_evaluations": network.gradient_evaluations,
+        "circuits_executed": network.circuits_executed,
+        "training_time_s": round(training_time, 3),
+    }
+
+
+def _minibatch_stats(classifier, minibatch) -> Optional[Dict[str, Any]]:
+    """Batch size, sampling and batches drawn of a mini-batch run; None for full-data training."""
+    if minibatch is None:
+        return None
+    objective = classifier.training_objective
+    return {
+        "batch_size": minibatch.batch_size,
+        "sampling": minibatch.sampling,
+        "full_eval_every": minibatch.full_eval_every,
+        "batches": objective.batches_drawn,
+        "full_evaluations": len(objective.full_loss_history),
+    }
+
+
 # ─── Backends listing ─────────────────────────────────────────────────────────
 
 def list_execution_backends() -> Dict[str, Any]:
@@ -513,6 +790,8 @@ def list_execution_backends() -> Dict[str, Any]:
                 "label": "Local Aer Simulator",
                 "available": True,
                 "note": "Runs locally — no credentials required.",
+                # execution.* settings this backend understands (see aer_config)
+                "options": describe_options(),
             }
         ],
         "default": "aer",
@@ -0,0 +1,117 @@
+"""
+Content-addressed result cache for run_pipeline.
+
+run_pipeline is deterministic for a given spec, dataset content and seed, so a
+finished result is stored under the spec fingerprint (see fingerprint.py) and
+served again — metrics plus the already-saved model_id — without retraining.
+Entries are evicted least-recently-used once their total JSON size exceeds
+RESULT_CACHE_MB. A spec with ``"cache": "bypass"`` skips the lookup and
+retrains; its fresh result replaces the stored one.
+"""
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .quantum_runner import MODELS_DIR
+
+logger = logging.getLogger(__name__)
+
+RESULT_CACHE_MB = float(os.getenv("RESULT_CACHE_MB", "64"))
+
+# Per-request fields that are not part of the cached training result.
+_VOLATILE_KEYS = {"request_id", "coalesced", "coalesced_callers", "cache"}
+
+
+def cache_bypassed(spec: Dict[str, Any]) -> bool:
+    return str(spec.get("cache", "")).lower() == "bypass"
+
+
+class ResultCache:
+    """Thread-safe LRU map of spec fingerprint -> run_pipeline result, bounded by bytes."""
+
+    def __init__(self, max_bytes: int, models_dir: Path = MODELS_DIR):
+        self.max_bytes = int(max_bytes)
+        self.models_dir = Path(models_dir)
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._model_exists(entry[0]):
+                # The model file was removed — the result can no longer be served.
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry[0])
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        if result.get("status", "ok") != "ok" or not result.get("model_id"):
+            return
+        if result.get("stopped"):
+            return  # cut short by a cancel or limit — not what the spec would produce
+        stored = {k: v for k, v in result.items() if k not in _VOLATILE_KEYS}
+        size = len(json.dumps(stored, default=str))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (copy.deepcopy(stored), size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def note_bypass(self) -> None:
+        with self._lock:
+            self.bypasses += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypasses": self.bypasses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+    # ── internals (caller holds the lock) ────────────────────────────────────
+
+    def _drop(self, key: str) -> None:
+        _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def _model_exists(self, result: Dict[str, Any]) -> bool:
+        return (self.models_dir / f"{result['model_id']}.joblib").exists()
+
+
+RESULT_CACHE = ResultCache(max_bytes=int(RESULT_CACHE_MB * 1024 * 1024))
@@ -0,0 +1,258 @@
+"""
+Isolated execution of run_pipeline.
+
+Every training run gets its own child process, so a runaway spec can be
+stopped or killed without touching the web server. Children are forked from
+a forkserver that has already imported the Qiskit stack, which keeps the
+per-run start-up cost to a fork.
+
+Limits (env, 0 disables):
+    RUN_TIMEOUT_S        wall-clock budget; on expiry the run is asked to stop
+    RUN_CPU_LIMIT_S      RLIMIT_CPU; the soft limit (SIGXCPU) asks the run to stop
+    RUN_MEMORY_LIMIT_MB  RLIMIT_AS; a MemoryError during training stops the run
+    RUN_STOP_GRACE_S     time a stopped run gets to evaluate and save its model
+                         before it is killed
+
+A run that is asked to stop — by one of the limits above or by
+StopSignal.request("cancelled") — finishes with the best weights seen so far
+and reports the reason in ``result["stopped"]``.
+"""
+from __future__ import annotations
+
+import builtins
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .thread_budget import THREAD_BUDGET, bind_child
+from .training_monitor import ProgressCallback
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+RUN_TIMEOUT_S = float(os.getenv("RUN_TIMEOUT_S", "900"))
+RUN_CPU_LIMIT_S = float(os.getenv("RUN_CPU_LIMIT_S", "0"))
+RUN_MEMORY_LIMIT_MB = float(os.getenv("RUN_MEMORY_LIMIT_MB", "4096"))
+RUN_STOP_GRACE_S = float(os.getenv("RUN_STOP_GRACE_S", "30"))
+
+# Index 0 means "keep going"; the rest are reasons a run can be asked to stop.
+STOP_REASONS = (None, "cancelled", "timeout", "cpu_limit")
+
+# Imported once in the forkserver so every run starts with a warm stack;
+# backend.preload also builds the circuit templates and the pass manager.
+_PRELOAD = [
+    "backend.quantum_runner",
+    "backend.preload",
+    "qiskit.circuit.library",
+    "qiskit.primitives",
+    "qiskit.transpiler.preset_passmanagers",
+    "qiskit_aer",
+    "qiskit_algorithms.optimizers",
+    "qiskit_machine_learning.algorithms.classifiers",
+]
+
+
+class RunAborted(RuntimeError):
+    """The child process ended without returning a result (killed or crashed)."""
+
+
+def _mp_context():
+    """
+    forkserver where available: children are forked from a clean single-threaded
+    server process rather than from the multi-threaded web server.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(_PRELOAD)
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+def start_forkserver() -> None:
+    """Start the forkserver and its preloaded imports now instead of on the first run."""
+    ctx = _mp_context()
+    if ctx.get_start_method() == "forkserver":
+        from multiprocessing import forkserver
+        forkserver.ensure_running()
+
+
+def default_limits() -> Dict[str, float]:
+    return {
+        "timeout_s": RUN_TIMEOUT_S,
+        "cpu_s": RUN_CPU_LIMIT_S,
+        "memory_mb": RUN_MEMORY_LIMIT_MB,
+        "grace_s": RUN_STOP_GRACE_S,
+    }
+
+
+class StopSignal:
+    """Stop flag shared with a run's child process; the first reason set wins."""
+
+    def __init__(self):
+        self._value = _mp_context().Value("i", 0)
+
+    def request(self, reason: str) -> None:
+        with self._value.get_lock():
+            if self._value.value == 0:
+                self._value.value = STOP_REASONS.index(reason)
+
+    def reason(self) -> Optional[str]:
+        return STOP_REASONS[self._value.value]
+
+
+# ─── Child process ────────────────────────────────────────────────────────────
+
+def _set_limit(kind: int, soft: int, hard: int) -> None:
+    _, current_hard = resource.getrlimit(kind)
+    if current_hard != resource.RLIM_INFINITY:
+        soft, hard = min(soft, current_hard), min(hard, current_hard)
+    resource.setrlimit(kind, (soft, hard))
+
+
+def _apply_limits(limits: Dict[str, float], stop: StopSignal) -> None:
+    if resource is None:
+        return
+    if limits.get("memory_mb"):
+        limit = int(limits["memory_mb"] * 1024 * 1024)
+        _set_limit(resource.RLIMIT_AS, limit, limit)
+    if limits.get("cpu_s"):
+        # SIGXCPU at the soft limit asks the run to stop; the kernel kills it
+        # at the hard limit if it has not finished within the grace period.
+        signal.signal(signal.SIGXCPU, lambda *_: stop.request("cpu_limit"))
+        soft = int(limits["cpu_s"])
+        _set_limit(resource.RLIMIT_CPU, soft, soft + max(1, int(limits.get("grace_s") or 0)))
+
+
+def _child_main(conn, spec: Dict[str, Any], split: Optional[Tuple], stop: StopSignal,
+                limits: Dict[str, float], threads, models_dir: str) -> None:
+    try:
+        _apply_limits(limits, stop)
+        bind_child(threads)
+        from . import quantum_runner
+        from .quantum_runner import run_pipeline
+
+        # Save where the parent serves models from, not where the forkserver started.
+        quantum_runner.MODELS_DIR = Path(models_dir)
+
+        result = run_pipeline(
+            spec, split=split, progress=lambda event: conn.send(("event", event)),
+            should_stop=stop.reason,
+        )
+        result.setdefault("status", "ok")
+        conn.send(("result", result))
+    except BaseException as exc:
+        conn.send(("error", (type(exc).__name__, str(exc) or type(exc).__name__)))
+    finally:
+        conn.close()
+
+
+# ─── Parent side ──────────────────────────────────────────────────────────────
+
+def _raise_child_error(type_name: str, message: str):
+    # Re-raise built-in exception types as themselves so the API layer can still
+    # tell validation (ValueError) and dependency (ImportError) errors apart.
+    exc_type = getattr(builtins, type_name, None)
+    if isinstance(exc_type, type) and issubclass(exc_type, Exception):
+        try:
+            exc = exc_type(message)
+        except TypeError:  # constructor needs more than a message
+            exc = None
+        if exc is not None:
+            raise exc
+    raise RuntimeError(message)
+
+
+def _label(spec: Dict[str, Any]) -> str:
+    return (spec.get("dataset") or {}).get("name") or "run"
+
+
+def _models_dir() -> str:
+    from .quantum_runner import MODELS_DIR
+    return str(MODELS_DIR)
+
+
+def _supervise(ctx, spec, split, progress, stop: StopSignal, limits, lease):
+    """Start the child, relay its events and enforce the limits; returns (process, outcome)."""
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(
+        target=_child_main, args=(send_conn, spec, split, stop, limits, lease.shared, _models_dir()),
+        daemon=True,
+    )
+    proc.start()
+    lease.pid = proc.pid
+    send_conn.close()
+
+    deadline = time.time() + limits["timeout_s"] if limits.get("timeout_s") else None
+    kill_at = None
+    outcome = None
+    try:
+        while outcome is None:
+            now = time.time()
+            if deadline is not None and now >= deadline:
+                stop.request("timeout")
+            if kill_at is None and stop.reason() is not None:
+                kill_at = now + limits["grace_s"]
+            if kill_at is not None and now >= kill_at:
+                logger.warning(f"Run pid={proc.pid} ignored stop ({stop.reason()}) — killing it")
+                proc.kill()
+                break
+            if not recv_conn.poll(0.25):
+                if not proc.is_alive() and not recv_conn.poll():
+                    break
+                continue
+            try:
+                kind, payload = recv_conn.recv()
+            except EOFError:
+                break
+            if kind == "event":
+                if progress is not None:
+                    progress(payload)
+            else:
+                outcome = (kind, payload)
+    finally:
+        recv_conn.close()
+        proc.join(timeout=5)
+        if proc.is_alive():
+            proc.kill()
+            proc.join()
+
+    return proc, outcome
+
+
+def run_isolated(
+    spec: Dict[str, Any],
+    split: Optional[Tuple] = None,
+    progress: Optional[ProgressCallback] = None,
+    stop: Optional[StopSignal] = None,
+    limits: Optional[Dict[str, float]] = None,
+) -> Dict[str, Any]:
+    """
+    Run run_pipeline(spec) in a resource-limited child process and return its result.
+    Progress events from the child are passed to ``progress`` as they arrive.
+    """
+    limits = {**default_limits(), **(limits or {})}
+    stop = stop or StopSignal()
+    ctx = _mp_context()
+    with THREAD_BUDGET.lease(_label(spec), shared=ctx.Value("i", 0)) as lease:
+        proc, outcome = _supervise(ctx, spec, split, progress, stop, limits, lease)
+
+    if outcome is None:
+        reason = stop.reason()
+        if reason is not None:
+            raise RunAborted(f"Run was killed after it was stopped ({reason}) and did not finish.")
+        raise RunAborted(
+            f"Run process exited unexpectedly (exit code {proc.exitcode}); "
+            "it may have exceeded its memory or CPU limit."
+        )
+    kind, payload = outcome
+    if kind == "error":
+        _raise_child_error(*payload)
+    return payload
@@ -0,0 +1,161 @@
+"""
+Priority scheduler for request work.
+
+Every API call that does real work takes a slot in one of three priority
+classes before it runs:
+
+    interactive — /api/predict, /api/analyze          (highest)
+    train       — /api/run, single /api/jobs runs
+    batch       — /api/run/batch and sweeps            (lowest)
+
+Each class has its own concurrency limit and queue bound, and all classes
+share an overall limit. When a slot frees up it goes to the waiting request
+of the highest-priority class that is eligible, so a scoring request never
+queues behind training. A class whose queue is full rejects new work with
+SchedulerBusy instead of tying up more server threads.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+PRIORITY_CLASSES = ("interactive", "train", "batch")
+
+
+class SchedulerBusy(RuntimeError):
+    """Raised when a priority class already has its maximum number of queued requests."""
+
+
+def _env_int(name: str, default: int) -> int:
+    return max(0, int(os.getenv(name, str(default))))
+
+
+def _percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    idx = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+class PriorityScheduler:
+    def __init__(
+        self,
+        limits: Dict[str, int],
+        max_queued: Dict[str, int],
+        total_limit: Optional[int] = None,
+        history: int = 1000,
+    ):
+        unknown = set(limits) - set(PRIORITY_CLASSES)
+        if unknown:
+            raise ValueError(f"Unknown priority class(es): {sorted(unknown)}")
+        self.limits = {c: max(1, int(limits.get(c, 1))) for c in PRIORITY_CLASSES}
+        self.max_queued = {c: int(max_queued.get(c, 0)) for c in PRIORITY_CLASSES}
+        self.total_limit = int(total_limit) if total_limit else sum(self.limits.values())
+        self._cond = threading.Condition()
+        self._active = {c: 0 for c in PRIORITY_CLASSES}
+        self._waiting: Dict[str, deque] = {c: deque() for c in PRIORITY_CLASSES}
+        self._completed = {c: 0 for c in PRIORITY_CLASSES}
+        self._rejected = {c: 0 for c in PRIORITY_CLASSES}
+        self._waits = {c: deque(maxlen=history) for c in PRIORITY_CLASSES}
+        self._seq = itertools.count()
+
+    @contextmanager
+    def slot(self, cls: str) -> Iterator[float]:
+        """Hold a slot in ``cls`` for the duration of the block; yields the wait in seconds."""
+        waited = self.acquire(cls)
+        try:
+            yield waited
+        finally:
+            self.release(cls)
+
+    def acquire(self, cls: str) -> float:
+        if cls not in self._active:
+            raise ValueError(f"Unknown priority class '{cls}'. Choose from {PRIORITY_CLASSES}")
+        t0 = time.perf_counter()
+        with self._cond:
+            if not self._can_start(cls, None):
+                if self.max_queued[cls] and len(self._waiting[cls]) >= self.max_queued[cls]:
+                    self._rejected[cls] += 1
+                    raise SchedulerBusy(
+                        f"The '{cls}' queue is full ({len(self._waiting[cls])} waiting, "
+                        f"{self._active[cls]} running). Retry shortly"
+                        + (" or submit through /api/jobs." if cls != "interactive" else ".")
+                    )
+                ticket = next(self._seq)
+                self._waiting[cls].append(ticket)
+                try:
+                    while not self._can_start(cls, ticket):
+                        self._cond.wait()
+                finally:
+                    self._waiting[cls].remove(ticket)
+            self._active[cls] += 1
+            waited = time.perf_counter() - t0
+            self._waits[cls].append(waited)
+            return waited
+
+    def release(self, cls: str) -> None:
+        with self._cond:
+            self._active[cls] -= 1
+            self._completed[cls] += 1
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            classes = {}
+            for c in PRIORITY_CLASSES:
+                waits = sorted(self._waits[c])
+                classes[c] = {
+                    "priority": PRIORITY_CLASSES.index(c),
+                    "limit": self.limits[c],
+                    "max_queued": self.max_queued[c],
+                    "active": self._active[c],
+                    "queued": len(self._waiting[c]),
+                    "completed": self._completed[c],
+                    "rejected": self._rejected[c],
+                    "wait_p50_ms": _ms(_percentile(waits, 0.50)),
+                    "wait_p99_ms": _ms(_percentile(waits, 0.99)),
+                }
+            return {
+                "total_limit": self.total_limit,
+                "active": sum(self._active.values()),
+                "classes": classes,
+            }
+
+    def _can_start(self, cls: str, ticket: Optional[int]) -> bool:
+        """Caller holds the lock. ``ticket`` is None for a request not yet queued."""
+        if self._active[cls] >= self.limits[cls]:
+            return False
+        if sum(self._active.values()) >= self.total_limit:
+            return False
+        queue = self._waiting[cls]
+        if queue and queue[0] != ticket:
+            return False  # FIFO within a class
+        # Defer to any higher-priority class that is waiting and could start now.
+        for higher in PRIORITY_CLASSES[:PRIORITY_CLASSES.index(cls)]:
+            if self._waiting[higher] and self._active[higher] < self.limits[higher]:
+                return False
+        return True
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return round(seconds * 1000.0, 2) if seconds is not None else None
+
+
+SCHEDULER = PriorityScheduler(
+    limits={
+        "interactive": _env_int("SCHED_INTERACTIVE_SLOTS", 4),
+        "train": _env_int("SCHED_TRAIN_SLOTS", 2),
+        "batch": _env_int("SCHED_BATCH_SLOTS", 1),
+    },
+    max_queued={
+        "interactive": _env_int("SCHED_INTERACTIVE_MAX_QUEUED", 0),
+        "train": _env_int("SCHED_TRAIN_MAX_QUEUED", 2),
+        "batch": _env_int("SCHED_BATCH_MAX_QUEUED", 1),
+    },
+    total_limit=_env_int("SCHED_TOTAL_SLOTS", 0) or None,
+)
@@ -0,0 +1,60 @@
+"""
+Single-flight request coalescing.
+
+Concurrent callers that ask for the same key share one execution: the first
+caller runs the function, later callers block until it finishes and receive
+a copy of the same result (or the same exception).
+"""
+from __future__ import annotations
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.callers = 1
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, int, bool]:
+        """
+        Run ``fn`` once per in-flight ``key``.
+        Returns (result, number of callers that shared the execution, shared),
+        where ``shared`` is True for callers that attached to another's run.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            shared = call is not None
+            if shared:
+                call.callers += 1
+            else:
+                call = self._calls[key] = _Call()
+
+        if shared:
+            call.done.wait()
+        else:
+            try:
+                call.result = fn()
+            except BaseException as exc:
+                call.error = exc
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return copy.deepcopy(call.result), call.callers, shared
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,71 @@
+import copy
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import app as app_module
+from app import app
+from backend.admission import AdmissionRejected, admit, estimate_cost
+from backend.test_jobs import SPEC, _wait_for
+
+pytest.importorskip('qiskit')
+
+
+@pytest.fixture
+def wide_spec(tmp_path):
+    rng = np.random.default_rng(0)
+    cols = [f'f{i}' for i in range(20)]
+    df = pd.DataFrame(rng.normal(size=(200, 20)), columns=cols)
+    df['y'] = (df['f0'] > 0).astype(int)
+    path = tmp_path / 'wide.csv'
+    df.to_csv(path, index=False)
+    return {
+        'dataset': {'path': str(path), 'label_column': 'y', 'feature_columns': cols},
+        'circuit': {'type': 'efficientsu2', 'reps': 5},
+        'optimizer': {'type': 'cobyla', 'maxiter': 500},
+    }
+
+
+def test_estimate_grows_with_each_knob():
+    base = estimate_cost(SPEC)
+    assert base['n_qubits'] == len(SPEC['dataset']['feature_columns'])
+    assert base['feature_map_depth'] > 0 and base['ansatz_depth'] > 0
+    for section, key, value in [('optimizer', 'maxiter', 20), ('circuit', 'reps', 3),
+                                ('execution', 'shots', 4096)]:
+        spec = copy.deepcopy(SPEC)
+        spec[section][key] = value
+        assert estimate_cost(spec)['estimated_seconds'] > base['estimated_seconds']
+
+
+def test_rejection_names_the_knob_to_lower():
+    spec = copy.deepcopy(SPEC)
+    spec['optimizer']['maxiter'] = 100000
+    with pytest.raises(AdmissionRejected) as exc:
+        admit(spec, budget_s=60)
+    top = exc.value.estimate['suggestions'][0]
+    assert top['knob'] == 'optimizer.maxiter' and top['max'] < 100000
+    assert 'optimizer.maxiter 100000 → ≤' in str(exc.value)
+    assert admit({**spec, 'optimizer': {'type': 'cobyla', 'maxiter': top['max']}}, budget_s=60)
+
+
+def test_oversized_job_is_rejected_with_422(wide_spec):
+    resp = app.test_client().post('/api/jobs', data=json.dumps(wide_spec),
+                                  content_type='application/json')
+    assert resp.status_code == 422
+    body = resp.get_json()
+    assert 'Lower one of' in body['error']
+    assert body['admission']['n_qubits'] == 20
+
+
+def test_slow_sync_run_is_queued_as_job(monkeypatch):
+    monkeypatch.setattr(app_module, 'ADMISSION_SYNC_MAX_S', 0.0)
+    client = app.test_client()
+    resp = client.post('/api/run', data=json.dumps({**SPEC, 'cache': 'bypass'}),
+                       content_type='application/json')
+    assert resp.status_code == 202
+    body = resp.get_json()
+    assert body['status_url'] == f"/api/jobs/{body['job_id']}"
+    assert body['admission']['estimated_seconds'] > 0
+    assert _wait_for(client, body['job_id'])['status'] in ('done', 'error')
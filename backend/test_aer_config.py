@@ -0,0 +1,74 @@
+import copy
+
+import pytest
+
+from backend.aer_config import parallel_caps, resolve_method, simulator_options
+from backend.quantum_runner import list_execution_backends
+from backend.test_jobs import SPEC
+
+pytest.importorskip('qiskit')
+
+from backend.quantum_runner import run_pipeline  # noqa: E402
+
+
+def test_auto_picks_method_by_qubit_count():
+    assert resolve_method({}, 4) == 'statevector'
+    assert resolve_method({'method': 'auto'}, 40) == 'matrix_product_state'
+    assert resolve_method({'method': 'Statevector'}, 40) == 'statevector'
+    assert simulator_options({}, 4) == {'method': 'statevector', 'precision': 'double'}
+
+
+def test_options_are_validated():
+    with pytest.raises(ValueError, match='execution.method'):
+        simulator_options({'method': 'density'}, 4)
+    with pytest.raises(ValueError, match='execution.precision'):
+        simulator_options({'precision': 'half'}, 4)
+    with pytest.raises(ValueError, match='fusion_enable'):
+        simulator_options({'fusion_enable': 'sometimes'}, 4)
+    with pytest.raises(ValueError, match='max_parallel_shots'):
+        parallel_caps({'max_parallel_shots': 0})
+    opts = simulator_options({'precision': 'single', 'fusion_enable': False, 'fusion_threshold': '10'}, 4)
+    assert opts['precision'] == 'single' and opts['fusion_enable'] is False and opts['fusion_threshold'] == 10
+    for text, expected in (('false', False), ('0', False), ('No', False), ('true', True), (1, True)):
+        assert simulator_options({'fusion_enable': text}, 4)['fusion_enable'] is expected
+
+
+def test_backends_advertise_options():
+    options = list_execution_backends()['backends'][0]['options']
+    assert 'matrix_product_state' in options['method']['values']
+    assert {'precision', 'fusion_enable', 'max_parallel_shots'} <= set(options)
+
+
+def test_run_uses_requested_simulator():
+    spec = copy.deepcopy(SPEC)
+    spec['execution'] = {'shots': 64, 'method': 'matrix_product_state', 'precision': 'single',
+                         'max_parallel_threads': 1}
+    result = run_pipeline(spec)
+    assert result['simulation_method'] == 'matrix_product_state'
+    assert result['simulation_precision'] == 'single'
+
+
+@pytest.mark.parametrize('shots', [None, 64])
+def test_sampler_and_reported_simulator_share_the_options(shots):
+    from backend.quantum_runner import _build_sampler, _load_quantum_stack
+
+    exec_spec = {'shots': shots, 'precision': 'single', 'fusion_enable': False}
+    sampler, backend, _ = _build_sampler(exec_spec, _load_quantum_stack(), 3)
+    assert backend.options.precision == 'single' and backend.options.fusion_enable is False
+    if shots is None:
+        # The V1 sampler owns its simulator; thread options reach it as run options.
+        sampler.set_options(max_parallel_threads=1)
+        probs = sampler.run([_measured_bell()]).result().quasi_dists[0]
+        assert probs == pytest.approx({0: 0.5, 3: 0.5})
+    else:
+        assert sampler.backend is backend
+
+
+def _measured_bell():
+    from qiskit import QuantumCircuit
+
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure_all()
+    return circuit
@@ -0,0 +1,56 @@
+import copy
+import json
+
+import pytest
+
+import app as app_module
+from app import app
+from backend.test_jobs import SPEC
+
+
+def _post_batch(client, specs):
+    return client.post('/api/run/batch', data=json.dumps(specs), content_type='application/json')
+
+
+@pytest.fixture
+def split_loads(monkeypatch):
+    """Dataset specs app.load_split was called with."""
+    calls = []
+    load_split = app_module.load_split
+    monkeypatch.setattr(app_module, 'load_split', lambda ds: calls.append(ds) or load_split(ds))
+    return calls
+
+
+def test_specs_sharing_a_dataset_load_it_once(split_loads):
+    pytest.importorskip('qiskit')
+    first = {**copy.deepcopy(SPEC), 'cache': 'bypass'}
+    second = {**copy.deepcopy(SPEC), 'cache': 'bypass', 'circuit': {'type': 'ry', 'reps': 1}}
+    body = _post_batch(app.test_client(), [first, second]).get_json()
+    assert body['datasets_loaded'] == 1 and len(split_loads) == 1
+    assert [r['status'] for r in body['batch_results']] == ['ok', 'ok']
+    assert body['wall_time_s'] > 0
+    assert body['sequential_time_s'] == round(sum(r['wall_time_s'] for r in body['batch_results']), 2)
+    assert body['speedup'] == round(body['sequential_time_s'] / body['wall_time_s'], 2)
+
+
+def test_invalid_spec_errors_without_failing_its_neighbours(split_loads):
+    pytest.importorskip('qiskit')
+    valid = {**copy.deepcopy(SPEC), 'cache': 'bypass'}
+    invalid = {**copy.deepcopy(SPEC), 'dataset': {}}
+    body = _post_batch(app.test_client(), [invalid, valid]).get_json()
+    results = body['batch_results']
+    assert [r['index'] for r in results] == [0, 1]
+    assert results[0]['status'] == 'error' and 'dataset' in results[0]['error']
+    assert results[1]['status'] == 'ok' and results[1]['result']['model_id']
+    assert body['datasets_loaded'] == 1
+
+
+def test_speedup_is_none_when_every_spec_fails():
+    body = _post_batch(app.test_client(), [{'dataset': {}}, {'dataset': {}}]).get_json()
+    assert all(r['status'] == 'error' for r in body['batch_results'])
+    assert body['speedup'] is None and body['datasets_loaded'] == 0
+
+
+@pytest.mark.parametrize('payload', [SPEC, [SPEC]])
+def test_batch_size_is_checked(payload):
+    assert _post_batch(app.test_client(), payload).status_code == 400
@@ -0,0 +1,59 @@
+import copy
+
+import numpy as np
+import pytest
+
+from backend.batched_spsa import BatchedSPSA
+from backend.cma_es import CMAES, default_population
+from backend.test_jobs import SPEC
+
+# (optimizer, maxiter for the quadratic, loss reduction it must reach, evaluations it makes)
+CONVERGENCE = [
+    pytest.param(BatchedSPSA, 200, 0.05, 2 * 200 + 1, id='spsa'),
+    pytest.param(CMAES, 60, 0.01, default_population(4) * 60, id='cmaes'),
+]
+
+
+@pytest.mark.parametrize('optimizer, maxiter, reduction, nfev', CONVERGENCE)
+def test_minimizes_without_batch_objective(quadratic, optimizer, maxiter, reduction, nfev):
+    result = optimizer(maxiter=maxiter, seed=0).minimize(quadratic, np.zeros(4))
+    assert result.fun < reduction * quadratic(np.zeros(4))
+    assert result.nfev == nfev
+
+
+@pytest.mark.parametrize('optimizer, points', [
+    pytest.param(BatchedSPSA(maxiter=5, resamplings=3, seed=0), 6, id='spsa'),
+    pytest.param(CMAES(maxiter=5, population=10, seed=0), 10, id='cmaes'),
+])
+def test_batch_objective_gets_every_point_of_an_iteration_at_once(quadratic, optimizer, points):
+    calls = []
+
+    def batch(weight_sets):
+        calls.append(len(weight_sets))
+        return np.array([quadratic(w) for w in weight_sets])
+
+    optimizer.minimize(quadratic, np.zeros(4), batch_fun=batch)
+    assert calls == [points] * 5
+
+
+@pytest.mark.parametrize('optimizer', [BatchedSPSA, CMAES], ids=['spsa', 'cmaes'])
+def test_seed_makes_runs_reproducible(quadratic, optimizer):
+    first = optimizer(maxiter=10, seed=3).minimize(quadratic, np.zeros(3)).x
+    second = optimizer(maxiter=10, seed=3).minimize(quadratic, np.zeros(3)).x
+    np.testing.assert_array_equal(first, second)
+
+
+@pytest.mark.parametrize('opt_spec, points, iterations, evaluations', [
+    pytest.param({'type': 'spsa', 'maxiter': 4, 'resamplings': 2}, 4, 4, 2 * 2 * 4 + 1, id='spsa'),
+    pytest.param({'type': 'cmaes', 'maxiter': 3, 'population': 6}, 6, 3, 6 * 3, id='cmaes'),
+])
+def test_run_pipeline_submits_one_sampler_job_per_iteration(sampler_submissions, opt_spec, points,
+                                                            iterations, evaluations):
+    from backend.quantum_runner import run_pipeline
+
+    spec = copy.deepcopy(SPEC)
+    spec['optimizer'] = {**opt_spec, 'seed': 0}
+    result = run_pipeline(spec)
+    assert sampler_submissions == [points * result['n_train']] * iterations
+    assert result['loss_history_real_points'] == evaluations
+    assert result['optimizer_stats']['iterations'] == iterations
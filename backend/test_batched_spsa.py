@@ -0,0 +1,16 @@
+import numpy as np
+import pytest
+
+from backend.batched_spsa import BatchedSPSA
+
+
+def test_first_step_is_calibrated_to_target_magnitude():
+    x0 = np.zeros(6)
+    loss = lambda x: float(np.sum((x - np.arange(1, 7)) ** 2))  # noqa: E731
+    result = BatchedSPSA(maxiter=1, target_magnitude=0.5, seed=0).minimize(loss, x0)
+    assert np.linalg.norm(result.x - x0) == pytest.approx(0.5)
+
+
+def test_invalid_resamplings_raise():
+    with pytest.raises(ValueError, match='resamplings'):
+        BatchedSPSA(resamplings=0)
@@ -0,0 +1,112 @@
+import copy
+
+import numpy as np
+import pytest
+
+from backend.admission import estimate_cost
+from backend.test_jobs import SPEC
+
+pytest.importorskip('qiskit')
+
+from qiskit.quantum_info import Statevector  # noqa: E402
+
+from backend.cached_states import CachedStateNetwork, apply_circuit  # noqa: E402
+from backend.quantum_runner import _build_ansatz, _build_feature_map, run_pipeline  # noqa: E402
+
+
+def _reference_probabilities(feature_map, ansatz, X, weights):
+    out = []
+    for row in X:
+        circuit = feature_map.assign_parameters(row).compose(ansatz.assign_parameters(weights))
+        probs = Statevector(circuit).probabilities()
+        out.append([probs[0::2].sum(), probs[1::2].sum()])
+    return np.array(out)
+
+
+def test_network_matches_exact_statevector():
+    feature_map = _build_feature_map(3, {'type': 'zz', 'reps': 1})
+    ansatz = _build_ansatz(3, {'type': 'efficientsu2', 'reps': 1})
+    X = np.random.default_rng(0).normal(size=(5, 3))
+    weights = np.random.default_rng(1).normal(size=ansatz.num_parameters)
+    net = CachedStateNetwork(feature_map, ansatz)
+
+    np.testing.assert_allclose(net.forward(X, weights),
+                               _reference_probabilities(feature_map, ansatz, X, weights), atol=1e-12)
+
+    _, grad = net.backward(X, weights)
+    assert grad.shape == (5, 2, ansatz.num_parameters)
+    eps = 1e-6
+    step = np.zeros_like(weights)
+    step[2] = eps
+    numeric = (_reference_probabilities(feature_map, ansatz, X, weights + step)
+               - _reference_probabilities(feature_map, ansatz, X, weights - step)) / (2 * eps)
+    np.testing.assert_allclose(grad[:, :, 2], numeric, atol=1e-6)
+
+
+def test_apply_circuit_matches_statevector_evolve():
+    ansatz = _build_ansatz(4, {'type': 'realamplitudes', 'reps': 2}).decompose()
+    bound = ansatz.assign_parameters(np.linspace(0, 1, ansatz.num_parameters))
+    states = np.array([Statevector.from_label(label).data for label in ('0000', '0110', '1+0-')])
+    expected = np.array([Statevector(s).evolve(bound).data for s in states])
+    np.testing.assert_allclose(apply_circuit(states, bound), expected, atol=1e-12)
+
+
+def test_gradient_through_generic_gates_and_out_of_order_parameters():
+    from qiskit.circuit import Parameter, QuantumCircuit
+
+    z, b, c, a = (Parameter(name) for name in 'zbca')             # bound in sorted order: a, b, c, z
+    ansatz = QuantumCircuit(2)
+    ansatz.ry(z, 0)
+    ansatz.cx(0, 1)
+    ansatz.u(b, c, 0.3, 0)                                        # no closed form: rebuilt through UGate
+    ansatz.rz(a, 1)
+    feature_map = _build_feature_map(2, {'type': 'angle', 'reps': 1})
+    X = np.random.default_rng(0).normal(size=(3, 2))
+    weights = np.array([0.4, -1.1, 0.7, 2.0])
+    net = CachedStateNetwork(feature_map, ansatz)
+
+    np.testing.assert_allclose(net.forward(X, weights),
+                               _reference_probabilities(feature_map, ansatz, X, weights), atol=1e-12)
+    _, grad = net.backward(X, weights)
+    eps = 1e-6
+    for k in range(4):
+        step = np.eye(4)[k] * eps
+        numeric = (_reference_probabilities(feature_map, ansatz, X, weights + step)
+                   - _reference_probabilities(feature_map, ansatz, X, weights - step)) / (2 * eps)
+        np.testing.assert_allclose(grad[:, :, k], numeric, atol=1e-6)
+
+
+def test_evaluations_build_no_operators(monkeypatch):
+    feature_map = _build_feature_map(3, {'type': 'angle', 'reps': 1})
+    ansatz = _build_ansatz(3, {'type': 'efficientsu2', 'reps': 2})
+    net = CachedStateNetwork(feature_map, ansatz)
+    X = np.zeros((2, 3))
+    net.encoded_states(X)
+    monkeypatch.setattr('backend.cached_states.Operator', None)        # compiled at construction
+    weights = np.zeros(ansatz.num_parameters)
+    net.forward(X, weights)
+    net.backward(X, weights)
+
+
+def test_run_pipeline_with_cached_states_engine():
+    spec = copy.deepcopy(SPEC)
+    spec['execution'] = {'shots': 128, 'engine': 'cached_states'}
+    result = run_pipeline(spec)
+    assert result['engine'] == 'cached_states'
+    assert 0.0 <= result['accuracy'] <= 1.0
+    assert result['loss_history']
+
+
+def test_unknown_engine_is_rejected():
+    spec = copy.deepcopy(SPEC)
+    spec['execution'] = {'engine': 'gpu'}
+    with pytest.raises(ValueError, match='engine'):
+        run_pipeline(spec)
+
+
+def test_cached_states_estimate_is_cheaper():
+    spec = copy.deepcopy(SPEC)
+    spec['execution'] = {'shots': 128, 'engine': 'cached_states'}
+    cached = estimate_cost(spec)
+    assert cached['engine'] == 'cached_states'
+    assert cached['estimated_seconds'] < estimate_cost(SPEC)['estimated_seconds']
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from backend.cma_es import CMAES, default_population
+
+
+def test_default_population_grows_with_the_weight_count(quadratic):
+    assert default_population(4) < default_population(40)
+    result = CMAES(maxiter=2, seed=0).minimize(quadratic, np.zeros(4))
+    assert result.nfev == default_population(4) * 2
+
+
+def test_result_is_the_best_candidate_evaluated(quadratic):
+    result = CMAES(maxiter=60, seed=0).minimize(quadratic, np.zeros(4))
+    assert result.fun == pytest.approx(quadratic(result.x))
+
+
+def test_sigma0_sets_the_spread_of_the_first_generation(quadratic):
+    spreads = []
+    for sigma0 in (0.1, 1.0):
+        first = []
+        CMAES(maxiter=1, population=50, sigma0=sigma0, seed=0).minimize(
+            quadratic, np.zeros(4), batch_fun=lambda points: first.append(points) or np.zeros(len(points)))
+        spreads.append(first[0].std())
+    assert spreads[1] == pytest.approx(10 * spreads[0])
+
+
+@pytest.mark.parametrize('kwargs, match', [({'population': 3}, 'population'), ({'sigma0': 0}, 'sigma0')])
+def test_invalid_settings_raise(kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        CMAES(**kwargs)
+
+
+
+def test_without_keep_best_the_distribution_mean_is_returned(quadratic):
+    calls = []
+    fun = lambda x: calls.append(x) or quadratic(x)  # noqa: E731
+    result = CMAES(maxiter=5, population=6, seed=0, keep_best=False).minimize(fun, np.zeros(4))
+    np.testing.assert_array_equal(result.x, calls[-1])          # scored once more, on its own
+    assert result.fun == quadratic(result.x) and result.nfev == 6 * 5 + 1
+
+
+def test_registry_marks_cmaes_as_local():
+    from importlib import import_module
+
+    from backend.pipeline_registry import OPTIMIZER_REGISTRY
+
+    entry = OPTIMIZER_REGISTRY['cmaes']
+    assert 'qiskit_class' not in entry
+    module, name = entry['local_class'].rsplit('.', 1)
+    assert getattr(import_module(module), name) is CMAES
+
+
+def test_mini_batch_runs_return_the_mean():
+    from backend.minibatch import MiniBatchSettings
+    from backend.quantum_runner import _build_optimizer
+
+    spec = {'type': 'cmaes', 'maxiter': 2}
+    assert _build_optimizer(spec, {}).keep_best
+    assert not _build_optimizer(spec, {}, MiniBatchSettings(8)).keep_best
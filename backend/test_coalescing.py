@@ -0,0 +1,96 @@
+import copy
+import json
+import threading
+import time
+
+from app import app
+from backend.fingerprint import spec_fingerprint
+from backend.job_queue import JobQueue
+from backend.single_flight import SingleFlight
+from backend.test_jobs import SPEC, _wait_for
+
+
+def test_single_flight_runs_once_for_concurrent_callers():
+    flights = SingleFlight()
+    calls = []
+    results = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.3)
+        return {'value': 42}
+
+    threads = [threading.Thread(target=lambda: results.append(flights.do('k', slow)))
+               for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(r[0] == {'value': 42} and r[1] == 5 for r in results)
+    assert sum(1 for r in results if not r[2]) == 1
+    assert flights.in_flight() == 0
+
+
+def test_fingerprint_ignores_defaults_case_and_cache_flag():
+    spec = copy.deepcopy(SPEC)
+    variant = copy.deepcopy(SPEC)
+    variant['encoder']['type'] = 'ANGLE'
+    variant['cache'] = 'bypass'
+    del variant['dataset']['test_size']
+    assert spec_fingerprint(spec) == spec_fingerprint(variant)
+
+    variant['dataset']['seed'] = 7
+    assert spec_fingerprint(spec) != spec_fingerprint(variant)
+
+
+def test_identical_jobs_are_coalesced():
+    client = app.test_client()
+    spec = copy.deepcopy(SPEC)
+    spec['optimizer']['maxiter'] = 5
+    spec['cache'] = 'bypass'
+    first = client.post('/api/jobs', data=json.dumps(spec), content_type='application/json').get_json()
+    second = client.post('/api/jobs', data=json.dumps(spec), content_type='application/json').get_json()
+    assert first['coalesced'] is False
+    if second['coalesced']:
+        assert second['job_id'] == first['job_id']
+        done = _wait_for(client, first['job_id'])
+        assert done['coalesced_callers'] == 2
+    else:
+        # The first job may already have finished on a very fast machine.
+        assert _wait_for(client, first['job_id'])['finished_at'] is not None
+
+
+def test_cancel_detaches_coalesced_callers_until_the_last():
+    queue = JobQueue(max_workers=1)
+    release = threading.Event()
+    try:
+        with queue._cond:
+            queue._enqueue('train', release.wait, ())          # keeps the job below queued
+        first = queue.submit(SPEC, key='k')
+        assert queue.submit(SPEC, key='k')['coalesced']
+
+        detached = queue.cancel(first['job_id'])
+        assert not detached['cancel_requested'] and detached['coalesced_callers'] == 1
+        assert queue.cancel(first['job_id'])['cancel_requested']
+        assert queue.get(first['job_id'])['status'] == 'cancelled'
+    finally:
+        release.set()
+        queue.shutdown()
+
+
+def test_cancel_by_one_of_several_callers_is_409():
+    client = app.test_client()
+    spec = copy.deepcopy(SPEC)
+    spec['optimizer']['maxiter'] = 1000
+    spec['cache'] = 'bypass'
+    first = client.post('/api/jobs', data=json.dumps(spec), content_type='application/json').get_json()
+    second = client.post('/api/jobs', data=json.dumps(spec), content_type='application/json').get_json()
+    if not second['coalesced']:
+        client.delete(f"/api/jobs/{first['job_id']}")
+        return  # the first job already failed (no quantum stack)
+    resp = client.delete(f"/api/jobs/{first['job_id']}")
+    assert resp.status_code == 409 and resp.get_json()['coalesced_callers'] == 1
+    assert client.delete(f"/api/jobs/{first['job_id']}").status_code == 202
+    assert _wait_for(client, first['job_id'])['status'] == 'cancelled'
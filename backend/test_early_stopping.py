@@ -0,0 +1,159 @@
+import copy
+
+import numpy as np
+import pytest
+
+from backend.early_stopping import EarlyStopping, early_stopping_from_spec
+from backend.test_jobs import SPEC
+from backend.training_monitor import MonitoredOptimizer, TrainingMonitor
+
+
+class _Sequence:
+    """Optimizer that evaluates weights 0, 1, 2, ... and returns the last point."""
+
+    def __init__(self, n):
+        self.n = n
+
+    def minimize(self, fun, x0, jac=None, bounds=None):
+        from qiskit_algorithms.optimizers import OptimizerResult
+
+        for i in range(self.n):
+            value = fun(np.array([float(i)]))
+        result = OptimizerResult()
+        result.x, result.fun = np.array([float(self.n - 1)]), value
+        return result
+
+
+class _LineSearch(_Sequence):
+    """Gradient optimizer: a gradient and three line-search evaluations per iteration."""
+
+    @property
+    def gradient_support_level(self):
+        from qiskit_algorithms.optimizers import OptimizerSupportLevel
+        return OptimizerSupportLevel.supported
+
+    def minimize(self, fun, x0, jac=None, bounds=None):
+        from qiskit_algorithms.optimizers import OptimizerResult
+
+        for i in range(self.n):
+            jac(np.array([float(i)]))
+            for step in (0.5, 0.25, 0.125):
+                fun(np.array([i + step]))
+        result = OptimizerResult()
+        result.x, result.fun = np.array([float(self.n - 1)]), 0.0
+        return result
+
+
+def _counted_validation(tracker):
+    calls = []
+    tracker.validation_loss = lambda weights: calls.append(weights) or float(weights[0])
+    return calls
+
+
+def test_patience_counts_iterations_without_improvement():
+    tracker = EarlyStopping(patience=2, min_delta=0.1)
+    losses = [1.0, 0.8, 0.75, 0.5, 0.55, 0.45]                # 0.45 is the best, but not by min_delta
+    stops = [tracker.update(np.array([i]), loss) for i, loss in enumerate(losses)]
+    assert stops == [False, False, False, False, False, True]
+    assert tracker.stopped_at == 6
+    assert (tracker.best_iteration, tracker.best_loss) == (6, 0.45)
+    np.testing.assert_array_equal(tracker.best_weights, [5])
+
+
+def test_repeated_weights_are_one_iteration():
+    tracker = EarlyStopping(patience=1)
+    tracker.update(np.array([0.0]), 1.0)
+    assert not tracker.update(np.array([0.0]), 1.0)
+    assert tracker.iterations == 1
+
+
+def test_validation_loss_replaces_the_training_loss():
+    tracker = EarlyStopping(patience=5)
+    tracker.validation_loss = lambda weights: float(weights[0])
+    tracker.update(np.array([3.0]), 0.0)
+    tracker.update(np.array([2.0]), 9.0)
+    assert tracker.best_loss == 2.0
+
+
+def test_carve_validation_is_stratified():
+    X = np.arange(40, dtype=float)[:, None]
+    y = np.eye(2)[(np.arange(40) < 10).astype(int)]
+    X_fit, y_fit, X_val, y_val = EarlyStopping(validation_split=0.2, seed=0).carve_validation(X, y)
+    assert (len(X_fit), len(X_val)) == (32, 8)
+    assert y_val[:, 1].sum() == 2
+
+
+def test_settings_from_spec():
+    assert early_stopping_from_spec({}, 42) is None
+    assert early_stopping_from_spec({'early_stopping': False}, 42) is None
+    default = early_stopping_from_spec({'early_stopping': True}, 42)
+    assert (default.patience, default.min_delta, default.validation_split, default.seed) == (10, 0.0, 0.0, 42)
+    tracker = early_stopping_from_spec({'early_stopping': {'patience': 3, 'validation_split': 0.2}, 'seed': 7}, 42)
+    assert (tracker.patience, tracker.validation_split, tracker.seed) == (3, 0.2, 7)
+
+
+@pytest.mark.parametrize('options, match', [
+    ({'patience': 0}, 'patience'),
+    ({'min_delta': -1}, 'min_delta'),
+    ({'validation_split': 1.0}, 'validation_split'),
+    ('soon', 'early_stopping'),
+])
+def test_invalid_settings_raise(options, match):
+    with pytest.raises(ValueError, match=match):
+        early_stopping_from_spec({'early_stopping': options}, 42)
+
+
+def test_monitored_optimizer_stops_and_keeps_the_best_weights():
+    pytest.importorskip('qiskit_algorithms')
+    tracker = EarlyStopping(patience=3)
+    monitor = TrainingMonitor(20, early_stopping=tracker)
+    result = MonitoredOptimizer(_Sequence(20), monitor)(fun=lambda w: (w[0] - 4) ** 2, x0=np.zeros(1))
+    assert tracker.stopped_at == 8
+    assert monitor.steps == 8 and monitor.stopped is None
+    np.testing.assert_array_equal(result.x, [4.0])
+
+
+def test_best_weights_are_kept_when_training_runs_to_maxiter():
+    pytest.importorskip('qiskit_algorithms')
+    monitor = TrainingMonitor(5, early_stopping=EarlyStopping(patience=10))
+    result = MonitoredOptimizer(_Sequence(5), monitor)(fun=lambda w: (w[0] - 1) ** 2, x0=np.zeros(1))
+    np.testing.assert_array_equal(result.x, [1.0])
+    assert result.fun == 0.0
+
+
+def test_run_pipeline_reports_stop_and_compute_saved():
+    pytest.importorskip('qiskit')
+    from backend.quantum_runner import run_pipeline
+
+    spec = copy.deepcopy(SPEC)
+    spec['optimizer'] = {'type': 'cobyla', 'maxiter': 60,
+                         'early_stopping': {'patience': 3, 'validation_split': 0.25}}
+    result = run_pipeline(spec)
+    summary = result['early_stopping']
+    assert summary['stopped'] and summary['monitored'] == 'validation_loss'
+    assert summary['validation_rows'] == 3
+    assert summary['stopped_at_iteration'] == result['optimizer_stats']['evaluations'] < 60
+    assert summary['evaluations_saved'] == 60 - summary['stopped_at_iteration']
+    assert result['stopped'] is None
+
+
+def test_validation_runs_once_per_gradient_iteration():
+    pytest.importorskip('qiskit_algorithms')
+    tracker = EarlyStopping(patience=10)
+    calls = _counted_validation(tracker)
+    monitor = TrainingMonitor(5, early_stopping=tracker)
+    MonitoredOptimizer(_LineSearch(5), monitor)(fun=lambda w: float(w[0]), x0=np.zeros(1),
+                                                jac=lambda w: np.ones(1))
+    assert monitor.steps == 20 and len(calls) == 5
+
+
+def test_validation_runs_once_per_generation_without_a_batch_objective():
+    pytest.importorskip('qiskit_algorithms')
+    from backend.cma_es import CMAES
+
+    tracker = EarlyStopping(patience=10)
+    calls = _counted_validation(tracker)
+    monitor = TrainingMonitor(18, early_stopping=tracker)
+    MonitoredOptimizer(CMAES(maxiter=3, population=6, seed=0), monitor)(
+        fun=lambda w: float(np.sum(w ** 2)), x0=np.ones(2))
+    assert monitor.steps == 18 and len(calls) == 3
@@ -0,0 +1,55 @@
+import copy
+
+import joblib
+import numpy as np
+import pytest
+
+from backend.admission import estimate_cost
+from backend.fingerprint import spec_fingerprint
+from backend.test_jobs import SPEC
+
+pytest.importorskip('qiskit')
+
+from backend.quantum_runner import (  # noqa: E402
+    load_split, parse_shots, rebuild_classifier, run_pipeline,
+)
+
+
+def _exact(spec, value='exact'):
+    spec = copy.deepcopy(spec)
+    spec['execution'] = {'shots': value}
+    return spec
+
+
+def test_parse_shots():
+    assert parse_shots({}) == 128
+    assert parse_shots({'shots': 8}) == 32
+    assert parse_shots({'shots': '1024'}) == 1024
+    assert parse_shots({'shots': None}) is None
+    assert parse_shots({'shots': 'Exact'}) is None
+
+
+def test_null_and_exact_share_a_fingerprint():
+    assert spec_fingerprint(_exact(SPEC, None)) == spec_fingerprint(_exact(SPEC, 'exact'))
+    assert spec_fingerprint(_exact(SPEC)) != spec_fingerprint(SPEC)
+
+
+def test_exact_estimate_has_no_shot_cost():
+    est = estimate_cost(_exact(SPEC))
+    assert est['shots'] is None
+    assert est['estimated_seconds'] < estimate_cost(SPEC)['estimated_seconds']
+
+
+def test_exact_run_reports_mode_and_predicts_deterministically(models_dir):
+    result = run_pipeline(_exact(SPEC, None))
+    assert result['sampling'] == 'exact' and result['shots'] is None
+
+    payload = joblib.load(models_dir / f"{result['model_id']}.joblib")
+    _, X_test, _, _ = load_split(SPEC['dataset'])
+    X = payload['scaler'].transform(X_test)
+    classifier = rebuild_classifier(payload['weights'], payload['spec'])
+    first = classifier.predict_proba(X)
+    np.testing.assert_array_equal(first, classifier.predict_proba(X))
+    np.testing.assert_allclose(first.sum(axis=1), 1.0)
+
+    assert run_pipeline(SPEC)['sampling'] == 'shots'
@@ -0,0 +1,137 @@
+import json
+import threading
+import time
+
+import pytest
+
+import app as app_module
+from app import app
+from backend.dataset_catalog import DATASET_CONFIGS
+from backend.job_queue import JobQueue
+
+FINANCE = DATASET_CONFIGS['finance']
+SPEC = {
+    'dataset': {'name': 'finance', 'label_column': FINANCE['label_column'],
+                'feature_columns': FINANCE['feature_columns'], 'test_size': 0.25, 'seed': 42},
+    'encoder': {'type': 'angle', 'reps': 1},
+    'circuit': {'type': 'realamplitudes', 'reps': 1},
+    'optimizer': {'type': 'cobyla', 'maxiter': 2},
+    'execution': {'shots': 64},
+}
+
+
+def _wait_for(client, job_id, timeout=180):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        j = client.get(f'/api/jobs/{job_id}').get_json()
+        if j['status'] in ('done', 'cancelled', 'error'):
+            return j
+        time.sleep(0.5)
+    raise AssertionError(f'job {job_id} did not finish within {timeout}s')
+
+
+def test_submit_and_poll_job():
+    client = app.test_client()
+    spec = {**SPEC, 'cache': 'bypass'}
+    resp = client.post('/api/jobs', data=json.dumps(spec), content_type='application/json')
+    assert resp.status_code == 202
+    j = resp.get_json()
+    assert j['status'] == 'queued' and j['job_id']
+    assert j['status_url'] == f"/api/jobs/{j['job_id']}"
+
+    done = _wait_for(client, j['job_id'])
+    if done['status'] == 'done':
+        assert done['result']['status'] == 'ok'
+        assert done['result']['model_id']
+        assert done['expires_at'] > done['finished_at']
+    else:
+        assert 'Quantum execution dependencies are missing' in done['error']
+
+
+def test_sync_run_is_a_job_it_waits_on():
+    client = app.test_client()
+    spec = {**SPEC, 'cache': 'bypass'}
+    resp = client.post('/api/run', data=json.dumps(spec), content_type='application/json')
+    if resp.status_code != 200:
+        return  # quantum stack unavailable; covered by test_submit_and_poll_job
+    result = resp.get_json()
+    job = client.get(f"/api/jobs/{result['job_id']}").get_json()
+    assert job['status'] == 'done'
+    assert job['result']['model_id'] == result['model_id']
+
+
+def test_queue_run_raises_the_run_error():
+    queue = JobQueue(max_workers=1)
+    try:
+        with pytest.raises(ValueError, match='dataset configuration is required'):
+            queue.run({'dataset': {}}, label='invalid')
+    finally:
+        queue.shutdown()
+
+
+def test_event_stream_reports_progress_then_result():
+    client = app.test_client()
+    spec = {**SPEC, 'cache': 'bypass'}
+    j = client.post('/api/jobs', data=json.dumps(spec), content_type='application/json').get_json()
+    resp = client.get(f"/api/jobs/{j['job_id']}/events")
+    assert resp.status_code == 200
+    assert resp.mimetype == 'text/event-stream'
+    events = [json.loads(line[len('data: '):])
+              for line in resp.get_data(as_text=True).splitlines() if line.startswith('data: ')]
+    assert events[0]['type'] == 'queued'
+    assert [e['id'] for e in events] == list(range(len(events)))
+    assert events[-1]['type'] in ('result', 'error')
+    if events[-1]['type'] == 'result':
+        progress = [e for e in events if e['type'] == 'progress']
+        assert progress and progress[0]['iteration'] == 1
+        assert {'loss', 'elapsed_s', 'eta_s'} <= set(progress[0])
+
+
+def test_event_streams_beyond_the_cap_are_refused(monkeypatch):
+    client = app.test_client()
+    j = client.post('/api/jobs', data=json.dumps({'dataset': {}}), content_type='application/json').get_json()
+    full = threading.BoundedSemaphore(1)
+    full.acquire()
+    monkeypatch.setattr(app_module, 'SSE_STREAMS', full)
+    resp = client.get(f"/api/jobs/{j['job_id']}/events")
+    assert resp.status_code == 503
+    assert resp.get_json()['status_url'] == f"/api/jobs/{j['job_id']}"
+
+
+def test_unknown_job_is_404():
+    client = app.test_client()
+    assert client.get('/api/jobs/does-not-exist').status_code == 404
+    assert client.delete('/api/jobs/does-not-exist').status_code == 404
+
+
+def test_cancel_running_job_keeps_best_weights():
+    client = app.test_client()
+    spec = {**SPEC, 'optimizer': {'type': 'cobyla', 'maxiter': 1000}, 'cache': 'bypass'}
+    j = client.post('/api/jobs', data=json.dumps(spec), content_type='application/json').get_json()
+    deadline = time.time() + 120
+    while time.time() < deadline:
+        state = client.get(f"/api/jobs/{j['job_id']}").get_json()
+        if state['progress'] is not None or state['status'] == 'error':
+            break
+        time.sleep(0.2)
+    if state['status'] == 'error':
+        return  # quantum stack unavailable; covered by test_submit_and_poll_job
+
+    assert client.delete(f"/api/jobs/{j['job_id']}").status_code == 202
+    done = _wait_for(client, j['job_id'])
+    assert done['status'] == 'cancelled'
+    assert done['result']['stopped'] == 'cancelled'
+    assert done['result']['model_id']
+    assert client.delete(f"/api/jobs/{j['job_id']}").status_code == 202
+
+
+def test_finished_jobs_expire_after_ttl():
+    queue = JobQueue(max_workers=1, ttl_s=0.0)
+    try:
+        job = queue.submit({'dataset': {}}, label='invalid')
+        deadline = time.time() + 120
+        while queue.get(job['job_id']) is not None and time.time() < deadline:
+            time.sleep(0.2)
+        assert queue.get(job['job_id']) is None
+    finally:
+        queue.shutdown()
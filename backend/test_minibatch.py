@@ -0,0 +1,103 @@
+import copy
+
+import numpy as np
+import pytest
+
+from backend.minibatch import MiniBatchObjective, MiniBatchSettings, minibatch_settings, stratified_counts
+from backend.test_jobs import SPEC
+
+
+class _RowRecorder:
+    """Minimal objective function: its loss is the number of rows it was built on."""
+
+    def __init__(self, X, y):
+        self.X, self.y = X, y
+
+    def objective(self, weights):
+        return float(len(self.X))
+
+    gradient = objective
+
+
+def _objective(settings, n=40, positives=10):
+    X = np.arange(n, dtype=float)[:, None]
+    y = np.eye(2)[(np.arange(n) < positives).astype(int)]
+    return MiniBatchObjective(_RowRecorder, X, y, settings)
+
+
+def test_stratified_counts_are_proportional_with_every_class_present():
+    assert stratified_counts(np.array([30, 10]), 8).tolist() == [6, 2]
+    assert stratified_counts(np.array([95, 5]), 4).tolist() == [3, 1]
+    assert stratified_counts(np.array([7, 5]), 5).sum() == 5
+
+
+def test_settings_from_spec():
+    assert minibatch_settings({}, 100, 42) is None
+    assert minibatch_settings({'batch_size': 100}, 100, 42) is None
+    settings = minibatch_settings({'batch_size': 8, 'sampling': 'random', 'full_eval_every': 3}, 100, 42)
+    assert (settings.batch_size, settings.sampling, settings.full_eval_every, settings.seed) == (8, 'random', 3, 42)
+    assert minibatch_settings({'batch_size': 8, 'seed': 5}, 100, 42).seed == 5
+
+
+@pytest.mark.parametrize('opt_spec, match', [
+    ({'batch_size': 0}, 'batch_size'),
+    ({'batch_size': 'all'}, 'batch_size'),
+    ({'batch_size': 8, 'sampling': 'bootstrap'}, 'sampling'),
+])
+def test_invalid_settings_raise(opt_spec, match):
+    with pytest.raises(ValueError, match=match):
+        minibatch_settings(opt_spec, 100, 42)
+
+
+def test_stratified_batches_keep_the_class_mix():
+    objective = _objective(MiniBatchSettings(8, 'stratified', seed=0))
+    for step in range(5):
+        assert objective.objective(np.array([step])) == 8
+        assert np.sum(np.argmax(objective.function.y, axis=1) == 1) == 2
+
+
+def test_gradient_at_the_same_weights_reuses_the_batch():
+    objective = _objective(MiniBatchSettings(8, seed=0))
+    objective.objective(np.array([1.0]))
+    first = objective.function
+    objective.gradient(np.array([1.0]))
+    assert objective.function is first
+    objective.objective(np.array([2.0]))
+    assert objective.batches_drawn == 2
+
+
+def test_seed_fixes_the_batches():
+    rows = []
+    for _ in range(2):
+        objective = _objective(MiniBatchSettings(8, 'random', seed=3))
+        objective.objective(np.array([0.0]))
+        rows.append(objective.function.X.ravel())
+    np.testing.assert_array_equal(*rows)
+
+
+def test_full_evaluation_every_k_batches():
+    objective = _objective(MiniBatchSettings(8, full_eval_every=2, seed=0))
+    for step in range(4):
+        assert objective.objective(np.array([step])) == 8
+    assert objective.full_loss_history == [40.0, 40.0]
+
+
+def test_run_pipeline_evaluates_batches_and_charts_full_losses(sampler_submissions):
+    from backend.quantum_runner import run_pipeline
+
+    spec = copy.deepcopy(SPEC)
+    spec['optimizer'] = {'type': 'spsa', 'maxiter': 4, 'seed': 0, 'batch_size': 4, 'full_eval_every': 2}
+    result = run_pipeline(spec)
+    assert sampler_submissions == [2 * 4] * 4                     # each iteration's ± pair on one 4-row batch
+    assert result['minibatch']['batches'] == 5            # four iterations and the final point
+    assert result['minibatch']['full_evaluations'] == 2
+    assert result['loss_history_real_points'] == 2
+
+
+def test_early_stopping_under_minibatches_needs_a_validation_split():
+    from backend.quantum_runner import run_pipeline
+
+    spec = copy.deepcopy(SPEC)
+    spec['optimizer'] = {'type': 'spsa', 'maxiter': 4, 'batch_size': 4, 'early_stopping': True}
+    with pytest.raises(ValueError, match='validation_split'):
+        run_pipeline(spec)
@@ -0,0 +1,74 @@
+import copy
+
+import numpy as np
+import pytest
+
+from backend.test_jobs import SPEC
+
+pytest.importorskip('qiskit')
+
+from backend.cached_states import CachedStateNetwork  # noqa: E402
+from backend.parameter_shift import ParameterShiftNetwork, ParameterShiftVQC  # noqa: E402
+from backend.quantum_runner import (  # noqa: E402
+    _build_ansatz,
+    _build_feature_map,
+    _build_sampler,
+    _load_quantum_stack,
+    _pass_manager,
+    run_pipeline,
+)
+
+
+def _network(exec_spec, n_qubits=3):
+    feature_map = _build_feature_map(n_qubits, {'type': 'angle', 'reps': 1})
+    ansatz = _build_ansatz(n_qubits, {'type': 'efficientsu2', 'reps': 1})
+    sampler, _, _ = _build_sampler(exec_spec, _load_quantum_stack(), n_qubits)
+    vqc = ParameterShiftVQC(feature_map=feature_map, ansatz=ansatz, sampler=sampler,
+                            pass_manager=_pass_manager())
+    vqc.neural_network.set_interpret(vqc._get_interpret(2), 2)
+    return ParameterShiftNetwork(vqc.neural_network, 2), feature_map, ansatz
+
+
+@pytest.mark.parametrize('shots', [None, 4096])
+def test_gradient_matches_exact_parameter_shift(shots):
+    net, feature_map, ansatz = _network({'shots': shots})
+    X = np.random.default_rng(0).normal(size=(4, 3))
+    weights = np.random.default_rng(1).normal(size=ansatz.num_parameters)
+
+    _, grad = net.backward(X, weights)
+    assert grad.shape == (4, 2, ansatz.num_parameters)
+    expected = CachedStateNetwork(feature_map, ansatz).backward(X, weights)[1]
+    np.testing.assert_allclose(grad, expected, atol=1e-10 if shots is None else 0.05)
+    assert net.circuits_executed == 2 * ansatz.num_parameters * 4
+    assert net.gradient_evaluations == 1
+
+
+def test_gradient_is_one_sampler_submission(monkeypatch):
+    net, _, ansatz = _network({'shots': 128})
+    submissions = []
+    run = net._sampler.run
+    monkeypatch.setattr(net._sampler, 'run', lambda pubs, **kw: submissions.append(pubs) or run(pubs, **kw))
+
+    net.backward(np.zeros((5, 3)), np.zeros(ansatz.num_parameters))
+    assert len(submissions) == 1 and len(submissions[0]) == 1
+    assert submissions[0][0][1].shape == (2 * ansatz.num_parameters * 5, 3 + ansatz.num_parameters)
+
+
+@pytest.mark.parametrize('optimizer', ['adam', 'slsqp', 'lbfgsb'])
+def test_gradient_optimizers_train_and_report_stats(optimizer):
+    spec = copy.deepcopy(SPEC)
+    spec['optimizer'] = {'type': optimizer, 'maxiter': 2}
+    result = run_pipeline(spec)
+    stats = result['optimizer_stats']
+    assert stats['gradient_evaluations'] >= 1
+    assert stats['iterations'] >= 1
+    assert stats['evaluations'] == result['loss_history_real_points']
+    assert stats['circuits_executed'] > stats['gradient_evaluations'] * result['n_train']
+    assert stats['training_time_s'] > 0
+
+
+def test_gradient_free_optimizer_reports_circuits():
+    result = run_pipeline(copy.deepcopy(SPEC))
+    stats = result['optimizer_stats']
+    assert stats['gradient_evaluations'] == 0
+    assert stats['circuits_executed'] == stats['evaluations'] * result['n_train']
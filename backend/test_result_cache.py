@@ -0,0 +1,54 @@
+import copy
+import json
+
+from app import app
+from backend.result_cache import ResultCache
+from backend.test_jobs import SPEC
+
+
+def _result(model_id, payload='x'):
+    return {'status': 'ok', 'model_id': model_id, 'accuracy': 0.5, 'payload': payload}
+
+
+def test_lru_eviction_by_size(tmp_path):
+    for mid in ('a', 'b', 'c'):
+        (tmp_path / f'{mid}.joblib').write_bytes(b'')
+    entry_size = len(json.dumps(_result('a', 'x' * 100)))
+    cache = ResultCache(max_bytes=2 * entry_size + 10, models_dir=tmp_path)
+
+    cache.put('ka', _result('a', 'x' * 100))
+    cache.put('kb', _result('b', 'x' * 100))
+    assert cache.get('ka')['model_id'] == 'a'     # ka is now most recently used
+    cache.put('kc', _result('c', 'x' * 100))      # evicts kb
+
+    assert cache.get('kb') is None
+    assert cache.get('kc')['model_id'] == 'c'
+    stats = cache.stats()
+    assert stats['entries'] == 2 and stats['evictions'] == 1
+    assert stats['hits'] == 2 and stats['misses'] == 1
+
+
+def test_entry_dropped_when_model_file_is_gone(tmp_path):
+    cache = ResultCache(max_bytes=1 << 20, models_dir=tmp_path)
+    cache.put('k', _result('missing'))
+    assert cache.get('k') is None
+    assert cache.stats()['entries'] == 0
+
+
+def test_repeat_run_is_served_from_cache_unless_bypassed():
+    client = app.test_client()
+    spec = copy.deepcopy(SPEC)
+    spec['optimizer']['maxiter'] = 3
+    first = client.post('/api/run', data=json.dumps(spec), content_type='application/json')
+    if first.status_code != 200:
+        return  # quantum stack unavailable; covered by test_app
+    first = first.get_json()
+    second = client.post('/api/run', data=json.dumps(spec), content_type='application/json').get_json()
+    assert second['cache']['hit'] is True
+    assert second['model_id'] == first['model_id']
+    assert second['accuracy'] == first['accuracy']
+
+    third = client.post('/api/run', data=json.dumps({**spec, 'cache': 'bypass'}),
+                        content_type='application/json').get_json()
+    assert third['cache']['hit'] is False
+    assert client.get('/api/cache').get_json()['bypasses'] >= 1
@@ -0,0 +1,39 @@
+import copy
+
+import pytest
+
+from backend.sandbox import StopSignal, run_isolated
+from backend.test_jobs import SPEC
+
+
+def _quantum_stack_available():
+    try:
+        from backend.quantum_runner import _load_quantum_stack
+        _load_quantum_stack()
+        return True
+    except ImportError:
+        return False
+
+
+def test_child_errors_keep_their_type():
+    with pytest.raises(ValueError, match='dataset configuration is required'):
+        run_isolated({'dataset': {}})
+
+
+def test_stop_signal_first_reason_wins():
+    stop = StopSignal()
+    assert stop.reason() is None
+    stop.request('timeout')
+    stop.request('cancelled')
+    assert stop.reason() == 'timeout'
+
+
+@pytest.mark.skipif(not _quantum_stack_available(), reason='quantum stack not installed')
+def test_timeout_returns_best_weights():
+    spec = copy.deepcopy(SPEC)
+    # SPSA always runs its full maxiter; COBYLA can converge before the timeout.
+    spec['optimizer'] = {'type': 'spsa', 'maxiter': 1000}
+    result = run_isolated(spec, limits={'timeout_s': 3})
+    assert result['stopped'] == 'timeout'
+    assert result['model_id']
+    assert 0 < result['loss_history_real_points'] < 2000
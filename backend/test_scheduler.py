@@ -0,0 +1,59 @@
+import threading
+import time
+
+import pytest
+
+from app import app
+from backend.scheduler import PriorityScheduler, SchedulerBusy
+
+
+def _start(sched, cls, order):
+    def work():
+        with sched.slot(cls):
+            order.append(cls)
+    t = threading.Thread(target=work)
+    t.start()
+    return t
+
+
+def test_higher_priority_waiter_gets_the_freed_slot_first():
+    sched = PriorityScheduler(limits={'interactive': 1, 'train': 1, 'batch': 1},
+                              max_queued={}, total_limit=1)
+    order = []
+    sched.acquire('train')
+    threads = [_start(sched, 'batch', order)]
+    time.sleep(0.05)
+    threads.append(_start(sched, 'interactive', order))
+    time.sleep(0.05)
+    assert sched.stats()['classes']['batch']['queued'] == 1
+    assert sched.stats()['classes']['interactive']['queued'] == 1
+
+    sched.release('train')
+    for t in threads:
+        t.join(timeout=5)
+    assert order == ['interactive', 'batch']
+
+
+def test_full_queue_rejects_and_interactive_is_unaffected():
+    sched = PriorityScheduler(limits={'interactive': 2, 'train': 1, 'batch': 1},
+                              max_queued={'train': 1})
+    order = []
+    sched.acquire('train')
+    waiter = _start(sched, 'train', order)
+    time.sleep(0.05)
+    with pytest.raises(SchedulerBusy):
+        sched.acquire('train')
+    with sched.slot('interactive') as waited:
+        assert waited < 0.05
+
+    sched.release('train')
+    waiter.join(timeout=5)
+    stats = sched.stats()['classes']['train']
+    assert stats['rejected'] == 1 and stats['completed'] == 2
+    assert stats['wait_p99_ms'] >= stats['wait_p50_ms']
+
+
+def test_scheduler_endpoint_reports_classes_and_job_pool():
+    body = app.test_client().get('/api/scheduler').get_json()
+    assert set(body['classes']) == {'interactive', 'train', 'batch'}
+    assert set(body['job_pool']['pending']) == {'interactive', 'train', 'batch'}
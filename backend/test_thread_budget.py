@@ -0,0 +1,53 @@
+from app import app
+from backend.thread_budget import ThreadBudget, aer_thread_options
+
+
+def test_cores_are_split_evenly_and_rebalanced():
+    budget = ThreadBudget(total_threads=5)
+    a = budget.acquire('a')
+    assert a.threads == 5
+    b = budget.acquire('b')
+    assert (a.threads, b.threads) == (3, 2)
+    budget.release(a)
+    assert b.threads == 5
+    budget.release(b)
+    assert budget.stats()['active_leases'] == 0
+
+
+def test_every_lease_gets_at_least_one_thread():
+    budget = ThreadBudget(total_threads=2)
+    leases = [budget.acquire(str(i)) for i in range(3)]
+    assert [lease.threads for lease in leases] == [1, 1, 1]
+
+
+def test_shared_value_follows_allocation():
+    class Shared:
+        value = 0
+
+    budget = ThreadBudget(total_threads=4)
+    shared = Shared()
+    with budget.lease('run', shared=shared):
+        assert shared.value == 4
+        with budget.lease('other'):
+            assert shared.value == 2
+        assert shared.value == 4
+
+
+def test_aer_options_parallelise_small_circuits_across_experiments():
+    assert aer_thread_options(4, 4) == {'max_parallel_threads': 4, 'max_parallel_experiments': 4}
+    assert aer_thread_options(4, 20) == {'max_parallel_threads': 4, 'max_parallel_experiments': 1}
+    assert aer_thread_options(0, 4)['max_parallel_threads'] == 1
+    assert aer_thread_options(4, 4, batch_size=2)['max_parallel_experiments'] == 2
+
+
+def test_user_parallel_caps_stay_within_the_allocation():
+    caps = {'max_parallel_threads': 2, 'max_parallel_shots': 8}
+    assert aer_thread_options(4, 20, caps=caps) == {
+        'max_parallel_threads': 2, 'max_parallel_experiments': 1, 'max_parallel_shots': 4,
+    }
+
+
+def test_threads_endpoint():
+    stats = app.test_client().get('/api/threads').get_json()
+    assert stats['total_threads'] >= 1
+    assert {'allocated_threads', 'active_leases', 'leases'} <= set(stats)
@@ -0,0 +1,81 @@
+from app import app
+from backend.quantum_runner import _build_ansatz, _build_feature_map
+from backend.warmup import Warmup
+
+
+def test_warmup_runs_steps_once_and_records_timings():
+    calls = []
+    warmup = Warmup(steps=[('a', lambda: calls.append('a')), ('b', lambda: calls.append('b'))])
+    assert not warmup.ready
+    assert warmup.start(enabled=True)
+    assert warmup.wait(10)
+    assert not warmup.start(enabled=True)
+    assert calls == ['a', 'b']
+    status = warmup.status()
+    assert status['state'] == 'ready' and status['ready']
+    assert set(status['steps']) == {'a', 'b'} and status['seconds'] >= 0
+
+
+def test_failed_step_is_reported_and_stops_warmup():
+    def boom():
+        raise ImportError('no qiskit')
+
+    warmup = Warmup(steps=[('stack', boom), ('never', lambda: None)])
+    warmup.start(enabled=True)
+    warmup.wait(10)
+    status = warmup.status()
+    assert status['state'] == 'failed' and status['ready']
+    assert status['error'] == 'stack: no qiskit'
+    assert 'never' not in status['steps']
+
+
+def test_disabled_warmup_is_ready_immediately():
+    warmup = Warmup(steps=[])
+    assert not warmup.start(enabled=False)
+    assert warmup.status()['state'] == 'disabled' and warmup.ready
+
+
+def test_circuit_templates_are_copies():
+    first = _build_ansatz(3, {'type': 'realamplitudes', 'reps': 1})
+    second = _build_ansatz(3, {'type': 'realamplitudes', 'reps': 1})
+    assert first is not second and first == second
+    assert _build_feature_map(3, {'type': 'angle'}).num_qubits == 3
+
+
+def test_create_app_starts_warmup(monkeypatch):
+    import app as app_module
+
+    started = []
+    monkeypatch.setattr(app_module.WARMUP, 'start', lambda: started.append(True))
+    assert app_module.create_app() is app
+    assert started == [True]
+
+
+def test_health_reports_readiness():
+    client = app.test_client()
+    health = client.get('/api/health')
+    assert health.status_code == 200
+    body = health.get_json()
+    assert body['status'] == 'ok'
+    assert body['warmup']['state'] in ('pending', 'running', 'ready', 'failed', 'disabled')
+    ready = client.get('/api/ready')
+    assert ready.status_code == (200 if body['ready'] or ready.get_json()['ready'] else 503)
+
+
+def _warm_caches(queue):
+    from backend.quantum_runner import _circuit_template, _pass_manager
+    queue.put((_circuit_template.cache_info().currsize, _pass_manager.cache_info().currsize))
+
+
+def test_forkserver_children_start_with_templates_and_pass_manager():
+    from backend.sandbox import _mp_context
+
+    ctx = _mp_context()
+    if ctx.get_start_method() != 'forkserver':
+        return  # spawn-only platform: nothing is preloaded
+    queue = ctx.Queue()
+    child = ctx.Process(target=_warm_caches, args=(queue,))
+    child.start()
+    templates, pass_managers = queue.get(timeout=120)
+    child.join()
+    assert templates >= 2 and pass_managers == 1
@@ -0,0 +1,221 @@
+"""
+Process-wide CPU thread budget.
+
+Aer parallelises every simulation with OpenMP across all cores, and NumPy /
+scikit-learn do the same through BLAS, so two concurrent runs each try to use
+the whole machine and both slow down. THREAD_BUDGET hands every active run
+(and every prediction) a lease and divides THREAD_BUDGET_CORES evenly among
+the active leases, rebalancing whenever one starts or finishes.
+
+A run's child process follows its lease through a shared integer: before
+each objective evaluation ThreadFollower re-applies the current allocation
+to the Aer backend (max_parallel_threads / max_parallel_experiments) and to
+the BLAS pools via threadpoolctl.
+"""
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+logger = logging.getLogger(__name__)
+
+
+def _available_cores() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS, Windows
+        return os.cpu_count() or 1
+
+
+THREAD_BUDGET_CORES = int(os.getenv("THREAD_BUDGET_CORES", "0")) or _available_cores()
+
+# Below this many qubits a statevector is too small for Aer to split one
+# simulation across threads, so parallelise across circuits instead.
+_STATE_PARALLEL_MIN_QUBITS = 14
+
+
+def aer_thread_options(
+    n_threads: int,
+    n_qubits: int,
+    batch_size: Optional[int] = None,
+    caps: Optional[Dict[str, int]] = None,
+) -> Dict[str, int]:
+    """
+    AerSimulator options that keep one simulation within ``n_threads`` threads.
+    ``batch_size`` is the number of circuits per job, when known; ``caps`` are
+    user-set max_parallel_* limits (see aer_config), applied on top.
+    """
+    n_threads = max(1, int(n_threads))
+    if n_qubits < _STATE_PARALLEL_MIN_QUBITS:
+        experiments = n_threads if batch_size is None else max(1, min(n_threads, int(batch_size)))
+        options = {"max_parallel_threads": n_threads, "max_parallel_experiments": experiments}
+    else:
+        options = {"max_parallel_threads": n_threads, "max_parallel_experiments": 1}
+    for key, cap in (caps or {}).items():
+        options[key] = max(1, min(int(cap), options.get(key, n_threads)))
+    return options
+
+
+def limit_blas_threads(n_threads: int) -> None:
+    if threadpool_limits is not None:
+        threadpool_limits(limits=max(1, int(n_threads)), user_api="blas")
+
+
+# ─── Child side ───────────────────────────────────────────────────────────────
+
+# Shared integer holding this process's allocation; set by bind_child() in a
+# run's child process, None everywhere else.
+_CHILD_SHARE = None
+
+
+def bind_child(shared) -> None:
+    global _CHILD_SHARE
+    _CHILD_SHARE = shared
+
+
+def allocated_threads() -> Optional[int]:
+    """Threads currently allocated to this child process, or None if unmanaged."""
+    if _CHILD_SHARE is None or _CHILD_SHARE.value <= 0:
+        return None
+    return int(_CHILD_SHARE.value)
+
+
+class ThreadFollower:
+    """
+    Re-applies the current allocation to an Aer backend and BLAS when it
+    changes. ``backend`` may also be Aer's V1 Sampler, whose run options are
+    applied to the simulator it owns on every run.
+    """
+
+    def __init__(self, backend, n_qubits: int, batch_size: Optional[int] = None,
+                 caps: Optional[Dict[str, int]] = None):
+        self.backend = backend
+        self.n_qubits = n_qubits
+        self.batch_size = batch_size
+        self.caps = caps
+        self.current: Optional[int] = None
+
+    def __call__(self) -> None:
+        n_threads = allocated_threads()
+        if n_threads is None or n_threads == self.current:
+            return
+        self.backend.set_options(
+            **aer_thread_options(n_threads, self.n_qubits, self.batch_size, self.caps)
+        )
+        limit_blas_threads(n_threads)
+        self.current = n_threads
+
+
+# ─── Parent side ──────────────────────────────────────────────────────────────
+
+def _process_cpu_seconds(pid: int) -> Optional[float]:
+    """user + system CPU time of ``pid`` from /proc (Linux only)."""
+    try:
+        with open(f"/proc/{pid}/stat") as fh:
+            fields = fh.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+class Lease:
+    def __init__(self, lease_id: int, label: str, shared=None):
+        self.lease_id = lease_id
+        self.label = label
+        self.shared = shared
+        self.pid: Optional[int] = None
+        self.threads = 1
+        self.started = time.time()
+
+    def _set(self, threads: int) -> None:
+        self.threads = threads
+        if self.shared is not None:
+            self.shared.value = threads
+
+    def snapshot(self) -> Dict[str, Any]:
+        wall = max(1e-9, time.time() - self.started)
+        cpu = _process_cpu_seconds(self.pid) if self.pid is not None else None
+        cores = cpu / wall if cpu is not None else None
+        return {
+            "id": self.lease_id,
+            "label": self.label,
+            "pid": self.pid,
+            "threads": self.threads,
+            "running_s": round(wall, 2),
+            "cpu_s": round(cpu, 2) if cpu is not None else None,
+            "avg_cores_used": round(cores, 2) if cores is not None else None,
+            "utilisation": round(cores / self.threads, 3) if cores is not None else None,
+        }
+
+
+class ThreadBudget:
+    """Divides a fixed number of cores evenly among active leases."""
+
+    def __init__(self, total_threads: int = THREAD_BUDGET_CORES):
+        self.total_threads = max(1, int(total_threads))
+        self._leases: Dict[int, Lease] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def acquire(self, label: str, shared=None) -> Lease:
+        """
+        Start a lease. ``shared`` (a multiprocessing Value) is kept in step
+        with the lease's allocation so a child process can follow it.
+        """
+        with self._lock:
+            lease = Lease(next(self._ids), label, shared)
+            self._leases[lease.lease_id] = lease
+            self._rebalance()
+        return lease
+
+    def release(self, lease: Lease) -> None:
+        with self._lock:
+            self._leases.pop(lease.lease_id, None)
+            self._rebalance()
+
+    @contextmanager
+    def lease(self, label: str, shared=None) -> Iterator[Lease]:
+        lease = self.acquire(label, shared)
+        try:
+            yield lease
+        finally:
+            self.release(lease)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            leases = [lease.snapshot() for lease in self._leases.values()]
+        measured = [s["avg_cores_used"] for s in leases if s["avg_cores_used"] is not None]
+        try:
+            load = [round(v, 2) for v in os.getloadavg()]
+        except (AttributeError, OSError):
+            load = None
+        return {
+            "total_threads": self.total_threads,
+            "allocated_threads": sum(s["threads"] for s in leases),
+            "active_leases": len(leases),
+            "cores_used": round(sum(measured), 2) if measured else None,
+            "load_average": load,
+            "blas_control": threadpool_limits is not None,
+            "leases": leases,
+        }
+
+    def _rebalance(self) -> None:
+        """Caller holds the lock. Oldest leases get the remainder cores."""
+        if not self._leases:
+            return
+        base, extra = divmod(self.total_threads, len(self._leases))
+        for i, lease in enumerate(sorted(self._leases.values(), key=lambda x: x.lease_id)):
+            lease._set(max(1, base + (1 if i < extra else 0)))
+
+
+THREAD_BUDGET = ThreadBudget()
@@ -0,0 +1,239 @@
+"""
+Training progress monitor.
+
+Wraps the objective (and gradient) handed to the optimizer so every evaluation
+is recorded in a loss history and, optionally, pushed to a progress callback
+with the iteration count, elapsed time and an ETA. Used by run_pipeline for
+both the loss curve and live streaming via /api/jobs/<id>/events.
+
+A ``should_stop`` callable lets the caller end training early (cancellation,
+timeout, CPU limit): the next evaluation raises StopTraining, and
+MonitoredOptimizer turns that into a normal optimizer result holding the
+best weights seen so far. An ``early_stopping`` tracker (see
+early_stopping.py) ends training the same way once the loss stops
+improving; its best weights then become the result even when the
+optimizer runs to completion.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+StopCheck = Callable[[], Optional[str]]
+
+# StopTraining reason when the early-stopping patience runs out. Unlike the
+# other reasons it is part of normal training, so it is not reported as ``stopped``.
+EARLY_STOPPING = "early_stopping"
+
+
+class StopTraining(Exception):
+    """Raised inside the objective when training has been asked to stop."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def expected_evaluations(opt_type: str, maxiter: int, resamplings: int = 1, population: int = 4) -> int:
+    """Rough number of objective/gradient evaluations an optimizer will make."""
+    opt_type = (opt_type or "cobyla").lower()
+    if opt_type == "cmaes":
+        return population * maxiter
+    if opt_type == "spsa":
+        # BatchedSPSA: a ± pair per resampling each iteration, then the final point.
+        return 2 * resamplings * maxiter + 1
+    if opt_type == "adam":
+        return maxiter + 1
+    if opt_type in ("slsqp", "lbfgsb", "l_bfgs_b"):
+        return 2 * maxiter
+    return maxiter
+
+
+class TrainingMonitor:
+    """Records every evaluation of the training objective and reports progress."""
+
+    def __init__(
+        self,
+        expected_steps: int,
+        on_progress: Optional[ProgressCallback] = None,
+        should_stop: Optional[StopCheck] = None,
+        before_evaluation: Optional[Callable[[], None]] = None,
+        early_stopping=None,
+    ):
+        self.expected_steps = max(1, int(expected_steps))
+        self.on_progress = on_progress
+        self.should_stop = should_stop
+        self.before_evaluation = before_evaluation
+        self.early_stopping = early_stopping
+        self.stopped: Optional[str] = None
+        self.loss_history: List[float] = []
+        self.steps = 0
+        self.best_loss: Optional[float] = None
+        self.best_weights: Optional[np.ndarray] = None
+        self._t0 = time.time()
+
+    def wrap(self, fun: Callable, iterations: bool = True) -> Callable:
+        """
+        Return ``fun`` with every call recorded. With ``iterations`` False its
+        calls are not optimizer iterations (a line search, SPSA's final point)
+        and early stopping does not look at them.
+        """
+        def objective(weights):
+            self.check_stop()
+            value = fun(weights)
+            self.record(weights, value)
+            if iterations:
+                self.check_early_stop(weights, value)
+            return value
+
+        return objective
+
+    def wrap_gradient(self, jac: Optional[Callable], fun: Callable) -> Optional[Callable]:
+        """
+        Return ``jac`` with every call recorded; each call is one iteration of
+        a gradient optimizer. The loss at the same weights is read back from
+        ``fun`` — the VQC objective caches its forward pass per weight vector,
+        so this costs no extra circuit executions.
+        """
+        if jac is None:
+            return None
+
+        def gradient(weights):
+            self.check_stop()
+            grad = jac(weights)
+            value = fun(weights)
+            self.record(weights, value)
+            self.check_early_stop(weights, value)
+            return grad
+
+        return gradient
+
+    def wrap_batch(self, batch_fun: Callable) -> Callable:
+        """
+        Return ``batch_fun`` (K weight vectors → K losses) with every point
+        recorded; each call (a BatchedSPSA iteration, a CMA-ES generation) is
+        one iteration, judged by its best point.
+        """
+        def objectives(points):
+            self.check_stop()
+            values = batch_fun(points)
+            for weights, value in zip(points, values):
+                self.record(weights, value)
+            best = int(np.argmin(values))
+            self.check_early_stop(points[best], values[best])
+            return values
+
+        return objectives
+
+    def check_stop(self) -> None:
+        """Called before every evaluation: raise StopTraining if asked to, then run the hook."""
+        reason = self.should_stop() if self.should_stop is not None else None
+        if reason:
+            raise StopTraining(reason)
+        if self.before_evaluation is not None:
+            self.before_evaluation()
+
+    def check_early_stop(self, weights, value) -> None:
+        """Called after every iteration: raise StopTraining once early stopping's patience runs out."""
+        if self.early_stopping is not None and self.early_stopping.update(weights, value):
+            raise StopTraining(EARLY_STOPPING)
+
+    def record(self, weights, value) -> None:
+        value = float(value)
+        self.steps += 1
+        self.loss_history.append(value)
+        if self.best_loss is None or value < self.best_loss:
+            self.best_loss = value
+            self.best_weights = np.array(weights, dtype=float, copy=True)
+        if self.on_progress is not None:
+            self.on_progress(self.snapshot())
+
+    def snapshot(self) -> Dict[str, Any]:
+        elapsed = time.time() - self._t0
+        remaining = max(0, self.expected_steps - self.steps)
+        eta = elapsed / self.steps * remaining if self.steps else None
+        return {
+            "type": "progress",
+            "iteration": self.steps,
+            "expected_iterations": max(self.expected_steps, self.steps),
+            "loss": self.loss_history[-1] if self.loss_history else None,
+            "best_loss": self.best_loss,
+            "elapsed_s": round(elapsed, 3),
+            "eta_s": round(eta, 3) if eta is not None else None,
+        }
+
+
+def _uses_gradient(optimizer) -> bool:
+    """Whether a qiskit optimizer calls ``jac`` (its gradient support level is supported or required)."""
+    level = getattr(optimizer, "gradient_support_level", None)
+    if level is None:
+        return False
+    from qiskit_algorithms.optimizers import OptimizerSupportLevel
+    return level in (OptimizerSupportLevel.supported, OptimizerSupportLevel.required)
+
+
+class MonitoredOptimizer:
+    """
+    Callable optimizer adapter accepted by VQC in place of an Optimizer instance.
+
+    VQC only invokes its own ``callback`` for a narrow set of optimizer classes,
+    so instead the objective itself is wrapped before being passed to the real
+    optimizer's ``minimize``.
+    """
+
+    def __init__(self, optimizer, monitor: TrainingMonitor):
+        self.optimizer = optimizer
+        self.monitor = monitor
+
+    def __call__(self, fun, x0, jac=None, bounds=None, batch_fun=None):
+        # A batch objective (several weight vectors per call) goes only to
+        # optimizers that take one, such as BatchedSPSA; they get one built
+        # from ``fun`` if the objective has none, so that early stopping — and
+        # its validation loss — runs once per iteration, not once per point.
+        extra = {}
+        batched = getattr(self.optimizer, "accepts_batch_fun", False)
+        if batched:
+            if batch_fun is None:
+                batch_fun = lambda points: np.array([fun(p) for p in points])  # noqa: E731
+            extra["batch_fun"] = self.monitor.wrap_batch(batch_fun)
+        # Iterations are batch calls, else gradient calls for optimizers that
+        # use the gradient, else single evaluations (COBYLA).
+        per_evaluation = not batched and not (jac is not None and _uses_gradient(self.optimizer))
+        try:
+            result = self.optimizer.minimize(
+                fun=self.monitor.wrap(fun, iterations=per_evaluation),
+                x0=x0,
+                jac=self.monitor.wrap_gradient(jac, fun),
+                bounds=bounds,
+                **extra,
+            )
+        except StopTraining as stop:
+            return self._best_result(stop.reason)
+        except MemoryError:
+            return self._best_result("memory_limit")
+        tracker = self.monitor.early_stopping
+        if tracker is not None and tracker.best_weights is not None:
+            result.x, result.fun = tracker.best_weights, tracker.best_loss
+        return result
+
+    def _best_result(self, reason: str):
+        """Optimizer result for the best weights evaluated before training stopped."""
+        from qiskit_algorithms.optimizers import OptimizerResult
+
+        monitor = self.monitor
+        # With early stopping, "best" is by its own (possibly validation) loss.
+        best = monitor.early_stopping
+        if best is None or best.best_weights is None:
+            best = monitor
+        if best.best_weights is None:
+            raise RuntimeError(f"Training stopped ({reason}) before any weights were evaluated.")
+        if reason != EARLY_STOPPING:
+            monitor.stopped = reason
+        result = OptimizerResult()
+        result.x = best.best_weights
+        result.fun = best.best_loss
+        result.nfev = monitor.steps
+        return result
@@ -0,0 +1,178 @@
+"""
+Boot-time warm-up of the quantum stack.
+
+The first training or prediction after a deploy would otherwise pay for the
+Qiskit / Aer / qiskit-machine-learning imports, the first AerSimulator and
+pass manager, and building every circuit it needs. WARMUP.start(), called
+from app.create_app() — the server entry point — does that work in a
+background thread while the server is already accepting requests:
+
+    quantum_stack      memoised _load_quantum_stack()
+    forkserver         starts the sandbox forkserver with the stack, the
+                       circuit templates and the pass manager preloaded
+                       (backend.preload), which training runs fork from
+    circuit_templates  feature maps and ansatze for each catalog dataset's
+                       recommended config, for predictions in this process
+    simulator          pass manager + one small Aer execution
+
+/api/health reports the state and per-step timings; /api/ready answers 503
+until warm-up has finished so a load balancer can hold traffic back.
+Warm-up is best effort: a failed step is logged and reported, and requests
+then load what they need lazily as before.
+
+WARMUP_ON_START=0 disables it (the server is then reported ready at once).
+"""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .dataset_catalog import DATASET_CONFIGS
+
+logger = logging.getLogger(__name__)
+
+WARMUP_ON_START = os.getenv("WARMUP_ON_START", "1").lower() not in {"0", "false", "no"}
+
+
+def _in_child_process() -> bool:
+    """
+    True in multiprocessing children and helpers. ``_inheriting`` is set while
+    a spawned child or the forkserver re-imports the main module — the same
+    flag multiprocessing checks to refuse starting processes during bootstrap.
+    """
+    if multiprocessing.parent_process() is not None:
+        return True
+    return bool(getattr(multiprocessing.current_process(), "_inheriting", False))
+
+
+def _recommended_circuits() -> List[Tuple[int, Dict, Dict]]:
+    """(qubits, encoder spec, circuit spec) of each catalog dataset's recommended config."""
+    out = []
+    for cfg in DATASET_CONFIGS.values():
+        rec = cfg.get("recommended") or {}
+        out.append((
+            len(cfg["feature_columns"]),
+            {"type": rec.get("encoder", "angle")},
+            {"type": rec.get("circuit", "realamplitudes"), "reps": rec.get("reps", 2)},
+        ))
+    return out
+
+
+def _load_stack() -> None:
+    from .quantum_runner import _load_quantum_stack
+    _load_quantum_stack()
+
+
+def _start_forkserver() -> None:
+    from .sandbox import start_forkserver
+    start_forkserver()
+
+
+def _build_templates() -> None:
+    from .quantum_runner import _build_ansatz, _build_feature_map
+    for n_qubits, enc_spec, cir_spec in _recommended_circuits():
+        _build_feature_map(n_qubits, enc_spec)
+        _build_ansatz(n_qubits, cir_spec)
+
+
+def _build_pass_manager() -> None:
+    from .quantum_runner import _pass_manager
+    _pass_manager()
+
+
+def _run_simulator() -> None:
+    from .quantum_runner import _build_ansatz, _build_feature_map, _build_sampler, _load_quantum_stack, _pass_manager
+    n_qubits, enc_spec, cir_spec = _recommended_circuits()[0]
+    circuit = _build_feature_map(n_qubits, enc_spec).compose(_build_ansatz(n_qubits, cir_spec))
+    circuit.measure_all()
+    circuit = circuit.assign_parameters([0.0] * circuit.num_parameters)
+    sampler, _, _ = _build_sampler({"shots": 32}, _load_quantum_stack(), n_qubits)
+    sampler.run([_pass_manager().run(circuit)]).result()
+
+
+_STEPS: List[Tuple[str, Callable[[], None]]] = [
+    ("quantum_stack", _load_stack),
+    ("forkserver", _start_forkserver),
+    ("circuit_templates", _build_templates),
+    ("simulator", _run_simulator),
+]
+
+
+class Warmup:
+    """
+    Runs the warm-up steps once, in a background thread, and records timings.
+    ``state`` is one of pending, running, ready, failed or disabled.
+    """
+
+    def __init__(self, steps: Optional[List[Tuple[str, Callable[[], None]]]] = None):
+        self.steps = list(_STEPS if steps is None else steps)
+        self.state = "pending"
+        self.error: Optional[str] = None
+        self.step_seconds: Dict[str, float] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    @property
+    def ready(self) -> bool:
+        """True once warm-up has finished (or failed, or is disabled)."""
+        return self.state in ("ready", "failed", "disabled")
+
+    def start(self, enabled: bool = WARMUP_ON_START) -> bool:
+        """
+        Start warm-up in a daemon thread. Does nothing if it already started
+        or if called in a child process (e.g. the forkserver or a spawned run
+        re-importing the app module). Returns whether a thread was started.
+        """
+        with self._lock:
+            if self.state != "pending" or _in_child_process():
+                return False
+            if not enabled:
+                self.state = "disabled"
+                self._done.set()
+                return False
+            self.state = "running"
+            self.started_at = time.time()
+        threading.Thread(target=self.run, name="quantum-warmup", daemon=True).start()
+        return True
+
+    def run(self) -> None:
+        failed = None
+        for name, step in self.steps:
+            t0 = time.perf_counter()
+            try:
+                step()
+            except Exception as exc:
+                failed = f"{name}: {exc}"
+                logger.warning(f"Warm-up step '{name}' failed: {exc}")
+                break
+            finally:
+                self.step_seconds[name] = round(time.perf_counter() - t0, 3)
+        with self._lock:
+            self.finished_at = time.time()
+            self.error = failed
+            self.state = "failed" if failed else "ready"
+        self._done.set()
+        logger.info(f"Warm-up {self.state} in {self.finished_at - self.started_at:.2f}s {self.step_seconds}")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            end = self.finished_at or time.time()
+            return {
+                "state": self.state,
+                "ready": self.ready,
+                "seconds": round(end - self.started_at, 3) if self.started_at else None,
+                "steps": dict(self.step_seconds),
+                "error": self.error,
+            }
+
+
+WARMUP = Warmup()
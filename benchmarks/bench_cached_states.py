@@ -0,0 +1,50 @@
+"""
+Sampler against cached-state training (execution.engine): seconds per
+optimizer iteration for a gradient optimizer and for COBYLA, with circuits
+executed and test accuracy. Each optimizer iteration on the sampler engine
+submits the training rows to Aer; cached_states applies the precompiled
+ansatz to encoded states simulated once per row.
+
+    python -m benchmarks.bench_cached_states [--optimizers adam cobyla] [--maxiter 10] [--reps 1 3]
+"""
+import argparse
+import copy
+import logging
+import warnings
+
+from backend.quantum_runner import MODELS_DIR, run_pipeline
+from backend.test_jobs import SPEC
+
+
+def run(engine, optimizer, maxiter, reps):
+    spec = copy.deepcopy(SPEC)
+    spec["circuit"] = {"type": "efficientsu2", "reps": reps}
+    spec["optimizer"] = {"type": optimizer, "maxiter": maxiter}
+    spec["execution"] = {"shots": 1024, "engine": engine}
+    result = run_pipeline(spec)
+    (MODELS_DIR / f"{result['model_id']}.joblib").unlink()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--optimizers", nargs="+", default=["adam", "cobyla"])
+    parser.add_argument("--maxiter", type=int, default=10)
+    parser.add_argument("--reps", type=int, nargs="+", default=[1, 3])
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.WARNING)
+
+    print(f"{'optimizer':<9} {'reps':>4} {'engine':<14} {'s / iter':>9} {'circuits':>9} {'test acc':>9}")
+    for optimizer in args.optimizers:
+        for reps in args.reps:
+            for engine in ("sampler", "cached_states"):
+                result = run(engine, optimizer, args.maxiter, reps)
+                stats = result["optimizer_stats"]
+                per_iter = stats["training_time_s"] / max(stats["iterations"], 1)
+                print(f"{optimizer:<9} {reps:>4} {engine:<14} {per_iter:>9.4f} "
+                      f"{stats['circuits_executed']:>9} {result['accuracy']:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+CMA-ES (optimizer.type "cmaes") against COBYLA on every catalog dataset with
+its recommended encoder and circuit, at the same number of objective
+evaluations: wall time and the exact training loss of the final weights.
+COBYLA evaluates one weight vector per call; CMA-ES evaluates each
+generation in one batched submission.
+
+    python -m benchmarks.bench_cmaes [--evaluations 120] [--seeds 0 1 2] [--shots 128]
+"""
+import argparse
+import logging
+import time
+import warnings
+
+import joblib
+import numpy as np
+
+from backend.cma_es import default_population
+from backend.dataset_catalog import DATASET_CONFIGS
+from backend.quantum_runner import MODELS_DIR, _build_ansatz, run_pipeline
+from benchmarks.bench_exact_mode import exact_loss
+
+
+def catalog_spec(name, optimizer, shots):
+    cfg = DATASET_CONFIGS[name]
+    rec = cfg["recommended"]
+    return {
+        "dataset": {"name": name, "label_column": cfg["label_column"],
+                    "feature_columns": cfg["feature_columns"], "test_size": 0.25, "seed": 42},
+        "encoder": {"type": rec["encoder"], "reps": 1},
+        "circuit": {"type": rec["circuit"], "reps": rec["reps"]},
+        "optimizer": optimizer,
+        "execution": {"shots": shots},
+    }
+
+
+def run(spec, seed):
+    from qiskit_machine_learning.utils import algorithm_globals
+
+    algorithm_globals.random_seed = seed  # same initial point for both optimizers
+    t0 = time.perf_counter()
+    result = run_pipeline(spec)
+    seconds = time.perf_counter() - t0
+
+    path = MODELS_DIR / f"{result['model_id']}.joblib"
+    payload = joblib.load(path)
+    path.unlink()
+    final = exact_loss(spec, payload["weights"], payload["scaler"])
+    return seconds, result["optimizer_stats"]["evaluations"], final, result["accuracy"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--evaluations", type=int, default=120)
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--shots", type=int, default=128)
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.WARNING)
+
+    print(f"{'dataset':<13} {'optimizer':<9} {'seconds':>8} {'evals':>6} {'exact loss':>11} {'test acc':>9}")
+    for name, cfg in DATASET_CONFIGS.items():
+        rec = cfg["recommended"]
+        n_weights = _build_ansatz(len(cfg["feature_columns"]),
+                                  {"type": rec["circuit"], "reps": rec["reps"]}).num_parameters
+        generations = max(1, args.evaluations // default_population(n_weights))
+        optimizers = {
+            "cobyla": {"type": "cobyla", "maxiter": args.evaluations},
+            "cmaes": {"type": "cmaes", "maxiter": generations, "seed": 0},
+        }
+        for label, optimizer in optimizers.items():
+            spec = catalog_spec(name, optimizer, args.shots)
+            rows = np.array([run(spec, seed) for seed in args.seeds])
+            secs, evals, final, acc = rows.mean(axis=0)
+            print(f"{name:<13} {label:<9} {secs:>8.2f} {evals:>6.0f} {final:>11.4f} {acc:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
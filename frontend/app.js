@@ -631,13 +631,7 @@ async function runPipeline() {
   renderCanvas();
 
   try {
-    const r = await fetch("/api/run", {
-      method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify(spec)
-    });
-    const data = await r.json();
-    if (!r.ok || data.status === "error") throw new Error(data.error || r.statusText);
+    const data = await runJobWithProgress(spec, rb);
 
     rb.className = "success";
     rb.textContent = `✓ Done in ${data.execution_time_s ?? "?"}s — Accuracy: ${fmtPct(data.accuracy)}`;
@@ -681,6 +675,84 @@ async function runPipeline() {
   }
 }
 
+// Submit the spec to the job queue and follow its progress until the final
+// result arrives. Resolves with the same payload /api/run returns. Progress
+// comes from the job's event stream; when the server refuses a stream (it caps
+// how many are open at once) the job is polled instead.
+async function runJobWithProgress(spec, rb) {
+  const r = await fetch("/api/jobs", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(spec)
+  });
+  const job = await r.json();
+  if (!r.ok || job.status === "error") throw new Error(job.error || r.statusText);
+
+  return new Promise((resolve, reject) => {
+    let settled = false;
+    const finish = (fn, value) => { if (!settled) { settled = true; es.close(); fn(value); } };
+
+    const es = new EventSource(`/api/jobs/${job.job_id}/events`);
+    es.addEventListener("progress", ev => showJobProgress(rb, JSON.parse(ev.data)));
+    es.addEventListener("stage", ev => {
+      const p = JSON.parse(ev.data);
+      if (p.stage === "evaluating") {
+        rb.innerHTML = '<span class="spinner"></span> Evaluating trained model…';
+      }
+    });
+    es.addEventListener("result", ev => finish(resolve, JSON.parse(ev.data).result));
+    es.addEventListener("error", ev => {
+      // Named "error" events carry the job's failure.
+      if (ev.data) finish(reject, new Error(JSON.parse(ev.data).error || "Job failed"));
+    });
+    es.onerror = async () => {
+      // Connection errors: EventSource retries on its own unless the job is
+      // gone, or the server refused the stream (readyState CLOSED).
+      if (settled) return;
+      const check = await fetch(`/api/jobs/${job.job_id}`).catch(() => null);
+      if (check && check.status === 404) {
+        finish(reject, new Error("The training job no longer exists on the server (expired or the server restarted)."));
+      } else if (es.readyState === EventSource.CLOSED && !settled) {
+        settled = true;
+        pollJob(job.job_id, rb).then(resolve, reject);
+      }
+    };
+  });
+}
+
+function showJobProgress(rb, p) {
+  if (!p) return;
+  const eta = p.eta_s != null ? ` — ~${Math.ceil(p.eta_s)}s left` : "";
+  const loss = p.loss != null ? ` — loss ${p.loss.toFixed(4)}` : "";
+  rb.innerHTML = `<span class="spinner"></span> Training: evaluation ` +
+    `${p.iteration}/${p.expected_iterations}${loss}${eta}`;
+}
+
+// Follow a job through GET /api/jobs/<id> until it finishes.
+async function pollJob(jobId, rb, intervalMs = 1000) {
+  let failures = 0;
+  for (;;) {
+    await new Promise(done => setTimeout(done, intervalMs));
+    let r;
+    try {
+      r = await fetch(`/api/jobs/${jobId}`);
+    } catch (e) {
+      if (++failures >= 5) throw new Error("Lost contact with the server while training.");
+      continue;
+    }
+    failures = 0;
+    if (r.status === 404) {
+      throw new Error("The training job no longer exists on the server (expired or the server restarted).");
+    }
+    const j = await r.json();
+    if (j.finished_at != null) {
+      if (j.result) return j.result;
+      throw new Error(j.error || `Job ${j.status}`);
+    }
+    showJobProgress(rb, j.progress);
+  }
+}
+
 // ═══════════════════════════════════════════════════════════════════════════
 // Results display
 // ═══════════════════════════════════════════════════════════════════════════
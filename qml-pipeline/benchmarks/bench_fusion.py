@@ -0,0 +1,65 @@
+"""
+Diagonal-gate fusion with full entanglement and ZZ encoding at 8-16 qubits:
+the NumPy engine with and without fuse_diagonals(), and the compiled Aer
+template with and without fuse_diagonal_gates() (only the parameter-free CZ
+layers fuse there; Aer binds the encoder angles per row).
+
+    PYTHONPATH=src python benchmarks/bench_fusion.py [--qubits 8 12 16] [--batch 16]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from qml_pipeline.pipeline    import Pipeline
+from qml_pipeline.statevector import simulate
+from qml_pipeline.utils       import compile_circuit, run_statevectors
+
+
+def best_of(fn, repeat):
+    best = np.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return out, best
+
+
+def aer_runner(pipeline, data, fuse):
+    enc_qc, inputs = pipeline.encoder.parameterized_circuit(data.shape[1])
+    circuit = compile_circuit(enc_qc.compose(pipeline.var_circuit.build_circuit()), fuse=fuse)
+    values  = pipeline.encoder.parameter_values(data)
+    binds   = {param: values[:, i].tolist() for i, param in enumerate(inputs)}
+    binds.update({param: [float(v)] * len(data)
+                  for param, v in zip(pipeline.var_circuit.params, pipeline.params)})
+    return lambda: run_statevectors(circuit, parameter_binds=[binds])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--qubits', type=int, nargs='+', default=[8, 10, 12, 14, 16])
+    parser.add_argument('--layers', type=int, default=2)
+    parser.add_argument('--ansatz', default='ry')
+    parser.add_argument('--batch',  type=int, default=16)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'qubits':>6} {'path':<14} {'unfused s':>10} {'fused s':>9} {'speed-up':>9} {'max |Δ|':>9}")
+    for n in args.qubits:
+        pipeline = Pipeline({'n_qubits': n, 'layers': args.layers, 'ansatz': args.ansatz,
+                             'entanglement': 'full', 'encoding_type': 'zz'})
+        data = rng.normal(size=(args.batch, n))
+        for name, make in [
+            ('numpy engine', lambda fuse: lambda: simulate(pipeline.encoder, pipeline.var_circuit,
+                                                           pipeline.params, data, fuse=fuse).state),
+            ('aer template', lambda fuse: aer_runner(pipeline, data, fuse)),
+        ]:
+            plain, t_plain = best_of(make(False), args.repeat)
+            fused, t_fused = best_of(make(True), args.repeat)
+            err = np.abs(plain - fused).max()
+            print(f"{n:>6} {name:<14} {t_plain:>10.4f} {t_fused:>9.4f} {t_plain / t_fused:>8.1f}x {err:>9.1e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Throughput of Pipeline.run: the old per-sample path (build, bind, transpile
+and run one circuit per row) against the compiled template run as a single
+Aer job, and the NumPy statevector engine.
+
+    PYTHONPATH=src python benchmarks/bench_run.py [--qubits 4] [--rows 50 200]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from qml_pipeline.pipeline import Pipeline
+from qml_pipeline.utils    import expectation_z
+
+
+def per_sample_run(pipeline, data):
+    bindings = pipeline.var_circuit.get_parameter_values(pipeline.params.tolist())
+    results  = []
+    for sample in data:
+        var_qc = pipeline.var_circuit.build_circuit().assign_parameters(bindings)
+        results.append(expectation_z(pipeline.encoder.encode(sample).compose(var_qc), pipeline.n_qubits))
+    return np.array(results)
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--qubits',   type=int, default=4)
+    parser.add_argument('--layers',   type=int, default=2)
+    parser.add_argument('--encoding', default='zz')
+    parser.add_argument('--rows',     type=int, nargs='+', default=[50, 200])
+    args = parser.parse_args()
+
+    pipeline = Pipeline({'n_qubits': args.qubits, 'layers': args.layers,
+                         'entanglement': 'full', 'encoding_type': args.encoding})
+    rng = np.random.default_rng(0)
+
+    print(f"{'rows':>6} {'path':<22} {'seconds':>9} {'rows/s':>10} {'max |Δ|':>9}")
+    for n_rows in args.rows:
+        data = rng.normal(size=(n_rows, args.qubits))
+        reference, t_ref = timed(lambda: per_sample_run(pipeline, data))
+        pipeline._templates.clear()
+        paths = [
+            ('per-sample (old)', reference, t_ref),
+            ('single job, cold', *timed(lambda: pipeline.run(data))),
+            ('single job, warm', *timed(lambda: pipeline.run(data))),
+            ('numpy engine',     *timed(lambda: pipeline.run(data, backend='numpy'))),
+        ]
+        for name, out, secs in paths:
+            err = np.abs(out - reference).max()
+            print(f"{n_rows:>6} {name:<22} {secs:>9.3f} {n_rows / secs:>10.0f} {err:>9.1e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Micro-benchmarks for the vectorised kernels in qml_pipeline.utils.
+
+Compares each kernel with the per-element Python loop it replaced, at
+4-16 qubits:
+
+    PYTHONPATH=src python benchmarks/bench_utils.py [--batch 8] [--repeat 3]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from qml_pipeline.utils import confusion_matrix_simple, expectation_z_batch, flatten_counts
+
+
+# ─── Loop implementations being replaced ──────────────────────────────────────
+
+def loop_expectation_z(state, n_qubits):
+    exp_vals = np.zeros(n_qubits)
+    for q in range(n_qubits):
+        for idx, amp in enumerate(state):
+            prob = abs(amp) ** 2
+            bit  = (idx >> q) & 1
+            exp_vals[q] += prob * (1.0 if bit == 0 else -1.0)
+    return exp_vals
+
+
+def loop_confusion_matrix(predictions, labels, n_classes):
+    cm = np.zeros((n_classes, n_classes), dtype=int)
+    for true, pred in zip(labels, predictions):
+        cm[true][pred] += 1
+    return cm
+
+
+def loop_flatten_counts(counts, n_qubits):
+    dim   = 2 ** n_qubits
+    probs = np.zeros(dim)
+    total = sum(counts.values())
+    for bitstring, count in counts.items():
+        idx = int(bitstring[::-1], 2)
+        if idx < dim:
+            probs[idx] = count / total
+    return probs
+
+
+# ─── Harness ──────────────────────────────────────────────────────────────────
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def report(name, size, loop_s, vec_s):
+    print(f"{name:<16} {size:>10} {loop_s * 1e3:>12.3f} {vec_s * 1e3:>12.3f} {loop_s / vec_s:>9.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--batch',  type=int, default=8, help='statevectors per expectation batch')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    rng  = np.random.default_rng(0)
+
+    print(f"{'kernel':<16} {'size':>10} {'loop ms':>12} {'vector ms':>12} {'speedup':>10}")
+    for n in (4, 8, 12, 16):
+        dim    = 2 ** n
+        states = rng.normal(size=(args.batch, dim)) + 1j * rng.normal(size=(args.batch, dim))
+        states /= np.linalg.norm(states, axis=1, keepdims=True)
+        # The loop is too slow to repeat at 16 qubits; time it once per state.
+        loop_s = best_of(lambda: [loop_expectation_z(s, n) for s in states], 1 if n > 12 else args.repeat)
+        vec_s  = best_of(lambda: expectation_z_batch(states, n), args.repeat)
+        report('expectation_z', f'{n}q x{args.batch}', loop_s, vec_s)
+
+    for n in (4, 8, 12, 16):
+        outcomes = rng.integers(0, 2 ** n, size=min(2 ** n, 8192))
+        counts   = {format(int(i), f'0{n}b'): int(c) for i, c in zip(*np.unique(outcomes, return_counts=True))}
+        loop_s   = best_of(lambda: loop_flatten_counts(counts, n), args.repeat)
+        vec_s    = best_of(lambda: flatten_counts(counts, n), args.repeat)
+        report('flatten_counts', f'{n}q', loop_s, vec_s)
+
+    for n_samples in (1_000, 100_000):
+        labels = rng.integers(0, 3, size=n_samples)
+        preds  = rng.integers(0, 3, size=n_samples)
+        loop_s = best_of(lambda: loop_confusion_matrix(preds, labels, 3), args.repeat)
+        vec_s  = best_of(lambda: confusion_matrix_simple(preds, labels, 3), args.repeat)
+        report('confusion_matrix', n_samples, loop_s, vec_s)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,8 @@
 import numpy as np
 from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
 from qiskit.extensions import Initialize
+from qiskit_aer.library import SetStatevector
 
 SUPPORTED_ENCODINGS = ('angle', 'amplitude', 'basis', 'zz')
 
@@ -15,14 +17,18 @@ class Encoder:
         self.encoding_type = encoding_type
 
 
-    def encode(self, features) -> QuantumCircuit:
-
+    def encode(self, features, export: bool = False) -> QuantumCircuit:
+        """
+        Encoding circuit for one sample. Amplitude encoding injects the
+        normalised state with Aer's set_statevector; ``export=True`` builds it
+        from initialize() instead, for circuits that must run outside Aer.
+        """
         features = np.array(features, dtype=float)
 
         if self.encoding_type == 'angle':
             return self._angle_encode(features)
         elif self.encoding_type == 'amplitude':
-            return self._amplitude_encode(features)
+            return self._amplitude_encode(features, export)
         elif self.encoding_type == 'basis':
             return self._basis_encode(features)
         elif self.encoding_type == 'zz':
@@ -36,22 +42,21 @@ class Encoder:
             qc.ry(float(scaled[i]), i)
         return qc
 
-    def _amplitude_encode(self, features: np.ndarray) -> QuantumCircuit:
+    def _amplitude_encode(self, features: np.ndarray, export: bool = False) -> QuantumCircuit:
 
-        qc          = QuantumCircuit(self.n_qubits)
-        state_dim   = 2 ** self.n_qubits
+        state = self.encode_states(features[None, :])[0]
+        if not export:
+            return self.state_circuit(state)
 
-        padded = np.zeros(state_dim)
-        n_take = min(len(features), state_dim)
-        padded[:n_take] = features[:n_take]
-
-        norm = np.linalg.norm(padded)
-        if norm < 1e-12:
-            padded[0] = 1.0
-        else:
-            padded = padded / norm
+        # initialize() decomposes into an exponentially deep preparation circuit.
+        qc = QuantumCircuit(self.n_qubits)
+        qc.initialize(state.real, list(range(self.n_qubits)))
+        return qc
 
-        qc.initialize(padded, list(range(self.n_qubits)))
+    def state_circuit(self, state: np.ndarray) -> QuantumCircuit:
+        """Circuit that sets every qubit to ``state`` directly (Aer only, no gates)."""
+        qc = QuantumCircuit(self.n_qubits)
+        qc.append(SetStatevector(state), qc.qubits)
         return qc
 
     def _basis_encode(self, features: np.ndarray) -> QuantumCircuit:
@@ -78,6 +83,92 @@ class Encoder:
 
         return qc
 
+    def encode_states(self, data: np.ndarray) -> np.ndarray:
+        """
+        Statevectors of encode() for every row of ``data``, shape
+        (n_samples, 2**n_qubits), written down without simulating a circuit:
+        angle encoding is the product state ⊗_q (cos θ_q/2, sin θ_q/2), basis
+        encoding the single basis state Σ_q x_q·2**q and amplitude encoding the
+        normalised, zero-padded rows. ZZ encoding entangles the qubits and
+        raises ValueError.
+        """
+        data  = np.atleast_2d(np.array(data, dtype=float))
+        batch = len(data)
+        n     = min(data.shape[1], self.n_qubits)
+
+        if self.encoding_type == 'zz':
+            raise ValueError("zz encoding is entangled; it has no product-state form.")
+
+        if self.encoding_type == 'amplitude':
+            dim    = 2 ** self.n_qubits
+            padded = np.zeros((batch, dim))
+            n_take = min(data.shape[1], dim)
+            padded[:, :n_take] = data[:, :n_take]
+            norms  = np.linalg.norm(padded, axis=1)
+            zero   = norms < 1e-12
+            padded[zero, 0] = 1.0
+            norms[zero]     = 1.0
+            return (padded / norms[:, None]).astype(complex)
+
+        if self.encoding_type == 'basis':
+            index  = (data[:, :n] != 0) @ (1 << np.arange(n))
+            states = np.zeros((batch, 2 ** self.n_qubits), dtype=complex)
+            states[np.arange(batch), index] = 1.0
+            return states
+
+        # angle: RY(θ)|0> = (cos θ/2, sin θ/2); qubit q becomes bit q of the index.
+        half   = self.normalize_rows(data)[:, :n] / 2.0
+        states = np.ones((batch, 1))
+        for q in range(self.n_qubits):
+            qubit  = (np.stack([np.cos(half[:, q]), np.sin(half[:, q])], axis=1) if q < n
+                      else np.array([[1.0, 0.0]]).repeat(batch, axis=0))
+            states = (qubit[:, :, None] * states[:, None, :]).reshape(batch, -1)
+        return states.astype(complex)
+
+    def parameterized_circuit(self, n_features: int):
+        """
+        One encoding circuit for every sample with ``n_features`` features, its
+        inputs a ParameterVector 'x' bound per sample from parameter_values().
+        Basis encoding uses RX(π·x), equal to X up to a global phase, with x in
+        {0, 1}. Returns (circuit, inputs); amplitude encoding has no template
+        because initialize() cannot take parameters.
+        """
+        if self.encoding_type == 'amplitude':
+            raise ValueError("amplitude encoding has no parameterised template.")
+
+        n      = min(n_features, self.n_qubits)
+        inputs = ParameterVector('x', n)
+        qc     = QuantumCircuit(self.n_qubits)
+
+        if self.encoding_type == 'basis':
+            for i in range(n):
+                qc.rx(np.pi * inputs[i], i)
+            return qc, inputs
+
+        for i in range(n):
+            qc.ry(inputs[i], i)
+        if self.encoding_type == 'zz':
+            for i in range(n):
+                for j in range(i + 1, n):
+                    qc.crz(2.0 * inputs[i] * inputs[j], i, j)
+        return qc, inputs
+
+    def parameter_values(self, data: np.ndarray) -> np.ndarray:
+        """Values for parameterized_circuit()'s inputs, one row per sample."""
+        data = np.atleast_2d(np.array(data, dtype=float))
+        n    = min(data.shape[1], self.n_qubits)
+        if self.encoding_type == 'basis':
+            return (data[:, :n] != 0).astype(float)
+        return self.normalize_rows(data)[:, :n]
+
+    def normalize_rows(self, data: np.ndarray) -> np.ndarray:
+        """normalize() applied to each row of a 2-D batch as a separate sample."""
+        data = np.array(data, dtype=float)
+        lo   = data.min(axis=1, keepdims=True)
+        rng  = data.max(axis=1, keepdims=True) - lo
+        rng[rng <= 1e-12] = 1.0
+        return (data - lo) / rng * np.pi
+
     def normalize(self, features: np.ndarray) -> np.ndarray:
         """
         Min-max scales features to [0, π].
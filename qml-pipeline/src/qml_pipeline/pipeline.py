@@ -3,12 +3,18 @@ import numpy as np
 from qiskit import QuantumCircuit
 
 from qml_pipeline.encoder       import Encoder
+from qml_pipeline.statevector   import simulate
+from qml_pipeline.training      import encode_dataset, loss_and_gradient, make_optimizer
 from qml_pipeline.variational   import VariationalCircuit
-from qml_pipeline.utils         import (compute_accuracy,
-                                        expectation_z,
+from qml_pipeline.utils         import (compile_circuit,
+                                        compute_accuracy,
+                                        expectation_z_batch,
+                                        run_statevectors,
                                         validate_pipeline_config)
 from qml_pipeline.model_io      import load_model, save_model
 
+SUPPORTED_BACKENDS = ('aer', 'numpy')
+
 
 class Pipeline:
     def __init__(self, model: dict):
@@ -32,6 +38,8 @@ class Pipeline:
         self._params = np.random.uniform(
             0, 2 * np.pi, size=(self.var_circuit.param_count(),)
         )
+        self._templates = {}
+        self.loss_history = []
 
 
     @property
@@ -48,20 +56,95 @@ class Pipeline:
         self._params = values
 
     
-    def run(self, data: np.ndarray) -> np.ndarray:
-        data    = np.atleast_2d(data)
-        results = []
-
-        param_bindings = self.var_circuit.get_parameter_values(self._params.tolist())
-
-        for sample in data:
-            enc_qc = self.encoder.encode(sample)
-            var_qc = self.var_circuit.build_circuit().assign_parameters(param_bindings)
-            full_qc = enc_qc.compose(var_qc)
-            exp_vals = expectation_z(full_qc, self.n_qubits)
-            results.append(exp_vals)
+    def run(self, data: np.ndarray, backend: str = 'aer', precision: str = 'double') -> np.ndarray:
+        """
+        <Z> of every qubit for each row of ``data``, shape (n_samples, n_qubits).
+
+        backend='aer' runs the whole batch as one Aer job; backend='numpy'
+        simulates it with the NumPy statevector engine, where
+        precision='single' uses complex64 to halve memory.
+        """
+        if backend not in SUPPORTED_BACKENDS:
+            raise ValueError(f"backend='{backend}' unknown. Choose from {SUPPORTED_BACKENDS}")
+        data = np.atleast_2d(data)
+        if backend == 'numpy':
+            return simulate(self.encoder, self.var_circuit, self._params, data, precision).expectation_z()
+
+        return expectation_z_batch(self._run_aer(data), self.n_qubits)
+
+    def _template(self, n_features: int):
+        """
+        Encoder + ansatz as one parameterised circuit, transpiled once per
+        feature count and reused by every run. Returns (circuit, encoder inputs).
+        """
+        if n_features not in self._templates:
+            enc_qc, inputs = self.encoder.parameterized_circuit(n_features)
+            circuit = compile_circuit(enc_qc.compose(self.var_circuit.build_circuit()))
+            self._templates[n_features] = (circuit, inputs)
+        return self._templates[n_features]
+
+    def _variational_template(self):
+        """The ansatz alone, transpiled once and bound per run."""
+        if 'variational' not in self._templates:
+            self._templates['variational'] = compile_circuit(self.var_circuit.build_circuit())
+        return self._templates['variational']
+
+    def _run_aer(self, data: np.ndarray) -> np.ndarray:
+        if self.encoding_type == 'amplitude':
+            # Each row's normalised vector is injected as the initial state and
+            # followed by the compiled ansatz — no state-preparation circuit.
+            var_qc   = self._variational_template().assign_parameters(
+                self.var_circuit.get_parameter_values(self._params.tolist()))
+            circuits = [self.encoder.state_circuit(state).compose(var_qc)
+                        for state in self.encoder.encode_states(data)]
+            return run_statevectors(circuits)
+
+        circuit, inputs = self._template(data.shape[1])
+        values = self.encoder.parameter_values(data)
+        binds  = {param: values[:, i].tolist() for i, param in enumerate(inputs)}
+        binds.update({param: [float(v)] * len(data)
+                      for param, v in zip(self.var_circuit.params, self._params)})
+        return run_statevectors(circuit, parameter_binds=[binds])
+
+    def fit(self, X: np.ndarray, y: np.ndarray, optimizer='adam', epochs: int = 50,
+            batch_size: int = None, seed: int = None, logit_scale: float = 5.0) -> list:
+        """
+        Train the variational parameters on (X, y) with adjoint-method
+        gradients on the NumPy statevector engine (see training.py).
+
+        Qubit q votes for class q % n_classes, as in evaluate(), so there can
+        be at most n_qubits classes. ``optimizer`` is 'adam', 'sgd' or any
+        object with step(params, grad); ``batch_size`` (default: all rows)
+        sets the mini-batches, reshuffled every epoch with ``seed``. Returns
+        the mean loss of every epoch, also kept in ``loss_history``.
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        classes, targets = np.unique(np.asarray(y), return_inverse=True)
+        if len(X) != len(targets):
+            raise ValueError(f"X has {len(X)} rows but y has {len(targets)} labels.")
+        if len(classes) > self.n_qubits:
+            raise ValueError(
+                f"{len(classes)} classes cannot be read from {self.n_qubits} qubits."
+            )
 
-        return np.array(results)
+        optimizer  = make_optimizer(optimizer)
+        batch_size = len(X) if batch_size is None else int(batch_size)
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}.")
+        rng     = np.random.default_rng(seed)
+        encoded = encode_dataset(self.encoder, X)
+
+        for _ in range(epochs):
+            order  = rng.permutation(len(X))
+            losses = []
+            for start in range(0, len(X), batch_size):
+                rows       = order[start:start + batch_size]
+                loss, grad = loss_and_gradient(self.var_circuit, self._params, encoded[rows],
+                                               targets[rows], len(classes), logit_scale)
+                self._params = optimizer.step(self._params, grad)
+                losses.append(loss * len(rows))
+            self.loss_history.append(float(np.sum(losses) / len(X)))
+        return self.loss_history
 
 
     def evaluate(self, results: np.ndarray, labels: np.ndarray) -> dict:
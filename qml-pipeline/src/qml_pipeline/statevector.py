@@ -0,0 +1,282 @@
+"""
+Pure-NumPy statevector engine.
+
+Simulates the Encoder and VariationalCircuit gate sets for a whole batch of
+samples at once. The state is a (batch, 2**n_qubits) array with Qiskit's
+little-endian ordering (bit q of a basis index is qubit q), so the
+expectation values match the Aer path in ``utils.expectation_z``.
+
+Circuits are built as lists of ops, ``(kind, qubits, value)``:
+
+    ('matrix',     (q,),    m)       single-qubit gate, m (2, 2) or (batch, 2, 2)
+    ('x',          (q,),    mask)    X on the samples selected by mask (None: all)
+    ('phase',      qubits,  (c, p))  diagonal gate exp(i·Σ_k c_k·p_k): c (K,) shared
+                                     or (batch, K) per sample, p (K, 2**n) real
+    ('amplitudes', (),      a)       replace the state with a (batch, 2**n)
+    ('barrier',    (),      None)
+
+RZ, CRZ and CZ are all 'phase' ops. fuse_diagonals() merges each run of them
+into one, so a layer of O(n²) CZ or ZZ-feature phases costs one matmul, one
+exp and one elementwise multiply instead of one pass over the state per gate.
+"""
+import functools
+
+import numpy as np
+
+from qml_pipeline.utils import expectation_z_batch
+
+SUPPORTED_PRECISIONS = {'single': np.complex64, 'double': np.complex128}
+
+
+@functools.lru_cache(maxsize=None)
+def _bit(n_qubits: int, qubit: int) -> np.ndarray:
+    bit = (np.arange(2 ** n_qubits) >> qubit) & 1
+    bit.flags.writeable = False
+    return bit
+
+
+def _z_sign(n_qubits: int, qubit: int) -> np.ndarray:
+    return 1 - 2 * _bit(n_qubits, qubit)          # +1 for |0>, -1 for |1>
+
+
+# ─── Gate ops ─────────────────────────────────────────────────────────────────
+
+def _phase(coeff, pattern: np.ndarray, qubits) -> tuple:
+    coeff = np.asarray(coeff, dtype=float)
+    return ('phase', tuple(qubits), (coeff[..., None], pattern[None, :].astype(float)))
+
+
+def rx_op(theta, qubit: int) -> tuple:
+    c, s = _half_angles(theta)
+    return ('matrix', (qubit,), _stack2x2(c, -1j * s, -1j * s, c))
+
+
+def ry_op(theta, qubit: int) -> tuple:
+    c, s = _half_angles(theta)
+    return ('matrix', (qubit,), _stack2x2(c, -s, s, c))
+
+
+def rz_op(theta, qubit: int, n_qubits: int) -> tuple:
+    return _phase(-0.5 * np.asarray(theta, dtype=float), _z_sign(n_qubits, qubit), (qubit,))
+
+
+def crz_op(theta, control: int, target: int, n_qubits: int) -> tuple:
+    pattern = _z_sign(n_qubits, target) * _bit(n_qubits, control)
+    return _phase(-0.5 * np.asarray(theta, dtype=float), pattern, (control, target))
+
+
+def cz_op(q1: int, q2: int, n_qubits: int) -> tuple:
+    return _phase(np.pi, _bit(n_qubits, q1) & _bit(n_qubits, q2), (q1, q2))
+
+
+def fuse_diagonals(ops: list) -> list:
+    """
+    Merge runs of 'phase' ops into single ops; barriers are dropped.
+
+    A gate on qubits the pending phases do not touch commutes with them, so it
+    is emitted ahead of them and the run continues — e.g. the RZs of an 'rxyz'
+    layer fuse with the CZ layer that follows. Anything else flushes the run.
+    """
+    out, coeffs, patterns, touched = [], [], [], set()
+
+    def flush():
+        if not coeffs:
+            return
+        # Shared (K,) coefficients join per-sample (batch, K) ones by broadcasting.
+        batch = next((c.shape[0] for c in coeffs if c.ndim == 2), None)
+        if batch is not None:
+            stacked = [np.broadcast_to(c, (batch, c.shape[-1])) for c in coeffs]
+        else:
+            stacked = coeffs
+        out.append(('phase', tuple(sorted(touched)),
+                    (np.concatenate(stacked, axis=-1), np.concatenate(patterns, axis=0))))
+        coeffs.clear()
+        patterns.clear()
+        touched.clear()
+
+    for op in ops:
+        kind, qubits, value = op
+        if kind == 'barrier':
+            continue
+        if kind == 'phase':
+            coeffs.append(value[0])
+            patterns.append(value[1])
+            touched.update(qubits)
+            continue
+        if kind == 'amplitudes' or touched.intersection(qubits):
+            flush()
+        out.append(op)
+    flush()
+    return out
+
+
+# ─── State ────────────────────────────────────────────────────────────────────
+
+class BatchedStatevector:
+    """A batch of n-qubit statevectors, one row per sample, starting in |0...0>."""
+
+    def __init__(self, n_qubits: int, batch: int, precision: str = 'double'):
+        if precision not in SUPPORTED_PRECISIONS:
+            raise ValueError(
+                f"precision='{precision}' unknown. Choose from {tuple(SUPPORTED_PRECISIONS)}"
+            )
+        self.n_qubits = n_qubits
+        self.batch    = batch
+        self.dtype    = SUPPORTED_PRECISIONS[precision]
+        self.state    = np.zeros((batch, 2 ** n_qubits), dtype=self.dtype)
+        self.state[:, 0] = 1.0
+
+    # ── Primitive updates ───────────────────────────────────────────────────
+
+    def apply_matrix(self, matrix: np.ndarray, qubit: int):
+        """
+        Apply a single-qubit gate: ``matrix`` is (2, 2), shared by every sample,
+        or (batch, 2, 2), one per sample.
+        """
+        view   = self.state.reshape(self.batch, -1, 2, 2 ** qubit)
+        matrix = np.asarray(matrix, dtype=self.dtype)
+        if matrix.ndim == 2:
+            view[:] = np.einsum('ij,bhjl->bhil', matrix, view)
+        else:
+            view[:] = np.einsum('bij,bhjl->bhil', matrix, view)
+
+    def apply_diagonal(self, diagonal: np.ndarray):
+        """Multiply by a diagonal gate: (2**n,) shared, or (batch, 2**n) per sample."""
+        self.state *= np.asarray(diagonal, dtype=self.dtype)
+
+    def apply_phases(self, coeffs: np.ndarray, patterns: np.ndarray):
+        """Multiply by exp(i·coeffs @ patterns) — one exp and one pass for any number of phases."""
+        self.apply_diagonal(np.exp(1j * (coeffs @ patterns)))
+
+    def set_amplitudes(self, amplitudes: np.ndarray):
+        self.state[:] = np.asarray(amplitudes, dtype=self.dtype)
+
+    def apply(self, ops: list, fuse: bool = True):
+        """Apply a list of ops (see module docstring), fusing diagonal runs unless ``fuse`` is False."""
+        for kind, qubits, value in (fuse_diagonals(ops) if fuse else ops):
+            if kind == 'matrix':
+                self.apply_matrix(value, qubits[0])
+            elif kind == 'phase':
+                self.apply_phases(*value)
+            elif kind == 'x':
+                self.x(qubits[0], mask=value)
+            elif kind == 'amplitudes':
+                self.set_amplitudes(value)
+
+    # ── Gates ───────────────────────────────────────────────────────────────
+
+    def x(self, qubit: int, mask=None):
+        """X on ``qubit``; ``mask`` (batch,) limits it to the selected samples."""
+        view    = self.state.reshape(self.batch, -1, 2, 2 ** qubit)
+        flipped = view[:, :, ::-1, :]
+        if mask is None:
+            view[:] = flipped.copy()
+        else:
+            view[mask] = flipped[mask]
+
+    def rx(self, theta, qubit: int):
+        self.apply([rx_op(theta, qubit)])
+
+    def ry(self, theta, qubit: int):
+        self.apply([ry_op(theta, qubit)])
+
+    def rz(self, theta, qubit: int):
+        self.apply([rz_op(theta, qubit, self.n_qubits)])
+
+    def crz(self, theta, control: int, target: int):
+        self.apply([crz_op(theta, control, target, self.n_qubits)])
+
+    def cz(self, q1: int, q2: int):
+        self.apply([cz_op(q1, q2, self.n_qubits)])
+
+    # ── Measurement ─────────────────────────────────────────────────────────
+
+    def expectation_z(self) -> np.ndarray:
+        """<Z_q> for every qubit, shape (batch, n_qubits), in float64."""
+        return expectation_z_batch(self.state, self.n_qubits)
+
+
+def _half_angles(theta):
+    theta = np.asarray(theta, dtype=float) / 2.0
+    return np.cos(theta), np.sin(theta)
+
+
+def _stack2x2(a, b, c, d) -> np.ndarray:
+    """[[a, b], [c, d]] — scalars give (2, 2), (batch,) arrays give (batch, 2, 2)."""
+    return np.moveaxis(np.array([[a, b], [c, d]]), (0, 1), (-2, -1))
+
+
+# ─── Encoder and variational circuit ──────────────────────────────────────────
+
+def encode_ops(encoder, data: np.ndarray) -> list:
+    """
+    Ops of ``encoder``'s circuit for every row of ``data``. Every encoding
+    except ZZ produces a product (or given) state, so it is written in
+    directly from Encoder.encode_states().
+    """
+    if encoder.encoding_type != 'zz':
+        return [('amplitudes', (), encoder.encode_states(data))]
+
+    n_qubits = encoder.n_qubits
+    n        = min(data.shape[1], n_qubits)
+    scaled   = encoder.normalize_rows(data)
+    ops      = [ry_op(scaled[:, i], i) for i in range(n)]
+    ops     += [crz_op(2.0 * scaled[:, i] * scaled[:, j], i, j, n_qubits)
+                for i in range(n) for j in range(i + 1, n)]
+    return ops
+
+
+def variational_tape(var_circuit, values: np.ndarray) -> list:
+    """
+    ``(op, param_index, generator)`` for every op of ``var_circuit``: rotations
+    carry the index of their parameter and their Pauli generator ('x', 'y' or
+    'z'), everything else (CZs, barriers) carries ``(None, None)``.
+    """
+    n         = var_circuit.n_qubits
+    rotations = {'rx': rx_op, 'ry': ry_op, 'rz': lambda theta, q: rz_op(theta, q, n)}
+    axes      = ('x', 'y', 'z') if var_circuit.ansatz == 'rxyz' else (var_circuit.ansatz[1],)
+    tape      = []
+    param_idx = 0
+    for _ in range(var_circuit.layers):
+        for qubit in range(n):
+            for axis in axes:
+                tape.append((rotations['r' + axis](values[param_idx], qubit), param_idx, axis))
+                param_idx += 1
+
+        if var_circuit.entanglement == 'full':
+            pairs = [(q1, q2) for q1 in range(n) for q2 in range(q1 + 1, n)]
+        else:
+            pairs = [(q, q + 1) for q in range(n - 1)]
+            if var_circuit.entanglement == 'circular' and n > 2:
+                pairs.append((n - 1, 0))
+        tape += [(cz_op(q1, q2, n), None, None) for q1, q2 in pairs]
+        tape.append((('barrier', (), None), None, None))
+    return tape
+
+
+def variational_ops(var_circuit, values: np.ndarray) -> list:
+    """Ops of ``var_circuit`` with parameter ``values`` (shared by the batch), barriers included."""
+    return [op for op, _, _ in variational_tape(var_circuit, values)]
+
+
+def encode(sv: BatchedStatevector, encoder, data: np.ndarray, fuse: bool = True):
+    """Apply ``encoder``'s circuit for every row of ``data`` to ``sv``."""
+    sv.apply(encode_ops(encoder, data), fuse)
+
+
+def apply_variational(sv: BatchedStatevector, var_circuit, values: np.ndarray, fuse: bool = True):
+    """Apply ``var_circuit`` with parameter ``values`` (shared by the batch) to ``sv``."""
+    sv.apply(variational_ops(var_circuit, values), fuse)
+
+
+def simulate(encoder, var_circuit, values, data, precision: str = 'double',
+             fuse: bool = True) -> BatchedStatevector:
+    """
+    Final states of encoder + variational circuit for every row of ``data``.
+    ``fuse`` merges diagonal runs across the whole circuit (see fuse_diagonals).
+    """
+    data = np.atleast_2d(np.asarray(data, dtype=float))
+    sv   = BatchedStatevector(encoder.n_qubits, len(data), precision)
+    sv.apply(encode_ops(encoder, data) + variational_ops(var_circuit, np.asarray(values, dtype=float)),
+             fuse)
+    return sv
@@ -0,0 +1,169 @@
+"""
+Training for Pipeline.fit(): adjoint-method gradients on the NumPy
+statevector engine.
+
+The loss is softmax cross-entropy over ``logit_scale``·<Z_q>, with qubit q
+voting for class q % n_classes — the same rule Pipeline.evaluate() uses to
+turn <Z> into predictions. Its gradient with respect to <Z> gives, per
+sample, a diagonal observable M = Σ_q g_q·Z_q, and
+
+    dL/dθ_k = Im <λ_k| G_k |ψ_k>,    λ = M|ψ>
+
+for a rotation exp(-iθ_k·G_k/2), where ψ_k and λ_k are the state and λ
+just after gate k. One forward pass builds ψ; one backward sweep un-applies
+each gate to ψ and λ and reads every parameter's overlap on the way, so the
+full gradient costs about two more passes instead of the 2P circuit runs of
+parameter shift. Everything is batched over the samples of a mini-batch.
+"""
+import numpy as np
+
+from qml_pipeline.statevector import (BatchedStatevector,
+                                      _z_sign,
+                                      encode_ops,
+                                      fuse_diagonals,
+                                      variational_tape)
+
+
+# ─── Optimizers ───────────────────────────────────────────────────────────────
+
+class SGD:
+    def __init__(self, learning_rate: float = 0.1, momentum: float = 0.0):
+        self.learning_rate = learning_rate
+        self.momentum      = momentum
+        self._velocity     = None
+
+    def step(self, params: np.ndarray, grad: np.ndarray) -> np.ndarray:
+        if self._velocity is None:
+            self._velocity = np.zeros_like(params)
+        self._velocity = self.momentum * self._velocity - self.learning_rate * grad
+        return params + self._velocity
+
+
+class Adam:
+    def __init__(self, learning_rate: float = 0.05, beta1: float = 0.9,
+                 beta2: float = 0.999, eps: float = 1e-8):
+        self.learning_rate = learning_rate
+        self.beta1         = beta1
+        self.beta2         = beta2
+        self.eps           = eps
+        self._m, self._v, self._t = None, None, 0
+
+    def step(self, params: np.ndarray, grad: np.ndarray) -> np.ndarray:
+        if self._m is None:
+            self._m, self._v = np.zeros_like(params), np.zeros_like(params)
+        self._t += 1
+        self._m  = self.beta1 * self._m + (1 - self.beta1) * grad
+        self._v  = self.beta2 * self._v + (1 - self.beta2) * grad ** 2
+        m_hat    = self._m / (1 - self.beta1 ** self._t)
+        v_hat    = self._v / (1 - self.beta2 ** self._t)
+        return params - self.learning_rate * m_hat / (np.sqrt(v_hat) + self.eps)
+
+
+SUPPORTED_OPTIMIZERS = {'adam': Adam, 'sgd': SGD}
+
+
+def make_optimizer(optimizer):
+    """A name from SUPPORTED_OPTIMIZERS (default settings), or any object with step(params, grad)."""
+    if isinstance(optimizer, str):
+        if optimizer not in SUPPORTED_OPTIMIZERS:
+            raise ValueError(
+                f"optimizer='{optimizer}' unknown. Choose from {tuple(SUPPORTED_OPTIMIZERS)}"
+            )
+        return SUPPORTED_OPTIMIZERS[optimizer]()
+    if not callable(getattr(optimizer, 'step', None)):
+        raise ValueError("optimizer must be a name or an object with a step(params, grad) method")
+    return optimizer
+
+
+# ─── Loss ─────────────────────────────────────────────────────────────────────
+
+def cross_entropy(expectations: np.ndarray, targets: np.ndarray, n_classes: int,
+                  logit_scale: float = 5.0) -> tuple:
+    """
+    Mean cross-entropy of integer ``targets`` under softmax(logit_scale·<Z>),
+    where class c collects the probability of every qubit q with q % n_classes
+    == c. Returns (loss, dloss/d<Z> of shape (batch, n_qubits)).
+    """
+    batch, n_qubits = expectations.shape
+    logits  = logit_scale * expectations
+    logits -= logits.max(axis=1, keepdims=True)
+    probs   = np.exp(logits)
+    probs  /= probs.sum(axis=1, keepdims=True)
+
+    votes   = (np.arange(n_qubits) % n_classes)[None, :] == np.asarray(targets)[:, None]
+    p_class = (probs * votes).sum(axis=1)
+    loss    = -np.mean(np.log(p_class))
+    dlogits = probs - votes * probs / p_class[:, None]
+    return float(loss), logit_scale * dlogits / batch
+
+
+# ─── Adjoint gradient ─────────────────────────────────────────────────────────
+
+def _inverse(op: tuple) -> tuple:
+    kind, qubits, value = op
+    if kind == 'matrix':
+        return kind, qubits, np.conj(np.swapaxes(value, -1, -2))
+    if kind == 'phase':
+        return kind, qubits, (-value[0], value[1])
+    return op                                   # X is its own inverse
+
+
+def _generator_overlap(lam: np.ndarray, psi: np.ndarray, axis: str, qubit: int, n_qubits: int) -> complex:
+    """Σ_batch <λ|P_qubit|ψ> for the Pauli ``axis``, read straight off the state arrays."""
+    if axis == 'z':
+        return np.sum(lam.conj() * psi * _z_sign(n_qubits, qubit))
+    lv = lam.reshape(len(lam), -1, 2, 2 ** qubit).conj()
+    pv = psi.reshape(len(psi), -1, 2, 2 ** qubit)
+    lower = np.sum(lv[:, :, 0] * pv[:, :, 1])      # <λ_0|ψ_1>
+    upper = np.sum(lv[:, :, 1] * pv[:, :, 0])      # <λ_1|ψ_0>
+    return lower + upper if axis == 'x' else -1j * lower + 1j * upper
+
+
+def _compile_tape(tape: list) -> list:
+    """Fuse each run of parameter-free ops (a CZ layer) into one op; parameterised ops stay apart."""
+    out, run = [], []
+    for op, param_idx, axis in tape:
+        if param_idx is None:
+            run.append(op)
+            continue
+        out += [(fused, None, None) for fused in fuse_diagonals(run)]
+        run = []
+        out.append((op, param_idx, axis))
+    out += [(fused, None, None) for fused in fuse_diagonals(run)]
+    return out
+
+
+def loss_and_gradient(var_circuit, values: np.ndarray, encoded: np.ndarray, targets: np.ndarray,
+                      n_classes: int, logit_scale: float = 5.0) -> tuple:
+    """
+    Loss and its gradient with respect to ``values`` for a batch of encoded
+    statevectors ``encoded`` (batch, 2**n), by the adjoint method.
+    """
+    n    = var_circuit.n_qubits
+    tape = _compile_tape(variational_tape(var_circuit, values))
+
+    psi = BatchedStatevector(n, len(encoded))
+    psi.set_amplitudes(encoded)
+    psi.apply([op for op, _, _ in tape], fuse=False)
+
+    loss, dz = cross_entropy(psi.expectation_z(), targets, n_classes, logit_scale)
+    batch    = len(encoded)
+    # ψ and λ = M|ψ> share one state array, so every inverse gate is a single pass.
+    both = BatchedStatevector(n, 2 * batch)
+    both.set_amplitudes(np.concatenate(
+        [psi.state, psi.state * (dz @ np.array([_z_sign(n, q) for q in range(n)]))]))
+    psi_state, lam_state = both.state[:batch], both.state[batch:]
+
+    grad = np.zeros(len(values))
+    for op, param_idx, axis in reversed(tape):
+        if param_idx is not None:
+            grad[param_idx] = np.imag(_generator_overlap(lam_state, psi_state, axis, op[1][0], n))
+        both.apply([_inverse(op)], fuse=False)
+    return loss, grad
+
+
+def encode_dataset(encoder, X: np.ndarray) -> np.ndarray:
+    """Encoded statevectors of every row of ``X`` — computed once per fit, sliced per mini-batch."""
+    sv = BatchedStatevector(encoder.n_qubits, len(X))
+    sv.apply(encode_ops(encoder, X))
+    return sv.state
@@ -22,13 +22,109 @@ def expectation_z(circuit, n_qubits: int) -> np.ndarray:
     except Exception:
         return np.zeros(n_qubits)
 
-    exp_vals = np.zeros(n_qubits)
+    return expectation_z_batch(state[None, :], n_qubits)[0]
+
+
+def _statevector_backend():
+    from qiskit import Aer
+    return Aer.get_backend('statevector_simulator')
+
+
+# Gates that are diagonal in the computational basis once their angles are bound.
+_DIAGONAL_GATES = {'cz', 'z', 's', 'sdg', 't', 'tdg', 'rz', 'p', 'u1', 'crz', 'cp', 'cu1', 'rzz'}
+
+
+def _has_free_parameters(gate) -> bool:
+    """
+    True if any angle of ``gate`` still has unbound parameters. Checked on
+    the params themselves: a bound expression (CRZ(2·θ) after binding θ)
+    stays a ParameterExpression with no parameters left, and is fusable.
+    """
+    from qiskit.circuit import ParameterExpression
+    return any(isinstance(p, ParameterExpression) and p.parameters for p in gate.params)
+
+
+def fuse_diagonal_gates(circuit):
+    """
+    Copy of ``circuit`` with each run of bound diagonal gates (CZ, bound RZ /
+    CRZ / phase gates, ...) merged into one Aer-native ``diagonal`` gate on the
+    qubits the run touches; barriers are dropped.
+
+    A gate on qubits the run has not touched commutes with it, so it is
+    emitted ahead of the run instead of ending it. Gates with unbound
+    parameters are never fused.
+    """
+    from qiskit import QuantumCircuit
+    from qiskit.extensions.quantum_initializer import DiagonalGate
+    from qiskit.quantum_info import Operator
+
+    out = QuantumCircuit(*circuit.qregs, *circuit.cregs, global_phase=circuit.global_phase)
+    run, touched = [], []
+
+    def flush():
+        if len(run) == 1:
+            out.append(*run[0])
+        elif run:
+            index = np.arange(2 ** len(touched))
+            diag  = np.ones(len(index), dtype=complex)
+            for gate, qargs, _ in run:
+                local = sum(((index >> touched.index(q)) & 1) << k for k, q in enumerate(qargs))
+                diag *= np.diag(Operator(gate).data)[local]
+            out.append(DiagonalGate(diag.tolist()), touched)
+        run.clear()
+        touched.clear()
+
+    for gate, qargs, cargs in circuit.data:
+        if gate.name == 'barrier':
+            continue
+        if gate.name in _DIAGONAL_GATES and not _has_free_parameters(gate):
+            run.append((gate, qargs, cargs))
+            touched.extend(q for q in qargs if q not in touched)
+            continue
+        if gate.name == 'measure' or any(q in touched for q in qargs):
+            flush()
+        out.append(gate, qargs, cargs)
+    flush()
+    return out
+
+
+def compile_circuit(circuit, fuse: bool = True):
+    """
+    Transpile ``circuit`` (or a list of circuits) for the Aer statevector
+    simulator, after fuse_diagonal_gates() unless ``fuse`` is False.
+    """
+    from qiskit import transpile
+    if fuse:
+        circuit = ([fuse_diagonal_gates(c) for c in circuit] if isinstance(circuit, list)
+                   else fuse_diagonal_gates(circuit))
+    return transpile(circuit, _statevector_backend())
+
+
+def run_statevectors(circuits, parameter_binds=None) -> np.ndarray:
+    """
+    Final statevectors from a single Aer job, one row per experiment.
+    ``parameter_binds`` ({parameter: [value per experiment]} per circuit) runs
+    a parameterised circuit once for every set of values.
+    """
+    result = _statevector_backend().run(circuits, parameter_binds=parameter_binds).result()
+    return np.array([result.get_statevector(i) for i in range(len(result.results))])
+
+
+def expectation_z_batch(states: np.ndarray, n_qubits: int) -> np.ndarray:
+    """
+    <Z_q> for a (batch, 2**n_qubits) matrix of statevectors, shape (batch, n_qubits).
+    Bit q of a basis index is qubit q, so reshaping the probabilities to
+    (batch, high bits, bit q, low bits) puts P(qubit q = 1) in one slice.
+    """
+    probs = np.abs(np.atleast_2d(states)) ** 2
+    probs = probs.astype(np.float64, copy=False)
+    batch = probs.shape[0]
+    total = probs.sum(axis=1)
+
+    exp_vals = np.empty((batch, n_qubits))
     for q in range(n_qubits):
-        for idx, amp in enumerate(state):
-            prob = abs(amp) ** 2
-            bit  = (idx >> q) & 1
-            exp_vals[q] += prob * (1.0 if bit == 0 else -1.0)
-
+        p_one = probs.reshape(batch, -1, 2, 2 ** q)[:, :, 1, :].sum(axis=(1, 2))
+        exp_vals[:, q] = total - 2.0 * p_one
     return exp_vals
 
 
@@ -73,21 +169,35 @@ def confusion_matrix_simple(predictions: np.ndarray,
     if n_classes is None:
         n_classes = int(max(labels.max(), predictions.max())) + 1
 
-    cm = np.zeros((n_classes, n_classes), dtype=int)
-    for true, pred in zip(labels, predictions):
-        cm[true][pred] += 1
-    return cm
-
+    cells = np.bincount(labels * n_classes + predictions, minlength=n_classes * n_classes)
+    return cells.reshape(n_classes, n_classes)
 
 
 def flatten_counts(counts: dict, n_qubits: int) -> np.ndarray:
+    """
+    Probability vector of length 2**n_qubits from a counts dict. Character k of
+    a bitstring is bit k of its index; outcomes beyond 2**n_qubits are dropped.
+    """
     dim   = 2 ** n_qubits
     probs = np.zeros(dim)
-    total = sum(counts.values())
-
-    for bitstring, count in counts.items():
-        idx        = int(bitstring[::-1], 2)
-        if idx < dim:
-            probs[idx] = count / total
-
-    return probs
+    if not counts:
+        return probs
+
+    keys   = list(counts.keys())
+    width  = len(keys[0])
+    # Usual case, every bitstring the same width: one character matrix straight
+    # from the joined keys, checked by where the separators landed.
+    chars  = np.frombuffer(' '.join(keys).encode('ascii') + b' ', dtype=np.uint8)
+    if chars.size == len(keys) * (width + 1) and (chars[width::width + 1] == ord(' ')).all():
+        chars = chars.reshape(len(keys), width + 1)[:, :width]
+    else:
+        chars = np.array(keys).view(np.uint32).reshape(len(keys), -1)   # right-padded
+    bits   = chars == ord('1')
+    values = np.array(list(counts.values()))
+
+    in_range = ~bits[:, n_qubits:].any(axis=1)
+    width    = min(n_qubits, bits.shape[1])
+    weights  = 2.0 ** np.arange(width)                         # exact below 2**53
+    indices  = (bits[in_range, :width] @ weights).astype(np.int64)
+    probs   += np.bincount(indices, weights=values[in_range], minlength=dim)[:dim]
+    return probs / values.sum()
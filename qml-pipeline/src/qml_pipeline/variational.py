@@ -1,6 +1,6 @@
 import numpy as np
 from qiskit import QuantumCircuit
-from qiskit.circuit import Parameter
+from qiskit.circuit import ParameterVector
 
 SUPPORTED_ANSATZ      = ('ry', 'rz', 'rx', 'rxyz')
 SUPPORTED_ENTANGLE    = ('linear', 'circular', 'full')
@@ -27,7 +27,7 @@ class VariationalCircuit:
     def _initialize_parameters(self) -> list:
         multiplier = 3 if self.ansatz == 'rxyz' else 1
         count      = self.n_qubits * self.layers * multiplier
-        return [Parameter(f'θ_{i}') for i in range(count)]
+        return list(ParameterVector('θ', count))
 
     def _apply_rotation_layer(self, qc: QuantumCircuit, layer: int, param_idx: int) -> int:
         for qubit in range(self.n_qubits):
@@ -7,6 +7,7 @@ from sklearn.datasets import load_iris
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LogisticRegression
 from qiskit import QuantumCircuit, Aer, transpile
+import qiskit_aer.library  # noqa: F401  (adds QuantumCircuit.set_statevector)
 
 
 SUPPORTED_ANSATZ   = ('ry', 'rz', 'rx', 'rxyz')
@@ -72,10 +73,28 @@ def normalize_features(X: np.ndarray) -> np.ndarray:
     return (X - mins) / rng * math.pi
 
 
+def amplitude_states(X: np.ndarray, n_qubits: int) -> np.ndarray:
+    """Normalised, zero-padded rows of ``X`` — the amplitude-encoded states, one per row."""
+    X      = np.atleast_2d(np.array(X, dtype=float))
+    dim    = 2 ** n_qubits
+    padded = np.zeros((len(X), dim))
+    padded[:, :min(X.shape[1], dim)] = X[:, :dim]
+    norms  = np.linalg.norm(padded, axis=1)
+    empty  = norms <= 1e-12
+    padded[empty, 0] = 1.0
+    norms[empty]     = 1.0
+    return padded / norms[:, None]
+
+
 def build_encoding_circuit(x: np.ndarray,
                             n_qubits: int,
-                            encoding_type: str = 'angle') -> QuantumCircuit:
-                              
+                            encoding_type: str = 'angle',
+                            export: bool = False) -> QuantumCircuit:
+    """
+    Encoding circuit for one sample. Amplitude encoding sets the state
+    directly with Aer's set_statevector; ``export=True`` uses initialize()
+    instead, for a circuit that must run outside Aer.
+    """
     qc = QuantumCircuit(n_qubits)
     n  = min(len(x), n_qubits)
 
@@ -84,12 +103,11 @@ def build_encoding_circuit(x: np.ndarray,
             qc.ry(float(x[i]), i)
 
     elif encoding_type == 'amplitude':
-        dim    = 2 ** n_qubits
-        padded = np.zeros(dim)
-        padded[:min(len(x), dim)] = x[:min(len(x), dim)]
-        norm   = np.linalg.norm(padded)
-        padded = padded / norm if norm > 1e-12 else np.eye(dim)[0]
-        qc.initialize(padded.tolist(), list(range(n_qubits)))
+        state = amplitude_states(x, n_qubits)[0]
+        if export:
+            qc.initialize(state.tolist(), list(range(n_qubits)))
+        else:
+            qc.set_statevector(state)
 
     elif encoding_type == 'basis':
         for i in range(n):
@@ -155,38 +173,50 @@ def build_variational_circuit(params: np.ndarray,
 
     return qc
 
-def circuit_feature_vector(x: np.ndarray,
-                            params: np.ndarray,
-                            n_qubits: int,
-                            layers: int,
-                            ansatz: str,
-                            entanglement: str,
-                            encoding_type: str,
-                            backend) -> np.ndarray:
-    
-    enc = build_encoding_circuit(x, n_qubits, encoding_type)
-    var = build_variational_circuit(params, n_qubits, layers, ansatz, entanglement)
-    qc  = enc.compose(var)
-    qc.save_statevector()
-    job    = backend.run(transpile(qc, backend))
-    state  = np.array(job.result().get_statevector())
-
-    feats = []
-    for q in range(n_qubits):
-        exp = sum(
-            (abs(amp) ** 2) * (1.0 if ((i >> q) & 1) == 0 else -1.0)
-            for i, amp in enumerate(state)
-        )
-        feats.append(exp)
-    return np.array(feats)
-                              
+def circuit_features(X: np.ndarray,
+                     params: np.ndarray,
+                     n_qubits: int,
+                     layers: int,
+                     ansatz: str,
+                     entanglement: str,
+                     encoding_type: str,
+                     backend,
+                     export: bool = False) -> np.ndarray:
+    """
+    <Z> of every qubit for each row of ``X``, as a (rows, n_qubits) array.
+    The ansatz is transpiled once, the encodings in one call, and every row
+    runs in a single Aer job; amplitude states are computed for all rows
+    together and need no transpiling.
+    """
+    var = transpile(build_variational_circuit(params, n_qubits, layers, ansatz, entanglement), backend)
+
+    if encoding_type == 'amplitude' and not export:
+        encodings = []
+        for state in amplitude_states(X, n_qubits):
+            enc = QuantumCircuit(n_qubits)
+            enc.set_statevector(state)
+            encodings.append(enc)
+    else:
+        encodings = transpile([build_encoding_circuit(x, n_qubits, encoding_type, export) for x in X], backend)
+
+    circuits = []
+    for enc in encodings:
+        qc = enc.compose(var)
+        qc.save_statevector()
+        circuits.append(qc)
+    result = backend.run(circuits).result()
+    probs  = np.abs(np.array([result.get_statevector(i) for i in range(len(circuits))])) ** 2
+
+    bits  = (np.arange(2 ** n_qubits)[:, None] >> np.arange(n_qubits)) & 1
+    return probs @ (1.0 - 2.0 * bits)
+
 
 def param_count(n_qubits: int, layers: int, ansatz: str) -> int:
     mult = 3 if ansatz == 'rxyz' else 1
     return n_qubits * layers * mult
 
 
-def evaluate_pipeline(conf: dict, tries: int = 10) -> dict:
+def evaluate_pipeline(conf: dict, tries: int = 10, export: bool = False) -> dict:
     iris    = load_iris()
     Xn      = normalize_features(iris.data)
     y       = iris.target
@@ -208,12 +238,13 @@ def evaluate_pipeline(conf: dict, tries: int = 10) -> dict:
 
     for t in range(tries):
         params = np.random.uniform(0, 2 * math.pi, size=(p_dim,))
-        kwargs = dict(n_qubits=n_qubits, layers=layers,
-                      ansatz=ansatz, entanglement=entanglement,
-                      encoding_type=encoding, backend=backend)
         try:
-            X_tr_f = np.vstack([circuit_feature_vector(x, params, **kwargs) for x in X_train])
-            X_te_f = np.vstack([circuit_feature_vector(x, params, **kwargs) for x in X_test])
+            feats  = circuit_features(np.vstack([X_train, X_test]), params,
+                                      n_qubits=n_qubits, layers=layers,
+                                      ansatz=ansatz, entanglement=entanglement,
+                                      encoding_type=encoding, backend=backend,
+                                      export=export)
+            X_tr_f, X_te_f = feats[:len(X_train)], feats[len(X_train):]
         except Exception as e:
             print(f"  [try {t+1}] circuit error: {e}")
             continue
@@ -249,6 +280,9 @@ def main():
     parser.add_argument('model_path', help='Path to pipeline_model.json')
     parser.add_argument('--tries', type=int, default=10,
                         help='Number of random parameter initialisations (default: 10)')
+    parser.add_argument('--export', action='store_true',
+                        help='Prepare amplitude-encoded rows with initialize(), '
+                             'as circuits run outside Aer would')
     args = parser.parse_args()
 
     model = load_model(args.model_path)
@@ -257,7 +291,7 @@ def main():
     print("Pipeline config inferred:", conf)
     print(f"Running {args.tries} random-parameter trials on Iris …\n")
 
-    out = evaluate_pipeline(conf, tries=args.tries)
+    out = evaluate_pipeline(conf, tries=args.tries, export=args.export)
 
     print("\n── Results ──────────────────────────────")
     for k, v in out.items():
@@ -86,6 +86,45 @@ class TestPipelineParams(unittest.TestCase):
             self.pipeline.params = np.zeros(999)
 
 
+def _aer_available():
+    try:
+        from qiskit import Aer  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+@unittest.skipUnless(_aer_available(), 'qiskit Aer not installed')
+class TestPipelineRun(unittest.TestCase):
+
+    def test_single_job_matches_numpy_engine(self):
+        data = np.array([[0.1, 0.7, 0.3], [1.5, -0.3, 0.2], [2.0, 2.0, 2.0]])
+        for enc in ('angle', 'basis', 'zz', 'amplitude'):
+            with self.subTest(encoding=enc):
+                p = Pipeline({**BASE_CONFIG, 'n_qubits': 3, 'encoding_type': enc})
+                x = (data > 0.5).astype(float) if enc == 'basis' else data
+                np.testing.assert_allclose(p.run(x), p.run(x, backend='numpy'), atol=1e-9)
+
+    def test_simulation_errors_are_raised(self):
+        p = Pipeline(BASE_CONFIG)
+
+        def broken(data):
+            raise RuntimeError('simulator failed')
+
+        p._run_aer = broken
+        with self.assertRaisesRegex(RuntimeError, 'simulator failed'):
+            p.run(np.array([[0.1, 0.2]]))
+
+    def test_template_is_compiled_once(self):
+        p    = Pipeline(BASE_CONFIG)
+        data = np.array([[0.1, 0.2], [0.3, 0.4]])
+        p.run(data)
+        template = p._templates[2]
+        p.params = np.zeros(p.var_circuit.param_count())
+        p.run(data)
+        self.assertIs(p._templates[2], template)
+
+
 class TestPreprocessData(unittest.TestCase):
 
     def test_output_range(self):
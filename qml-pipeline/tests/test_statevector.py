@@ -0,0 +1,114 @@
+import itertools
+import unittest
+import numpy as np
+from qiskit.quantum_info import Statevector
+
+from qml_pipeline.encoder     import Encoder
+from qml_pipeline.pipeline    import Pipeline
+from qml_pipeline.statevector import (BatchedStatevector, cz_op, fuse_diagonals, rx_op,
+                                      rz_op, simulate, variational_ops)
+
+
+def _reference_states(pipeline, data):
+    bindings = pipeline.var_circuit.get_parameter_values(pipeline.params.tolist())
+    var_qc   = pipeline.var_circuit.build_circuit().assign_parameters(bindings)
+    return np.array([
+        Statevector.from_instruction(pipeline.encoder.encode(row, export=True).compose(var_qc)).data
+        for row in data
+    ])
+
+
+class TestStatevectorEngine(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def _data(self, encoding, n_rows=4, n_features=3):
+        data = self.rng.normal(size=(n_rows, n_features))
+        return (data > 0).astype(float) if encoding == 'basis' else data
+
+    def test_matches_qiskit_for_every_variant(self):
+        variants = itertools.product(('angle', 'amplitude', 'basis', 'zz'),
+                                     ('ry', 'rz', 'rx', 'rxyz'),
+                                     ('linear', 'circular', 'full'))
+        for encoding, ansatz, ent in variants:
+            with self.subTest(encoding=encoding, ansatz=ansatz, entanglement=ent):
+                p = Pipeline({'n_qubits': 3, 'layers': 2, 'ansatz': ansatz,
+                              'entanglement': ent, 'encoding_type': encoding})
+                data = self._data(encoding, n_features=5 if encoding == 'amplitude' else 3)
+                got  = simulate(p.encoder, p.var_circuit, p.params, data).state
+                np.testing.assert_allclose(got, _reference_states(p, data), atol=1e-10)
+
+    def test_unfused_matches_fused(self):
+        for encoding, ansatz in itertools.product(('angle', 'zz'), ('rz', 'rxyz')):
+            with self.subTest(encoding=encoding, ansatz=ansatz):
+                p    = Pipeline({'n_qubits': 4, 'layers': 2, 'ansatz': ansatz,
+                                 'entanglement': 'full', 'encoding_type': encoding})
+                data = self._data(encoding, n_features=4)
+                np.testing.assert_allclose(
+                    simulate(p.encoder, p.var_circuit, p.params, data, fuse=False).state,
+                    simulate(p.encoder, p.var_circuit, p.params, data).state, atol=1e-12)
+
+    def test_single_precision_halves_memory(self):
+        p    = Pipeline({'n_qubits': 3, 'layers': 1, 'encoding_type': 'zz'})
+        data = self._data('zz')
+        single = simulate(p.encoder, p.var_circuit, p.params, data, precision='single')
+        double = simulate(p.encoder, p.var_circuit, p.params, data, precision='double')
+        self.assertEqual(single.state.dtype, np.complex64)
+        self.assertEqual(single.state.nbytes * 2, double.state.nbytes)
+        np.testing.assert_allclose(single.expectation_z(), double.expectation_z(), atol=1e-5)
+
+    def test_invalid_precision_raises(self):
+        with self.assertRaises(ValueError):
+            BatchedStatevector(2, 1, precision='half')
+
+
+class TestEncodeStates(unittest.TestCase):
+    def test_matches_encoding_circuits(self):
+        rng = np.random.default_rng(1)
+        for encoding, n_features in itertools.product(('angle', 'basis', 'amplitude'), (2, 4, 6)):
+            with self.subTest(encoding=encoding, n_features=n_features):
+                encoder = Encoder(4, encoding)
+                data    = rng.normal(size=(5, n_features))
+                if encoding == 'basis':
+                    data = (data > 0).astype(float)
+                expected = np.array([Statevector.from_instruction(encoder.encode(row, export=True)).data
+                                     for row in data])
+                np.testing.assert_allclose(encoder.encode_states(data), expected, atol=1e-12)
+
+    def test_amplitude_state_is_injected_unless_exported(self):
+        encoder = Encoder(3, 'amplitude')
+        self.assertEqual(set(encoder.encode([1.0, 2.0, 3.0]).count_ops()), {'set_statevector'})
+        self.assertEqual(set(encoder.encode([1.0, 2.0, 3.0], export=True).count_ops()), {'initialize'})
+
+    def test_zz_has_no_product_form(self):
+        with self.assertRaises(ValueError):
+            Encoder(3, 'zz').encode_states(np.ones((2, 3)))
+
+
+class TestFuseDiagonals(unittest.TestCase):
+    def test_full_cz_layers_fuse_across_barriers(self):
+        p   = Pipeline({'n_qubits': 5, 'layers': 2, 'ansatz': 'rz', 'entanglement': 'full'})
+        ops = fuse_diagonals(variational_ops(p.var_circuit, p.params))
+        # Every gate of an 'rz' ansatz is diagonal: both layers become one op.
+        self.assertEqual([op[0] for op in ops], ['phase'])
+        self.assertEqual(ops[0][1], (0, 1, 2, 3, 4))
+
+    def test_gates_on_other_qubits_do_not_end_a_run(self):
+        ops = fuse_diagonals([rz_op(0.3, 0, 3), rx_op(0.2, 2), cz_op(0, 1, 3), rx_op(0.1, 1)])
+        self.assertEqual([(kind, qubits) for kind, qubits, _ in ops],
+                         [('matrix', (2,)), ('phase', (0, 1)), ('matrix', (1,))])
+
+
+class TestPipelineBackends(unittest.TestCase):
+    def test_numpy_backend_matches_reference(self):
+        p    = Pipeline({'n_qubits': 2, 'layers': 2, 'entanglement': 'full'})
+        data = np.array([[0.1, 0.7], [1.5, -0.3], [2.0, 2.0]])
+        out  = p.run(data, backend='numpy')
+        self.assertEqual(out.shape, (3, 2))
+        states = _reference_states(p, data)
+        signs  = np.array([[1, 1], [-1, 1], [1, -1], [-1, -1]])
+        np.testing.assert_allclose(out, np.abs(states) ** 2 @ signs, atol=1e-10)
+
+    def test_invalid_backend_raises(self):
+        with self.assertRaises(ValueError):
+            Pipeline({'n_qubits': 2}).run(np.zeros((1, 2)), backend='gpu')
@@ -0,0 +1,93 @@
+import itertools
+import unittest
+import numpy as np
+
+from qml_pipeline.pipeline import Pipeline
+from qml_pipeline.training import (SGD, cross_entropy, encode_dataset, loss_and_gradient,
+                                   make_optimizer)
+
+
+def _pipeline(**overrides):
+    cfg = {'n_qubits': 3, 'layers': 2, 'ansatz': 'ry', 'entanglement': 'linear',
+           'encoding_type': 'angle', **overrides}
+    return Pipeline(cfg)
+
+
+class TestAdjointGradient(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def _finite_difference(self, p, encoded, targets, eps=1e-6):
+        grad = np.zeros(len(p.params))
+        for k in range(len(grad)):
+            shift    = np.zeros_like(grad)
+            shift[k] = eps
+            plus     = loss_and_gradient(p.var_circuit, p.params + shift, encoded, targets, 2)[0]
+            minus    = loss_and_gradient(p.var_circuit, p.params - shift, encoded, targets, 2)[0]
+            grad[k]  = (plus - minus) / (2 * eps)
+        return grad
+
+    def test_matches_finite_differences_for_every_variant(self):
+        variants = itertools.product(('ry', 'rz', 'rx', 'rxyz'), ('linear', 'circular', 'full'))
+        for ansatz, ent in variants:
+            with self.subTest(ansatz=ansatz, entanglement=ent):
+                p       = _pipeline(ansatz=ansatz, entanglement=ent, encoding_type='zz')
+                data    = self.rng.uniform(size=(5, 3))
+                targets = self.rng.integers(0, 2, size=5)
+                encoded = encode_dataset(p.encoder, data)
+                _, grad = loss_and_gradient(p.var_circuit, p.params, encoded, targets, 2)
+                np.testing.assert_allclose(grad, self._finite_difference(p, encoded, targets),
+                                           atol=1e-6)
+
+    def test_loss_matches_forward_pass(self):
+        p       = _pipeline(ansatz='rxyz', entanglement='full')
+        data    = self.rng.uniform(size=(6, 3))
+        targets = self.rng.integers(0, 2, size=6)
+        loss, _ = loss_and_gradient(p.var_circuit, p.params, encode_dataset(p.encoder, data),
+                                    targets, 2)
+        expected, _ = cross_entropy(p.run(data, backend='numpy'), targets, 2)
+        self.assertAlmostEqual(loss, expected, places=10)
+
+
+class TestFit(unittest.TestCase):
+    def setUp(self):
+        rng    = np.random.default_rng(1)
+        self.X = rng.uniform(size=(40, 4))
+        self.y = (self.X[:, 0] > self.X[:, 1]).astype(int)
+
+    def _fitted(self, **kwargs):
+        p        = _pipeline(n_qubits=4)
+        p.params = np.full(p.params.shape, 0.1)
+        history  = p.fit(self.X, self.y, seed=0, **kwargs)
+        return p, history
+
+    def test_loss_decreases_and_model_learns(self):
+        p, history = self._fitted(epochs=30, batch_size=10)
+        self.assertEqual(len(history), 30)
+        self.assertIs(history, p.loss_history)
+        self.assertLess(history[-1], 0.5 * history[0])
+        self.assertGreater(p.evaluate(p.run(self.X, backend='numpy'), self.y)['accuracy'], 0.8)
+
+    def test_same_seed_is_reproducible(self):
+        _, first  = self._fitted(epochs=3, batch_size=7)
+        _, second = self._fitted(epochs=3, batch_size=7)
+        self.assertEqual(first, second)
+
+    def test_optimizer_object(self):
+        _, history = self._fitted(epochs=5, optimizer=SGD(learning_rate=0.5, momentum=0.5))
+        self.assertLess(history[-1], history[0])
+
+    def test_invalid_arguments_raise(self):
+        p = _pipeline(n_qubits=2)
+        with self.assertRaises(ValueError):
+            p.fit(self.X, np.arange(40) % 3)
+        with self.assertRaises(ValueError):
+            p.fit(self.X, self.y[:10])
+        with self.assertRaises(ValueError):
+            p.fit(self.X, self.y, batch_size=0)
+        with self.assertRaises(ValueError):
+            make_optimizer('lbfgs')
+
+
+if __name__ == '__main__':
+    unittest.main()
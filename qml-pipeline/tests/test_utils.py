@@ -4,7 +4,9 @@ import numpy as np
 from qml_pipeline.utils import (
     compute_accuracy,
     confusion_matrix_simple,
+    expectation_z_batch,
     flatten_counts,
+    fuse_diagonal_gates,
     validate_pipeline_config,
 )
 
@@ -85,6 +87,91 @@ class TestFlattenCounts(unittest.TestCase):
             self.assertAlmostEqual(p, 0.25, places=5)
 
 
+    def test_character_k_is_bit_k(self):
+        probs = flatten_counts({'100': 1, '001': 3}, n_qubits=3)
+        self.assertAlmostEqual(probs[1], 0.25)
+        self.assertAlmostEqual(probs[4], 0.75)
+
+    def test_mixed_widths(self):
+        probs = flatten_counts({'1': 1, '01': 1}, n_qubits=2)
+        np.testing.assert_allclose(probs, [0, 0.5, 0.5, 0])
+
+    def test_out_of_range_outcomes_dropped(self):
+        probs = flatten_counts({'0001': 1, '1000': 1}, n_qubits=2)
+        self.assertAlmostEqual(probs[1], 0.5)
+        self.assertAlmostEqual(probs.sum(), 0.5)
+
+
+class TestExpectationZBatch(unittest.TestCase):
+
+    def _loop_reference(self, state, n_qubits):
+        exp_vals = np.zeros(n_qubits)
+        for q in range(n_qubits):
+            for idx, amp in enumerate(state):
+                exp_vals[q] += abs(amp) ** 2 * (1.0 if (idx >> q) & 1 == 0 else -1.0)
+        return exp_vals
+
+    def test_matches_per_amplitude_loop(self):
+        rng    = np.random.default_rng(0)
+        states = rng.normal(size=(3, 16)) + 1j * rng.normal(size=(3, 16))
+        states /= np.linalg.norm(states, axis=1, keepdims=True)
+        out    = expectation_z_batch(states, 4)
+        self.assertEqual(out.shape, (3, 4))
+        for row, state in zip(out, states):
+            np.testing.assert_allclose(row, self._loop_reference(state, 4), atol=1e-12)
+
+    def test_basis_states(self):
+        states = np.eye(4)
+        np.testing.assert_array_equal(
+            expectation_z_batch(states, 2), [[1, 1], [-1, 1], [1, -1], [-1, -1]]
+        )
+
+
+class TestFuseDiagonalGates(unittest.TestCase):
+
+    def _circuit(self):
+        from qiskit import QuantumCircuit
+        from qiskit.circuit import Parameter
+        qc = QuantumCircuit(3)
+        qc.h([0, 1, 2])
+        qc.cz(0, 1)
+        qc.barrier()
+        qc.crz(0.4, 1, 2)
+        qc.rx(0.3, 0)        # touches the run: ends it
+        qc.rz(0.7, 2)
+        qc.cz(1, 2)
+        qc.ry(Parameter('a'), 0)
+        return qc
+
+    def test_matches_original_unitary(self):
+        from qiskit.quantum_info import Operator
+        qc    = self._circuit().assign_parameters([0.5])
+        fused = fuse_diagonal_gates(qc)
+        self.assertEqual(fused.count_ops()['diagonal'], 2)
+        self.assertNotIn('barrier', fused.count_ops())
+        self.assertTrue(Operator(fused).equiv(Operator(qc)))
+
+    def test_parameterised_gates_are_left_alone(self):
+        fused = fuse_diagonal_gates(self._circuit())
+        self.assertEqual(len(fused.parameters), 1)
+        self.assertEqual(fused.count_ops()['ry'], 1)
+
+    def test_gates_built_from_expressions_fuse_once_bound(self):
+        from qiskit import QuantumCircuit
+        from qiskit.circuit import Parameter
+        from qiskit.quantum_info import Operator
+        theta = Parameter('θ')
+        qc = QuantumCircuit(2)
+        qc.h([0, 1])
+        qc.crz(2 * theta, 0, 1)
+        qc.rz(theta + 0.1, 1)
+        self.assertNotIn('diagonal', fuse_diagonal_gates(qc).count_ops())
+        bound = qc.assign_parameters([0.3])
+        fused = fuse_diagonal_gates(bound)
+        self.assertEqual(fused.count_ops()['diagonal'], 1)
+        self.assertTrue(Operator(fused).equiv(Operator(bound)))
+
+
 class TestValidatePipelineConfig(unittest.TestCase):
 
     def _valid(self, **overrides):